@@ -58,6 +58,9 @@ MQTT_MESSAGE_TIMEOUT = 2
 # Number of seconds to wait after performing an API action for the results to be fully visible via IS-04
 API_PROCESSING_TIMEOUT = 1
 
+# Maximum number of IS-05 activations performed concurrently when activating many Senders or Receivers
+IS05_MAX_CONCURRENT_ACTIVATIONS = 8
+
 # Number of seconds to wait before timing out Controller test. Set to None to disable timeout mechanism
 CONTROLLER_TESTING_TIMEOUT = 120
 
@@ -71,6 +74,29 @@ MS05_INTERACTIVE_TESTING = False
 # When True, MS-05 tests exercise all blocks and every class instance rather than sampling or deduplicating by class
 MS05_EXHAUSTIVE_TESTING = False
 
+# When True, the results of discovering a Device Model are saved in CACHE_PATH and reused by later test suites and
+# test runs against the same Node, provided that the members of every block in the Device Model, the class and datatype
+# descriptors of the Class Manager and the versions in the Device Manager are unchanged
+MS05_DEVICE_MODEL_CACHE = False
+
+# Maximum number of commands packed into each IS-12 Command message when executing commands in batches
+IS12_COMMANDS_PER_MESSAGE = 20
+
+# Maximum number of IS-12 Command messages awaiting responses when executing commands in batches
+IS12_MAX_MESSAGES_IN_FLIGHT = 4
+
+# Number of objects whose user labels are changed, total number of changes, and changes per second, when measuring
+# IS-12 notification performance
+IS12_NOTIFICATION_TEST_OBJECTS = 20
+IS12_NOTIFICATION_TEST_COUNT = 500
+IS12_NOTIFICATION_TEST_RATE = 50
+
+# Maximum number of concurrent IS-14 HTTP requests when getting many property values, e.g. during Device Model discovery
+IS14_MAX_CONCURRENT_REQUESTS = 8
+
+# When True, IS-14 tests discover the Device Model using the bulkProperties endpoint, where the Node supports it
+IS14_BULK_PROPERTIES = True
+
 # Set a Query API hostname/IP and port for use when operating without DNS-SD
 QUERY_API_HOST = "127.0.0.1"
 QUERY_API_PORT = 80
@@ -84,6 +110,12 @@ CACHE_PATH = 'cache'
 # Timeout for any HTTP requests
 HTTP_TIMEOUT = 1
 
+# Number of seconds between the stack samples of every thread taken when a test suite is run with the profile option
+PROFILE_SAMPLE_INTERVAL = 0.01
+
+# Minimum number of seconds between the HTTP request progress events published on the testing tool's /progress stream
+PROGRESS_REQUEST_INTERVAL = 0.1
+
 # Restrict the maximum number of resources or test points that time-consuming tests run against.
 # 0 = unlimited (all available resources or test points) for a really thorough test!
 MAX_TEST_ITERATIONS = 0
@@ -146,7 +178,7 @@ DNS_DOMAIN = "testsuite.nmos.tv"
 PORT_BASE = 5000
 
 # As part of the Controller tests the Mock Registry will create Subscription WebSockets on subscription requests
-# This will create up to 6 WebSocket servers starting at WEBSOCKET_PORT_BASE up to WEBSOCKET_PORT_BASE + 5
+# These are all served on WEBSOCKET_PORT_BASE, or WEBSOCKET_PORT_BASE + 1 for secure WebSockets
 WEBSOCKET_PORT_BASE = 6000
 
 # Set a RANDOM_SEED to an integer value to make testing deterministic and repeatable.
@@ -188,6 +220,9 @@ SDP_PREFERENCES = {
     "bit_rate": 109000
 }
 
+# Maximum number of SDPoker processes run at a time when linting the SDP files of many Senders
+SDP_LINT_MAX_PROCESSES = 4
+
 # Test with an MQTT Broker as per AMWA IS-07
 ENABLE_MQTT_BROKER = True
 
@@ -213,6 +248,24 @@ IS11_REFERENCE_SENDER_CONNECTION_API_URL = ""
 STABLE_STATE_DELAY = 3
 STABLE_STATE_ATTEMPTS = 5
 
+# Maximum number of concurrent HTTP requests made by the load testing and benchmark suites
+LOAD_TEST_CONCURRENCY = 32
+
+# Number of Nodes simulated when load testing an IS-04 Registry
+LOAD_TEST_NODE_COUNT = 100
+
+# Number of seconds for which the simulated Nodes heartbeat when load testing an IS-04 Registry
+LOAD_TEST_DURATION = 60
+
+# Proportion of the simulated Nodes which are deleted or re-registered during each heartbeat interval
+LOAD_TEST_CHURN = 0.05
+
+# Number of requests made for each resource type by each Query API benchmark
+QUERY_BENCHMARK_REQUESTS = 200
+
+# Page size requested by the Query API paging benchmarks
+QUERY_BENCHMARK_PAGE_LIMIT = 10
+
 # Definition of each API specification and its versions.
 SPECIFICATIONS = {
     "is-04": {
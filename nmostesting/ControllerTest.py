@@ -12,7 +12,6 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import time
 import json
 import uuid
 import random
@@ -23,6 +22,7 @@ from dnslib import QTYPE
 
 from .GenericTest import GenericTest, NMOSTestException, NMOSInitException
 from . import Config as CONFIG
+from .Instrumentation import sleep
 from .TestHelper import get_default_ip, get_mocks_hostname
 from .TestResult import Test
 from .NMOSUtils import NMOSUtils
@@ -216,7 +216,7 @@ class ControllerTest(GenericTest):
                                                                     sender['id'])
             # Introduce a short delay to ensure unique version numbers.
             # Version number is used by pagination in lieu of creation or update time
-            time.sleep(0.1)
+            sleep(0.1)
             if sender["registered"]:
                 self._register_sender(test, sender)
                 # Add RTP senders to mock node (IS-05 Connection API)
@@ -244,7 +244,7 @@ class ControllerTest(GenericTest):
                     receiver['label'], receiver['description'], receiver['id'])
             # Introduce a short delay to ensure unique version numbers.
             # Version number is used by pagination in lieu of creation or update time
-            time.sleep(0.1)
+            sleep(0.1)
             if receiver["registered"]:
                 self._register_receiver(test, receiver)
                 # Add receiver to mock node
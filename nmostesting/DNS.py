@@ -14,11 +14,12 @@
 
 import socket
 
-from dnslib import DNSRecord, RCODE
+from collections import Counter
+from dnslib import DNSRecord, QTYPE, RCODE, RR
 from dnslib.server import DNSServer
 from dnslib.zoneresolver import ZoneResolver
 from jinja2 import Template
-from threading import Event
+from threading import Condition
 
 from .TestHelper import get_default_ip
 from . import Config as CONFIG
@@ -53,58 +54,74 @@ class ForwardingZoneResolver(ZoneResolver):
 class WatchingResolver(ForwardingZoneResolver):
     def __init__(self, zone, glob=False):
         ForwardingZoneResolver.__init__(self, zone, glob)
-        self.watching = {}
+        self.query_cond = Condition()
+        # (record_type, record_name) -> number of queries received since the resolver was created
+        self.query_counts = Counter()
+        # (record_type, record_name) -> query count at the point the query started to be expected
         self.expected_queries = {}
 
+    def load(self, records):
+        """Replace the records being served without interrupting the server, reusing any unchanged records"""
+        current = {str(entry[2]): entry for entry in self.zone}
+        zone = [current.get(str(rr)) or (rr.rname, QTYPE[rr.rtype], rr) for rr in records]
+        new = set(str(entry[2]) for entry in zone)
+        added = len(new.difference(current))
+        removed = len(set(current).difference(new))
+        # Swapping the list is atomic, so any in-progress lookup completes against the previous records
+        self.zone = zone
+        with self.query_cond:
+            self.expected_queries = {}
+        return added, removed
+
+    def get_query_count(self, record_type, record_name):
+        with self.query_cond:
+            return self.query_counts[(record_type, record_name)]
+
     def wait_for_query(self, record_type, record_names, timeout):
-        wait_event = Event()
-        if record_type not in self.watching:
-            self.watching[record_type] = {}
-        for record_name in record_names:
-            self.watching[record_type][record_name] = wait_event
-        wait_event.wait(timeout)
-        for record_name in record_names:
-            self.watching[record_type][record_name] = None
+        with self.query_cond:
+            baseline = {name: self.query_counts[(record_type, name)] for name in record_names}
+            return self.query_cond.wait_for(
+                lambda: any(self.query_counts[(record_type, name)] > count for name, count in baseline.items()),
+                timeout
+            )
 
     def set_expected_query(self, record_type, record_names):
-        if record_type not in self.expected_queries:
-            self.expected_queries[record_type] = {}
-        for record_name in record_names:
-            self.expected_queries[record_type][record_name] = 0
+        with self.query_cond:
+            for record_name in record_names:
+                self.expected_queries[(record_type, record_name)] = self.query_counts[(record_type, record_name)]
 
     def is_query_received(self):
-        for record_type in self.expected_queries:
-            for record_name in self.expected_queries[record_type]:
-                if self.expected_queries[record_type][record_name]:
-                    return True
-        return False
+        with self.query_cond:
+            return any(self.query_counts[key] > count for key, count in self.expected_queries.items())
 
     def resolve(self, request, handler):
         qtype = request.q.qtype
         qname = str(request.q.qname)
 
-        try:
-            self.expected_queries[qtype][qname] += 1
-        except (KeyError, AttributeError):
-            pass
+        with self.query_cond:
+            self.query_counts[(qtype, qname)] += 1
+            self.query_cond.notify_all()
 
-        try:
-            self.watching[qtype][qname].set()
-        except (KeyError, AttributeError):
-            pass
         return ForwardingZoneResolver.resolve(self, request, handler)
 
 
 class DNS(object):
     def __init__(self):
         self.default_ip = get_default_ip()
-        self.resolver = None
+        self.resolver = WatchingResolver("")
         self.server = None
         self.base_zone_data = None
+        # zone file name -> compiled Template
+        self.templates = {}
+        # zone data -> parsed records
+        self.zones = {}
         self.reset()
 
     def wait_for_query(self, record_type, record_name, timeout):
-        self.resolver.wait_for_query(record_type, record_name, timeout)
+        return self.resolver.wait_for_query(record_type, record_name, timeout)
+
+    def get_query_count(self, record_type, record_name):
+        return self.resolver.get_query_count(record_type, record_name)
 
     def set_expected_query(self, record_type, record_names):
         self.resolver.set_expected_query(record_type, record_names)
@@ -112,21 +129,27 @@ class DNS(object):
     def is_query_received(self):
         return self.resolver.is_query_received()
 
+    def _render(self, zone_name, **kwargs):
+        if zone_name not in self.templates:
+            with open(zone_name) as zone_file:
+                self.templates[zone_name] = Template(zone_file.read())
+        return self.templates[zone_name].render(**kwargs)
+
+    def _load(self, zone_data):
+        if zone_data not in self.zones:
+            self.zones[zone_data] = RR.fromZone(zone_data)
+        added, removed = self.resolver.load(self.zones[zone_data])
+        print(" * Applied DNS zone changes: {} record(s) added, {} record(s) removed".format(added, removed))
+        self.start()
+
     def load_zone(self, api_version, api_protocol, api_authorization, zone_name, port_base):
-        zone_file = open(zone_name).read()
-        template = Template(zone_file)
-        zone_data = template.render(ip_address=self.default_ip, api_ver=api_version, api_proto=api_protocol,
-                                    api_auth=str(api_authorization).lower(), domain=CONFIG.DNS_DOMAIN,
-                                    port_base=port_base)
-        self.resolver = WatchingResolver(self.base_zone_data + zone_data)
-        self.stop()
         print(" * Loading DNS zone file '{}' with api_ver={}".format(zone_name, api_version))
-        self.start()
+        zone_data = self._render(zone_name, ip_address=self.default_ip, api_ver=api_version, api_proto=api_protocol,
+                                 api_auth=str(api_authorization).lower(), domain=CONFIG.DNS_DOMAIN,
+                                 port_base=port_base)
+        self._load(self.base_zone_data + zone_data)
 
     def reset(self):
-        zone_file = open("test_data/core/dns_base.zone").read()
-        template = Template(zone_file)
-
         extra_services = {}
         if CONFIG.ENABLE_AUTH:
             auth_proto = "https" if CONFIG.ENABLE_HTTPS else "http"
@@ -144,12 +167,10 @@ class DNS(object):
                 "txt": ["api_proto=mqtt", "api_auth=false"]
             }
 
-        self.base_zone_data = template.render(ip_address=self.default_ip, domain=CONFIG.DNS_DOMAIN,
-                                              extra_services=extra_services)
-        self.resolver = WatchingResolver(self.base_zone_data)
-        self.stop()
         print(" * Loading DNS zone base file")
-        self.start()
+        self.base_zone_data = self._render("test_data/core/dns_base.zone", ip_address=self.default_ip,
+                                           domain=CONFIG.DNS_DOMAIN, extra_services=extra_services)
+        self._load(self.base_zone_data)
 
     def start(self):
         if not self.server:
@@ -159,6 +180,7 @@ class DNS(object):
                 self.server.start_thread()
             except Exception as e:
                 print(" * ERROR: Unable to bind to port 53. DNS server could not start: {}".format(e))
+                self.server = None
 
     def stop(self):
         if self.server:
@@ -24,7 +24,9 @@ import uuid
 import time
 
 from . import TestHelper
-from .NMOSUtils import NMOSUtils
+from . import Instrumentation
+from .Instrumentation import sleep
+from .NMOSUtils import NMOSUtils, NodeResourceSnapshot
 from .Specification import Specification
 from .TestResult import Test
 from . import Config as CONFIG
@@ -100,6 +102,9 @@ class GenericTest(object):
         self.auto_test_count = 0
         self.test_individual = False
         self.result = list()
+        self.result_sinks = []
+        # SuiteProfiler, if the test suite is being profiled
+        self.profiler = None
         self.protocol = "http"
         self.ws_protocol = "ws"
         if CONFIG.ENABLE_HTTPS:
@@ -171,7 +176,14 @@ class GenericTest(object):
         # Run automatically defined tests
         if test_name in ["auto", "all"] and not self.disable_auto:
             print(" * Running basic API tests")
-            self.result += self.basics()
+            self.notify_test_started("auto")
+            if self.profiler:
+                self.profiler.start_test("auto")
+            results = self.basics()
+            if self.profiler:
+                self.profiler.stop_test()
+            for result in results:
+                self.record_result(result)
 
         # Run manually defined tests
         if test_name == "all":
@@ -179,29 +191,64 @@ class GenericTest(object):
                 if method_name.startswith("test_"):
                     method = getattr(self, method_name)
                     if callable(method):
-                        NMOSUtils.RANDOM.seed(CONFIG.RANDOM_SEED ^ hash(method_name))
-                        print(" * Running " + method_name)
-                        test = Test(inspect.getdoc(method), method_name)
-                        try:
-                            self.result.append(method(test))
-                        except NMOSTestException as e:
-                            self.result.append(e.args[0])
-                        except Exception as e:
-                            self.result.append(self.uncaught_exception(method_name, e))
+                        self.run_test_method(method, method_name)
 
         # Run a single test
         if test_name != "auto" and test_name != "all":
             method = getattr(self, test_name)
             if callable(method):
-                NMOSUtils.RANDOM.seed(CONFIG.RANDOM_SEED ^ hash(test_name))
-                print(" * Running " + test_name)
-                test = Test(inspect.getdoc(method), test_name)
-                try:
-                    self.result.append(method(test))
-                except NMOSTestException as e:
-                    self.result.append(e.args[0])
-                except Exception as e:
-                    self.result.append(self.uncaught_exception(test_name, e))
+                self.run_test_method(method, test_name)
+
+    def run_test_method(self, method, method_name):
+        """Run a manually defined test and record its result"""
+        NMOSUtils.RANDOM.seed(CONFIG.RANDOM_SEED ^ hash(method_name))
+        print(" * Running " + method_name)
+        self.notify_test_started(method_name)
+        test = Test(inspect.getdoc(method), method_name)
+        self.start_instrumentation(method_name)
+        try:
+            result = method(test)
+        except NMOSTestException as e:
+            result = e.args[0]
+        except Exception as e:
+            result = self.uncaught_exception(method_name, e)
+        self.record_instrumented_result(result)
+
+    def add_result_sink(self, sink):
+        """Add a ResultSink, which also receives any results already recorded"""
+        self.result_sinks.append(sink)
+        for result in self.result:
+            sink.add(result)
+
+    def notify_test_started(self, test_name):
+        for sink in self.result_sinks:
+            sink.test_started(test_name)
+
+    def start_instrumentation(self, test_name):
+        """Begin measuring the time spent by a test in each category of activity, and profiling it if enabled"""
+        Instrumentation.start_test()
+        if self.profiler:
+            self.profiler.start_test(test_name)
+
+    def stop_instrumentation(self):
+        """Stop measuring and profiling, returning the time spent in each category of activity since
+        start_instrumentation()"""
+        if self.profiler:
+            self.profiler.stop_test()
+        return Instrumentation.stop_test()
+
+    def record_instrumented_result(self, result):
+        """Record a test result, with the time spent in each category of activity since start_instrumentation()"""
+        timings = self.stop_instrumentation()
+        if result is not None:
+            result.timings = timings
+        self.record_result(result)
+
+    def record_result(self, result):
+        """Record a test result, passing it on to each ResultSink as soon as it is produced"""
+        self.result.append(result)
+        for sink in self.result_sinks:
+            sink.add(result)
 
     def uncaught_exception(self, test_name, exception):
         """Print a traceback and provide a test FAIL result for uncaught exceptions"""
@@ -223,39 +270,51 @@ class GenericTest(object):
 
         # Set up
         test = Test("Test setup", "set_up_tests")
-        CONFIG.AUTH_TOKEN = None
-        if self.authorization:
-            # We write to config here as this needs to be available outside this class
-            scopes = []
-            for api in self.apis:
-                scopes.append(api)
-            # Add 'query' permission when mock registry is disabled and existing network registry is used
-            if not CONFIG.ENABLE_DNS_SD and "query" not in scopes:
-                scopes.append("query")
-            CONFIG.AUTH_TOKEN = self.primary_auth.generate_token(scopes, True, overrides={
-                "client_id": str(uuid.uuid4()),
-                "exp": int(time.time() + 3600)})
-        if CONFIG.PREVALIDATE_API:
-            for api in self.apis:
-                if "raml" not in self.apis[api] or self.apis[api]["url"] is None:
-                    continue
-                valid, response = self.do_request("GET", self.apis[api]["url"])
-                if not valid:
-                    raise NMOSInitException("No API found at {}".format(self.apis[api]["url"]))
-                elif response.status_code != 200:
-                    raise NMOSInitException("No API found or unexpected error at {} ({})".format(self.apis[api]["url"],
-                                                                                                 response.status_code))
-
-        self.set_up_tests()
-        self.result.append(test.NA(""))
+        self.start_instrumentation("set_up_tests")
+        try:
+            NodeResourceSnapshot.reset_all()
+            CONFIG.AUTH_TOKEN = None
+            if self.authorization:
+                # We write to config here as this needs to be available outside this class
+                scopes = []
+                for api in self.apis:
+                    scopes.append(api)
+                # Add 'query' permission when mock registry is disabled and existing network registry is used
+                if not CONFIG.ENABLE_DNS_SD and "query" not in scopes:
+                    scopes.append("query")
+                CONFIG.AUTH_TOKEN = self.primary_auth.generate_token(scopes, True, overrides={
+                    "client_id": str(uuid.uuid4()),
+                    "exp": int(time.time() + 3600)})
+            if CONFIG.PREVALIDATE_API:
+                for api in self.apis:
+                    if "raml" not in self.apis[api] or self.apis[api]["url"] is None:
+                        continue
+                    valid, response = self.do_request("GET", self.apis[api]["url"])
+                    if not valid:
+                        raise NMOSInitException("No API found at {}".format(self.apis[api]["url"]))
+                    elif response.status_code != 200:
+                        raise NMOSInitException("No API found or unexpected error at {} ({})"
+                                                .format(self.apis[api]["url"], response.status_code))
+
+            self.set_up_tests()
+        except BaseException:
+            # Don't leave the failed set up being measured
+            self.stop_instrumentation()
+            raise
+        self.record_instrumented_result(test.NA(""))
 
         # Run tests
         self.execute_tests(test_name)
 
         # Tear down
         test = Test("Test teardown", "tear_down_tests")
-        self.tear_down_tests()
-        self.result.append(test.NA(""))
+        self.start_instrumentation("tear_down_tests")
+        try:
+            self.tear_down_tests()
+        except BaseException:
+            self.stop_instrumentation()
+            raise
+        self.record_instrumented_result(test.NA(""))
 
         return self.result
 
@@ -399,7 +458,8 @@ class GenericTest(object):
         Raises an exception if the payload (or schema itself) is invalid
         """
         checker = jsonschema.FormatChecker(["ipv4", "ipv6", "uri"])
-        jsonschema.validate(payload, schema, format_checker=checker)
+        with Instrumentation.measure(Instrumentation.SCHEMA):
+            jsonschema.validate(payload, schema, format_checker=checker)
 
     def do_request(self, method, url, **kwargs):
         return TestHelper.do_request(method=method, url=url, **kwargs)
@@ -598,7 +658,7 @@ class GenericTest(object):
                 else:
                     delay = int(retry_after)
                     print(" * Waiting {}s before retrying \"GET {}\"".format(delay, url))
-                    time.sleep(delay)
+                    sleep(delay)
 
                     # do retry GET
                     valid, response = self.do_request("GET", url, headers=headers)
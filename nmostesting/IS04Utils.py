@@ -16,7 +16,7 @@ import re
 from copy import deepcopy
 from fractions import Fraction
 from . import TestHelper
-from .NMOSUtils import NMOSUtils
+from .NMOSUtils import NMOSUtils, NodeResourceSnapshot
 
 
 class IS04Utils(NMOSUtils):
@@ -26,9 +26,9 @@ class IS04Utils(NMOSUtils):
     def get_self(self):
         """Get node self resource from the Node API"""
 
-        valid_resource, resource = TestHelper.do_request("GET", self.url + "self")
-        if valid_resource and resource.status_code == 200:
-            return resource.json()
+        valid_resource, resource = NodeResourceSnapshot.for_node(self.url).get("self")
+        if valid_resource:
+            return resource
         else:
             return None
 
@@ -64,9 +64,9 @@ class IS04Utils(NMOSUtils):
             url = self.url
 
         toReturn = {}
-        valid_resources, resources = TestHelper.do_request("GET", url + resource)
-        if valid_resources and resources.status_code == 200:
-            for res in resources.json():
+        valid_resources, resources = NodeResourceSnapshot.for_node(url).get(resource)
+        if valid_resources:
+            for res in resources:
                 toReturn[res["id"]] = res
 
         return toReturn
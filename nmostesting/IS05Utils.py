@@ -15,11 +15,11 @@
 # limitations under the License.
 
 import re
-import time
 import uuid
 
 from random import randint
 from . import TestHelper
+from .Instrumentation import sleep
 from .NMOSUtils import NMOSUtils
 from . import Config as CONFIG
 
@@ -177,7 +177,7 @@ class IS05Utils(NMOSUtils):
                     return False, stagedImmediate
 
             if activateSleep > 0:
-                time.sleep(activateSleep)
+                sleep(activateSleep)
 
             # Check the values now on /active
 
@@ -239,7 +239,7 @@ class IS05Utils(NMOSUtils):
                                 return True, ""
                 else:
                     return False, active
-                time.sleep(CONFIG.API_PROCESSING_TIMEOUT)
+                sleep(CONFIG.API_PROCESSING_TIMEOUT)
             if ready:
                 return False, "Activation entries were not set at {} after {} activation{}" \
                               .format(activeUrl, activationName, " (Tries: {})".format(tries) if tries > 1 else "")
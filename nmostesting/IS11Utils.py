@@ -16,7 +16,7 @@ from . import TestHelper
 from . import Config as CONFIG
 from .IS04Utils import IS04Utils
 from .IS05Utils import IS05Utils
-from .NMOSUtils import NMOSUtils
+from .NMOSUtils import NMOSUtils, NodeResourceSnapshot
 from .GenericTest import GenericTest
 NODE_API_KEY = "node"
 CONN_API_KEY = "connection"
@@ -99,18 +99,21 @@ class IS11Utils(NMOSUtils, GenericTest):
 
     def get_flows(self, url, sender_id):
         """Get the flow for a given Sender"""
-        toReturn = None
-        valid, r = TestHelper.do_request("GET", url + "flows/" + sender_id)
-        if valid and r.status_code == 200:
-            toReturn = r.json()
-        return toReturn
+        # The Flow may have changed as a result of the test, so refresh it in the snapshot
+        valid, flow = NodeResourceSnapshot.for_node(url).refresh("flows", sender_id)
+        return flow if valid else None
 
     def get_receivers_with_or_without_outputs_id(self, receivers, format):
         self.receivers_with_or_without_outputs = []
+        snapshot = NodeResourceSnapshot.for_node(self.node_url)
+        valid, response = snapshot.get("receivers")
+        if not valid:
+            return valid, response
+
         for receiver_id in receivers:
-            valid, response = self.is04_utils.checkCleanRequestJSON("GET", "receivers/" + receiver_id)
-            if not valid:
-                return valid, response
+            response = snapshot.get_by_id("receivers", receiver_id)
+            if response is None:
+                return False, "Unable to find an IS-04 resource with ID {}".format(receiver_id)
 
             if response["format"] == format:
                 self.receivers_with_or_without_outputs.append(receiver_id)
@@ -15,12 +15,16 @@
 from .MS05Utils import MS05Utils
 
 import json
+import threading
 import time
 
+from collections import defaultdict, deque
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
 from enum import IntEnum
 from jsonschema import FormatChecker, SchemaError, validate, ValidationError
 
-from .Config import WS_MESSAGE_TIMEOUT
+from . import Instrumentation
+from .Config import IS12_COMMANDS_PER_MESSAGE, IS12_MAX_MESSAGES_IN_FLIGHT, WS_MESSAGE_TIMEOUT
 from .GenericTest import NMOSInitException, NMOSTestException
 from .TestHelper import WebsocketWorker, load_resolved_schema
 from .MS05Utils import NcBlockMethods, NcClassManagerMethods, NcEventId, NcMethodStatus, NcObjectMethods, \
@@ -57,6 +61,15 @@ class IS12Error():
         return f"[messageType={self.messageType}, status={self.status}, errorMessage={self.errorMessage}]"
 
 
+class IS12DispatchError(Exception):
+    """An invalid or error message received in response to the commands pending when it arrived"""
+    def __init__(self, message, link=None, is12_error=None):
+        Exception.__init__(self, message)
+        self.message = message
+        self.link = link
+        self.is12_error = is12_error
+
+
 class IS12Notification():
     def __init__(self, notification_json, received_time):
         self.oid = notification_json["oid"]
@@ -67,11 +80,19 @@ class IS12Notification():
 
 class IS12Utils(MS05Utils):
     def __init__(self, apis):
+        # Guards the pending commands and received notifications, which are updated by the dispatcher thread
+        self.dispatch_cond = threading.Condition()
+        # command handle (or None for a subscription) -> Future for the response
+        self.pending_commands = {}
+        self.deferred_errors = []
+        self.reset_notifications()
         MS05Utils.__init__(self, apis, CONTROL_API_KEY)
         self.apis = apis
         self.spec_path = self.apis[CONTROL_API_KEY]["spec_path"]
         self._load_is12_schemas()
+        self.format_checker = FormatChecker(["ipv4", "ipv6", "uri"])
         self.ncp_websocket = None
+        self.dispatcher_thread = None
 
     def reset(self):
         super().reset()
@@ -79,7 +100,10 @@ class IS12Utils(MS05Utils):
         self.expect_notifications = False
         self.expect_notifications_oid = 0
         self.expect_notifications_property = None
-        self.notifications = []
+        with self.dispatch_cond:
+            self.pending_commands = {}
+            self.deferred_errors = []
+        self.reset_notifications()
 
     # Overridden functions
     def _load_is12_schemas(self):
@@ -105,34 +129,24 @@ class IS12Utils(MS05Utils):
         self.ncp_websocket.start()
 
         # Give WebSocket client a chance to start and open its connection
-        start_time = time.time()
-        while time.time() < start_time + WS_MESSAGE_TIMEOUT:
-            if self.ncp_websocket.is_open():
-                break
-            time.sleep(0.2)
+        self.ncp_websocket.wait_for_open(WS_MESSAGE_TIMEOUT)
 
         if self.ncp_websocket.did_error_occur() or not self.ncp_websocket.is_open():
             raise NMOSInitException("Failed to open WebSocket successfully"
                                     + (": " + str(self.ncp_websocket.get_error_message())
                                        if self.ncp_websocket.did_error_occur() else "."))
 
+        self.dispatcher_thread = threading.Thread(target=self._dispatch_messages, args=(self.ncp_websocket,),
+                                                  daemon=True)
+        self.dispatcher_thread.start()
+
     def close_ncp_websocket(self):
         # Clean up Websocket resources
         if self.ncp_websocket:
             self.ncp_websocket.close()
-
-    def _validate_is12_schema(self, test, payload, schema_name, context=""):
-        """Delegates to validate_schema. Raises NMOSTestExceptions on error"""
-        try:
-            # Validate the JSON schema is correct
-            checker = FormatChecker(["ipv4", "ipv6", "uri"])
-            validate(payload, self.schemas[schema_name], format_checker=checker)
-        except ValidationError as e:
-            raise NMOSTestException(test.FAIL(context + "Schema validation error: " + e.message))
-        except SchemaError as e:
-            raise NMOSTestException(test.FAIL(context + "Schema error: " + e.message))
-
-        return
+        if self.dispatcher_thread:
+            self.dispatcher_thread.join()
+            self.dispatcher_thread = None
 
     def message_type_to_schema_name(self, type):
         """Convert MessageType to corresponding JSON schema name"""
@@ -155,117 +169,176 @@ class IS12Utils(MS05Utils):
         # or a derived datatype.
         # https://specs.amwa.tv/ms-05-02/branches/v1.0/docs/Framework.html#ncmethodresult
 
-        # Assume single command
-        command_handle = command_json["commands"][0]["handle"] if command_json.get("commands") else 0
+        # Assume single command, but wait for every response so that no command is left pending
+        futures = self._send_message(test, command_json)
+        # have enough time for command and notifications
+        deadline = time.time() + 2 * WS_MESSAGE_TIMEOUT
+        result = self._wait_for_responses(test, command_json, futures, deadline)[0]
+
+        if self.expect_notifications:
+            key = (self.expect_notifications_oid, self.expect_notifications_property)
+            with Instrumentation.measure(Instrumentation.WEBSOCKET), self.dispatch_cond:
+                if not self.dispatch_cond.wait_for(lambda: key in self.notification_index,
+                                                   max(0, deadline - time.time())):
+                    raise NMOSTestException(test.FAIL("expected notifications not received in time"))
+
+        return result
+
+    def send_commands(self, test, command_json):
+        """Send a Command message containing any number of commands to Node under test.
+        Returns [command response] for each command, in order. Raises NMOSTestException on error"""
+        futures = self._send_message(test, command_json)
+        return self._wait_for_responses(test, command_json, futures, time.time() + 2 * WS_MESSAGE_TIMEOUT)
+
+    def _send_message(self, test, command_json):
+        """Send a message to Node under test, returning a Future for the response to each command it contains"""
+        if command_json.get("commands"):
+            handles = [command.get("handle") for command in command_json["commands"]]
+        else:
+            # subscription responses have no handle
+            handles = [None if command_json.get("messageType") == MessageTypes.Subscription else 0]
+
+        futures = [(handle, Future()) for handle in handles]
+        with self.dispatch_cond:
+            if self.deferred_errors:
+                # Report errors in messages which arrived while no command was outstanding
+                error = self.deferred_errors.pop(0)
+                self._raise_dispatch_error(test, error, command_json)
+            self.pending_commands.update(futures)
 
         self.ncp_websocket.send(json.dumps(command_json))
+        return futures
 
-        results = []
-        start_time = time.time()
-        while time.time() < start_time + 2 * WS_MESSAGE_TIMEOUT:  # have enough time for command and notifications
-            if not self.ncp_websocket.is_messages_received():
-                time.sleep(0.2)
-                continue
-
-            # find the response to our request
-            for tm in self.ncp_websocket.get_timestamped_messages():
-                parsed_message = json.loads(tm.message)
-
-                if parsed_message is None:
-                    raise NMOSTestException(test.FAIL(
-                        f"Null message received for command: {str(command_json)}",
-                        f"https://specs.amwa.tv/is-12/branches/{self.apis[CONTROL_API_KEY]['spec_branch']}"
-                        "/docs/Protocol_messaging.html#command-message-type"))
-
-                if self.message_type_to_schema_name(parsed_message.get("messageType")):
-                    self._validate_is12_schema(
-                        test,
-                        parsed_message,
-                        self.message_type_to_schema_name(parsed_message["messageType"]),
-                        context=self.message_type_to_schema_name(parsed_message["messageType"]) + ": ")
-                else:
-                    raise NMOSTestException(test.FAIL(
-                        f"Unrecognised message type: {parsed_message.get('messageType')}",
-                        f"https://specs.amwa.tv/is-12/branches/{self.apis[CONTROL_API_KEY]['spec_branch']}"
-                        "/docs/Protocol_messaging.html#command-message-type"))
-
-                if parsed_message["messageType"] == MessageTypes.CommandResponse:
-                    responses = [IS12CommandResponse(r) for r in parsed_message["responses"]]
-                    for response in responses:
-                        if response.handle == command_handle:
-                            results.append(response)
-                if parsed_message["messageType"] == MessageTypes.SubscriptionResponse:
-                    results.append(parsed_message["subscriptions"])
-                if parsed_message["messageType"] == MessageTypes.Notification:
-                    self.notifications += [IS12Notification(n, tm.received_time)
-                                           for n in parsed_message["notifications"]]
-                if parsed_message["messageType"] == MessageTypes.Error:
-                    raise NMOSTestException(test.FAIL(  # Append the IS12Error so it can be used in negative tests
-                        f"IS-I2 Error: {str(parsed_message)} for command: {str(command_json)}",
-                        f"https://specs.amwa.tv/is-12/branches/{self.apis[CONTROL_API_KEY]['spec_branch']}"
-                        "/docs/Protocol_messaging.html#error-messages"), IS12Error(parsed_message))
-
-            if not self.expect_notifications and len(results) != 0:
-                break
-            if self.expect_notifications and len(results) != 0 and len(self.notifications) != 0:
-                found_oid = False
-                for notification in self.notifications:
-                    if notification.oid == self.expect_notifications_oid and \
-                            notification.eventData.propertyId == self.expect_notifications_property:
-                        found_oid = True
-                        break
-
-                if found_oid:
-                    break
-
-        if len(results) == 0:
+    def _wait_for_responses(self, test, command_json, futures, deadline):
+        try:
+            # The dispatcher thread receives messages for as long as the WebSocket is open, so only the time spent
+            # waiting for responses here is attributed to the test
+            with Instrumentation.measure(Instrumentation.WEBSOCKET):
+                return [future.result(timeout=max(0, deadline - time.time())) for _, future in futures]
+        except FutureTimeoutError:
             raise NMOSTestException(test.FAIL(
                 "No Message Response received.",
                 f"https://specs.amwa.tv/is-12/branches/{self.apis[CONTROL_API_KEY]['spec_branch']}"
                 "/docs/Protocol_messaging.html#command-message-type"))
+        except IS12DispatchError as e:
+            self._raise_dispatch_error(test, e, command_json)
+        finally:
+            with self.dispatch_cond:
+                for handle, future in futures:
+                    if self.pending_commands.get(handle) is future:
+                        del self.pending_commands[handle]
+
+    def _raise_dispatch_error(self, test, error, command_json):
+        if error.is12_error is not None:
+            raise NMOSTestException(test.FAIL(  # Append the IS12Error so it can be used in negative tests
+                f"IS-I2 Error: {error.message} for command: {str(command_json)}", error.link), error.is12_error)
+        raise NMOSTestException(test.FAIL(error.message, error.link))
+
+    def _dispatch_messages(self, websocket):
+        """Parse and validate each incoming message once, resolving the pending command to which it responds, or
+        recording notifications"""
+        while websocket.is_open() or websocket.is_messages_received():
+            tm = websocket.get_timestamped_message(timeout=0.5)
+            if tm is None:
+                continue
+            try:
+                self._dispatch_message(tm)
+            except IS12DispatchError as e:
+                with self.dispatch_cond:
+                    if self.pending_commands:
+                        for future in self.pending_commands.values():
+                            if not future.done():
+                                future.set_exception(e)
+                    else:
+                        self.deferred_errors.append(e)
+
+    def _dispatch_message(self, tm):
+        protocol_messaging_url = \
+            f"https://specs.amwa.tv/is-12/branches/{self.apis[CONTROL_API_KEY]['spec_branch']}" \
+            "/docs/Protocol_messaging.html"
+        try:
+            parsed_message = json.loads(tm.message)
+        except json.JSONDecodeError as e:
+            raise IS12DispatchError(f"Invalid JSON message received: {str(e)}",
+                                    protocol_messaging_url + "#command-message-type")
 
-        if len(results) > 1:
-            raise NMOSTestException(test.FAIL(f"Received multiple responses : {len(responses)}"))
-
-        if self.expect_notifications and len(self.notifications) == 0:
-            raise NMOSTestException(test.FAIL("expected notifications not received in time"))
+        if parsed_message is None:
+            raise IS12DispatchError("Null message received", protocol_messaging_url + "#command-message-type")
 
-        return results[0]
+        schema_name = self.message_type_to_schema_name(parsed_message.get("messageType"))
+        if not schema_name:
+            raise IS12DispatchError(f"Unrecognised message type: {parsed_message.get('messageType')}",
+                                    protocol_messaging_url + "#command-message-type")
+        try:
+            validate(parsed_message, self.schemas[schema_name], format_checker=self.format_checker)
+        except ValidationError as e:
+            raise IS12DispatchError(f"{schema_name}: Schema validation error: {e.message}")
+        except SchemaError as e:
+            raise IS12DispatchError(f"{schema_name}: Schema error: {e.message}")
+
+        with self.dispatch_cond:
+            if parsed_message["messageType"] == MessageTypes.CommandResponse:
+                for response in parsed_message["responses"]:
+                    future = self.pending_commands.get(response["handle"])
+                    if future and not future.done():
+                        future.set_result(IS12CommandResponse(response))
+            elif parsed_message["messageType"] == MessageTypes.SubscriptionResponse:
+                future = self.pending_commands.get(None)
+                if future and not future.done():
+                    future.set_result(parsed_message["subscriptions"])
+            elif parsed_message["messageType"] == MessageTypes.Notification:
+                for n in parsed_message["notifications"]:
+                    notification = IS12Notification(n, tm.received_time)
+                    self.notifications.append(notification)
+                    self.notification_index[(notification.oid, notification.eventData.propertyId)] \
+                        .append(notification)
+                self.dispatch_cond.notify_all()
+            elif parsed_message["messageType"] == MessageTypes.Error:
+                raise IS12DispatchError(str(parsed_message), protocol_messaging_url + "#error-messages",
+                                        IS12Error(parsed_message))
 
     def get_notifications(self):
-        # Get any timestamped messages that have arrived in the interim period
-        for tm in self.ncp_websocket.get_timestamped_messages():
-            parsed_message = json.loads(tm.message)
-            if parsed_message and parsed_message["messageType"] == MessageTypes.Notification:
-                self.notifications += [IS12Notification(n, tm.received_time)
-                                       for n in parsed_message["notifications"]]
-        return self.notifications
+        with self.dispatch_cond:
+            return list(self.notifications)
+
+    def get_property_notifications(self, oid, property_id):
+        """Get the notifications received for the given object and property"""
+        with self.dispatch_cond:
+            return list(self.notification_index.get((oid, property_id), []))
 
     def reset_notifications(self):
-        self.notifications = []
+        with self.dispatch_cond:
+            self.notifications = []
+            self.notification_index = defaultdict(list)
 
     def start_logging_notifications(self, oid, property):
         self.expect_notifications = True
         self.expect_notifications_oid = oid
         self.expect_notifications_property = property
-        self.notifications = []
+        self.reset_notifications()
 
     def stop_logging_notifications(self):
         self.expect_notifications = False
 
     def create_command_JSON(self, oid, method_id, arguments):
         """for sending over websocket"""
-        self.command_handle += 1
+        return self.create_commands_JSON([(oid, method_id, arguments)])
+
+    def create_commands_JSON(self, commands):
+        """for sending a list of (oid, method_id, arguments) commands over websocket in a single message"""
+        command_list = []
+        for oid, method_id, arguments in commands:
+            # Handles must be in the range 1 to 65535
+            self.command_handle = self.command_handle % 65535 + 1
+            command_list.append({
+                "handle": self.command_handle,
+                "oid": oid,
+                "methodId": method_id.__dict__,
+                "arguments": arguments
+            })
         return {
             "messageType": MessageTypes.Command,
-            "commands": [
-                {
-                    "handle": self.command_handle,
-                    "oid": oid,
-                    "methodId": method_id.__dict__,
-                    "arguments": arguments
-                }
-            ],
+            "commands": command_list,
         }
 
     def execute_command(self, test, oid, method_id, arguments):
@@ -273,6 +346,39 @@ class IS12Utils(MS05Utils):
         response = self.send_command(test, command_JSON)
         return response.result
 
+    def execute_commands(self, test, commands):
+        """Execute a list of (oid, method_id, arguments) commands, packing up to IS12_COMMANDS_PER_MESSAGE commands
+        into each message and keeping up to IS12_MAX_MESSAGES_IN_FLIGHT messages awaiting responses.
+        Returns the raw result of each command, in order. Raises NMOSTestException on error"""
+        results = []
+        in_flight = deque()
+        for index in range(0, len(commands), IS12_COMMANDS_PER_MESSAGE):
+            if len(in_flight) >= IS12_MAX_MESSAGES_IN_FLIGHT:
+                results += self.wait_for_command_responses(test, in_flight.popleft())
+            in_flight.append(self.send_commands_nowait(test, commands[index:index + IS12_COMMANDS_PER_MESSAGE]))
+        while in_flight:
+            results += self.wait_for_command_responses(test, in_flight.popleft())
+        return results
+
+    def send_commands_nowait(self, test, commands):
+        """Send a Command message containing a list of (oid, method_id, arguments) commands without waiting for the
+        responses. Returns the pending message, to pass to wait_for_command_responses"""
+        command_JSON = self.create_commands_JSON(commands)
+        futures = self._send_message(test, command_JSON)
+        return command_JSON, futures, time.time() + 2 * WS_MESSAGE_TIMEOUT
+
+    def wait_for_command_responses(self, test, pending_message):
+        """Wait for the responses to a message sent by send_commands_nowait.
+        Returns the raw result of each command, in order. Raises NMOSTestException on error"""
+        return [response.result for response in self._wait_for_responses(test, *pending_message)]
+
+    def get_property_values_override(self, test, property_requests):
+        """Get several property values, from one or more objects, in as few messages as possible.
+        Raises NMOSTestException on error"""
+        return self.execute_commands(test, [(kwargs["oid"], NcObjectMethods.GENERIC_GET.value,
+                                             {"id": property_id.__dict__})
+                                            for property_id, kwargs in property_requests])
+
     def get_property_override(self, test, property_id, oid, **kwargs):
         """Get property vlaue from object. Raises NMOSTestException on error"""
         return self.execute_command(test, oid,
@@ -13,8 +13,11 @@
 # limitations under the License.
 
 import os
+
+from . import Config as CONFIG
 from .GenericTest import NMOSTestException
-from .MS05Utils import MS05Utils, NcBlockMethods, NcClassManagerMethods, NcObjectMethods
+from .MS05Utils import MS05Utils, NcBlockMethods, NcClassManagerMethods, NcMethodStatus, NcObjectMethods
+from .PerformanceUtils import HTTPClientPool
 from .TestResult import Test
 
 from . import TestHelper
@@ -28,9 +31,22 @@ class IS14Utils(MS05Utils):
     def __init__(self, apis):
         MS05Utils.__init__(self, apis, CONFIGURATION_API_KEY)
         self.configuration_url = apis[CONFIGURATION_API_KEY]["url"]
+        # Keep-alive connections shared by concurrent requests when getting many property values
+        self.http_pool = None
 
     def reset(self):
         super().reset()
+        self.close()
+        self.http_pool = HTTPClientPool(CONFIG.IS14_MAX_CONCURRENT_REQUESTS)
+        self.bulk_properties_supported = CONFIG.IS14_BULK_PROPERTIES
+        # Property values of every object in a block's hierarchy, while that block is being created
+        self.prefetched_bulk_properties = None
+
+    def close(self):
+        """Release the connections and threads of the pooled HTTP client"""
+        if self.http_pool:
+            self.http_pool.close()
+            self.http_pool = None
 
     def load_reference_resources(self):
         """Override to load specification specific feature sets"""
@@ -98,7 +114,9 @@ class IS14Utils(MS05Utils):
 
     def _do_request(self, test, method, url, **kwargs):
         valid, r = TestHelper.do_request(method, url, **kwargs)
+        return self._check_method_result_response(test, method, url, valid, r, **kwargs)
 
+    def _check_method_result_response(self, test, method, url, valid, r, **kwargs):
         if not valid:
             raise NMOSTestException(test.FAIL(f"{r} for {method}: {url}, json={kwargs}"))
         try:
@@ -115,12 +133,72 @@ class IS14Utils(MS05Utils):
 
         return r.json()
 
+    def _get_bulk_properties(self, test, role_path, recurse):
+        """Get the property values of the object at role_path, and of every object below it if recurse is set, from
+        the bulkProperties endpoint. Returns {role path: {(level, index): value}}, or None if unsuccessful"""
+        url = f"{self._create_role_path_base(role_path)}/bulkProperties" \
+            f"?recurse={'true' if recurse else 'false'}&includeDescriptors=false"
+        valid, r, _ = self.http_pool.request("GET", url)
+        if not valid or r.status_code != 200:
+            return None
+        try:
+            method_result = r.json()
+            self.reference_datatype_schema_validate(test, method_result, "NcMethodResult")
+            self.reference_datatype_schema_validate(test, method_result.get("value"), "NcBulkPropertiesHolder")
+        except (ValueError, NMOSTestException):
+            # The bulkProperties endpoint is tested by the IS-14 test suite, so just fall back to getting properties
+            return None
+
+        return {tuple(object_properties["path"]): {(p["id"]["level"], p["id"]["index"]): p["value"]
+                                                   for p in object_properties["values"]}
+                for object_properties in method_result["value"]["values"]}
+
+    def _get_property_pooled(self, test, property_id, role_path):
+        """Get value of property from object using the pooled HTTP client. Raises NMOSTestException on error"""
+        property_value_endpoint = self._create_property_value_endpoint(role_path, property_id)
+        valid, r, _ = self.http_pool.request("GET", property_value_endpoint)
+        return self._check_method_result_response(test, "GET", property_value_endpoint, valid, r)
+
+    def create_block(self, test, class_id, oid, role, base_role_path=None, member_descriptor=None, owner=None,
+                     property_values=None):
+        """Override to get the property values of every object in the block's hierarchy in one request.
+        Bulk retrieval is only used to discover the Device Model, so that checks of the properties of each object
+        still exercise the per-property endpoints"""
+        if property_values is None and self.bulk_properties_supported:
+            self.prefetched_bulk_properties = self._get_bulk_properties(
+                test, self.create_role_path(base_role_path, role), recurse=True)
+            if self.prefetched_bulk_properties is None:
+                self.bulk_properties_supported = False
+        try:
+            return super().create_block(test, class_id, oid, role, base_role_path, member_descriptor, owner,
+                                        property_values)
+        finally:
+            self.prefetched_bulk_properties = None
+
     # Overridden functions
     def get_property_override(self, test, property_id, role_path, **kwargs):
         """Get value of property from object. Raises NMOSTestException on error"""
         property_value_endpoint = self._create_property_value_endpoint(role_path, property_id)
         return self._do_request(test, "GET", property_value_endpoint)
 
+    def get_property_values_override(self, test, property_requests):
+        """Get values of (property_id, kwargs) property requests. While the Device Model is being discovered, values
+        are taken from the bulkProperties of the block being created where supported, otherwise concurrent HTTP
+        requests are made to the endpoint of each property. Raises NMOSTestException on error"""
+        bulk_properties = self.prefetched_bulk_properties or {}
+
+        results = []
+        for property_id, kwargs in property_requests:
+            object_bulk_properties = bulk_properties.get(tuple(kwargs["role_path"]), {})
+            key = (property_id.level, property_id.index)
+            if key in object_bulk_properties:
+                results.append({"status": NcMethodStatus.OK.value, "value": object_bulk_properties[key]})
+            else:
+                results.append(self.http_pool.executor.submit(self._get_property_pooled, test, property_id,
+                                                              kwargs["role_path"]))
+
+        return [result if isinstance(result, dict) else result.result() for result in results]
+
     def set_property_override(self, test, property_id, argument, role_path, **kwargs):
         """Get value of property from object. Raises NMOSTestException on error"""
         property_value_endpoint = self._create_property_value_endpoint(role_path, property_id)
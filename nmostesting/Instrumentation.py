@@ -0,0 +1,150 @@
+# Copyright (C) 2026 Advanced Media Workflow Association
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import contextlib
+import threading
+import time
+
+# Categories of activity which a test's time is attributed to
+HTTP = "http"
+WEBSOCKET = "websocket"
+MQTT = "mqtt"
+SLEEP = "sleep"
+SCHEMA = "schema"
+SUBPROCESS = "subprocess"
+MOCK_SERVER = "mock_server"
+CATEGORIES = [HTTP, WEBSOCKET, MQTT, SLEEP, SCHEMA, SUBPROCESS, MOCK_SERVER]
+
+
+class Timing(object):
+    """Count, total and maximum of a number of durations"""
+    def __init__(self):
+        self.count = 0
+        self.total = 0
+        self.max = 0
+
+    def add(self, duration):
+        self.count += 1
+        self.total += duration
+        self.max = max(self.max, duration)
+
+    def summary(self):
+        return {"count": self.count, "total": self.total, "max": self.max}
+
+
+class TestInstrumentation(object):
+    """
+    Attributes the time spent by a test to categories of activity, such as HTTP requests or sleeps, and within a
+    category, optionally to keys such as the host which requests were made to.
+    Activity on other threads, such as requests made concurrently or handled by the mock servers, is included, so
+    the totals of a category may add up to more than the test's elapsed time.
+    """
+    def __init__(self):
+        self.lock = threading.Lock()
+        # category -> Timing
+        self.timings = {}
+        # category -> key -> Timing
+        self.keyed_timings = {}
+
+    def record(self, category, duration, key=None):
+        with self.lock:
+            self.timings.setdefault(category, Timing()).add(duration)
+            if key is not None:
+                self.keyed_timings.setdefault(category, {}).setdefault(key, Timing()).add(duration)
+
+    def summary(self):
+        """Returns a dict of category -> {"count", "total", "max"}, with a dict of key -> the same for keyed
+        categories"""
+        with self.lock:
+            summary = {}
+            for category in CATEGORIES:
+                if category not in self.timings:
+                    continue
+                summary[category] = self.timings[category].summary()
+                if category in self.keyed_timings:
+                    summary[category]["keys"] = {key: timing.summary()
+                                                 for key, timing in self.keyed_timings[category].items()}
+            return summary
+
+
+# The instrumentation of the test which is currently running, since only one test runs at a time
+_current = None
+
+
+def start_test():
+    """Begin attributing activity to a new test"""
+    global _current
+    _current = TestInstrumentation()
+    return _current
+
+
+def stop_test():
+    """Stop attributing activity to the current test, returning the summary of its activity"""
+    global _current
+    instrumentation, _current = _current, None
+    return instrumentation.summary() if instrumentation else {}
+
+
+def record(category, duration, key=None):
+    """Attribute a duration to the current test, if any"""
+    instrumentation = _current
+    if instrumentation:
+        instrumentation.record(category, duration, key)
+
+
+@contextlib.contextmanager
+def measure(category, key=None):
+    """Attribute the time taken by the body of the with statement to the current test"""
+    start_time = time.time()
+    try:
+        yield
+    finally:
+        record(category, time.time() - start_time, key)
+
+
+def sleep(seconds, category=SLEEP):
+    """Sleep, attributing the time to the current test. Sleeps while polling for WebSocket or MQTT messages should
+    specify that category"""
+    with measure(category):
+        time.sleep(seconds)
+
+
+def merge_summaries(summaries):
+    """Combine the summaries of a number of tests"""
+    merged = {}
+    for summary in summaries:
+        for category, timing in summary.items():
+            for key, key_timing in [(None, timing)] + list(timing.get("keys", {}).items()):
+                totals = merged.setdefault(category, {"count": 0, "total": 0, "max": 0})
+                if key is not None:
+                    totals = totals.setdefault("keys", {}).setdefault(key, {"count": 0, "total": 0, "max": 0})
+                totals["count"] += key_timing["count"]
+                totals["total"] += key_timing["total"]
+                totals["max"] = max(totals["max"], key_timing["max"])
+    return merged
+
+
+def format_summary(summary):
+    """Format a summary as the lines of a table, with the keys of each category in order of total time"""
+    lines = ["{:<32} {:>8} {:>10} {:>10}".format("Activity", "Count", "Total", "Max")]
+    for category in CATEGORIES:
+        if category not in summary:
+            continue
+        rows = [(category, summary[category])]
+        rows += [("  " + key, timing) for key, timing in sorted(summary[category].get("keys", {}).items(),
+                                                                key=lambda item: item[1]["total"], reverse=True)]
+        for name, timing in rows:
+            lines.append("{:<32} {:>8} {:>9.3f}s {:>9.3f}s".format(
+                name[:32], timing["count"], timing["total"], timing["max"]))
+    return lines
@@ -14,18 +14,21 @@
 
 from .NMOSUtils import NMOSUtils
 
+import hashlib
 import json
 import os
 
 from copy import deepcopy
 from enum import IntEnum, Enum
 from itertools import takewhile, dropwhile
-from jsonschema import FormatChecker, SchemaError, validate, ValidationError
+from jsonschema import FormatChecker, SchemaError, ValidationError
+from jsonschema.exceptions import best_match
+from jsonschema.validators import validator_for
 from typing import List, Optional, Union
 
+from . import Config as CONFIG
 from .GenericTest import NMOSTestException, GenericTest
 from .TestResult import Test
-from .TestHelper import load_resolved_schema
 
 MS05_API_KEY = "controlframework"
 FEATURE_SETS_KEY = "featuresets"
@@ -169,6 +172,7 @@ class NcClassManagerProperties(Enum):
 
 class NcDeviceManagerProperties(Enum):
     NCVERSION = NcPropertyId({"level": 3, "index": 1})
+    PRODUCT = NcPropertyId({"level": 3, "index": 3})
 
 
 class NcWorkerProperties(Enum):
@@ -529,12 +533,35 @@ class NcBlock(NcObject):
                  member_descriptor: NcBlockMemberDescriptor):
         NcObject.__init__(self, class_id, oid, owner, role, role_path, runtime_constraints, member_descriptor)
         self.child_objects = []
+        # NcBlockIndex of the hierarchy below this block, when built
+        self.index = None
+        # Block which this block was added to, so that its index can be discarded too
+        self.parent_block = None
 
     # Utility Methods
     def add_child_object(self, nc_object):
         self.child_objects.append(nc_object)
+        if type(nc_object) is NcBlock:
+            nc_object.parent_block = self
+        # The indexes of this block and of each of its ancestors include the hierarchy below this block
+        block = self
+        while block:
+            block.index = None
+            block = block.parent_block
+
+    def build_indexes(self):
+        """Index the hierarchy below this block and each of its descendant blocks, so that recursive queries
+        don't have to search the hierarchy. Adding a child object to a block discards the indexes of that block
+        and its ancestors"""
+        self.index = NcBlockIndex(self)
+        for child_object in self.child_objects:
+            if type(child_object) is NcBlock:
+                child_object.build_indexes()
 
     def get_role_paths(self) -> List[List[str]]:
+        if self.index:
+            return [list(role_path) for role_path in self.index.role_paths]
+
         role_paths = []
         for child_object in self.child_objects:
             role_paths.append([child_object.role])
@@ -547,6 +574,9 @@ class NcBlock(NcObject):
         return role_paths
 
     def get_oids(self, root=True) -> List[int]:
+        if self.index:
+            return ([self.oid] if root else []) + [o.oid for o in self.index.objects]
+
         oids = [self.oid] if root else []
         for child_object in self.child_objects:
             oids.append(child_object.oid)
@@ -560,6 +590,9 @@ class NcBlock(NcObject):
         if role_path == self.role_path:
             return self
 
+        if self.index and isinstance(role_path, list):
+            return self.index.blocks_by_role_path.get(tuple(role_path))
+
         ret_val = None
         for child_object in self.child_objects:
             if isinstance(child_object, NcBlock):
@@ -568,6 +601,24 @@ class NcBlock(NcObject):
                     break
         return ret_val
 
+    def find_object_by_oid(self, oid) -> NcObject:
+        """Helper function to locate an NcObject by oid"""
+        # Returns None if oid can't be found
+        if oid == self.oid:
+            return self
+
+        if self.index:
+            return self.index.objects_by_oid.get(oid)
+
+        for child_object in self.child_objects:
+            if child_object.oid == oid:
+                return child_object
+            if isinstance(child_object, NcBlock):
+                ret_val = child_object.find_object_by_oid(oid)
+                if ret_val:
+                    return ret_val
+        return None
+
     # NcBlock Methods
     def get_member_descriptors(self, recurse=False) -> List[NcBlockMemberDescriptor]:
         query_results = []
@@ -598,6 +649,17 @@ class NcBlock(NcObject):
                 return query_role == role if match_whole_string else query_role in role
             return query_role.lower() == role.lower() if match_whole_string else query_role.lower() in role.lower()
 
+        if recurse and self.index:
+            # Roles are indexed case-insensitively, so find the candidates and then match each of them
+            query_role = role.lower()
+            if match_whole_string:
+                positions = self.index.positions_by_role.get(query_role, [])
+            else:
+                positions = sorted(position for indexed_role, positions in self.index.positions_by_role.items()
+                                   if query_role in indexed_role for position in positions)
+            return [self.index.objects[position].member_descriptor for position in positions
+                    if match(role, self.index.objects[position].role, case_sensitive, match_whole_string)]
+
         query_results = []
         for child_object in self.child_objects:
             if match(role, child_object.role, case_sensitive, match_whole_string):
@@ -619,6 +681,13 @@ class NcBlock(NcObject):
                 return True
             return False
 
+        if recurse and self.index:
+            objects = [self.index.objects[position]
+                       for position in self.index.positions_by_class_id.get(tuple(class_id), [])
+                       if include_derived or self.index.objects[position].class_id == class_id]
+            # if get_objects is set returns NcObject rather than NcBlockMemberDescriptor
+            return objects if get_objects else [o.member_descriptor for o in objects]
+
         query_results = []
         for child_object in self.child_objects:
             if match(class_id, child_object.class_id, include_derived):
@@ -632,6 +701,37 @@ class NcBlock(NcObject):
         return query_results
 
 
+class NcBlockIndex():
+    """Indexes of the objects in the hierarchy below a block, in the order a depth-first search would find them"""
+    def __init__(self, block: NcBlock):
+        self.objects = []
+        # Role paths relative to the block
+        self.role_paths = []
+        # Role path -> block
+        self.blocks_by_role_path = {}
+        # Oid -> object
+        self.objects_by_oid = {}
+        # Every prefix of the class id of each object -> positions in self.objects, to match derived classes
+        self.positions_by_class_id = {}
+        # Lower case role -> positions in self.objects
+        self.positions_by_role = {}
+        self._add_child_objects(block, [])
+
+    def _add_child_objects(self, block, base_role_path):
+        for child_object in block.child_objects:
+            position = len(self.objects)
+            role_path = base_role_path + [child_object.role]
+            self.objects.append(child_object)
+            self.role_paths.append(role_path)
+            self.objects_by_oid.setdefault(child_object.oid, child_object)
+            for length in range(len(child_object.class_id) + 1):
+                self.positions_by_class_id.setdefault(tuple(child_object.class_id[:length]), []).append(position)
+            self.positions_by_role.setdefault(child_object.role.lower(), []).append(position)
+            if type(child_object) is NcBlock:
+                self.blocks_by_role_path.setdefault(tuple(child_object.role_path), child_object)
+                self._add_child_objects(child_object, role_path)
+
+
 class NcManager(NcObject):
     def __init__(self, class_id: List[int], oid: int, owner: Optional[int], role: List[str], role_path: str,
                  runtime_constraints: Optional[NcPropertyConstraints],
@@ -707,6 +807,81 @@ class MS05MethodMetadata():
         self.class_id = class_id
 
 
+class DatatypeSchemaRegistry():
+    """JSON schemas for datatypes, generated from datatype descriptors when first used.
+    Referenced datatypes are included in each schema's definitions, so that datatypes may refer to each other,
+    and each schema and validator is created only once"""
+    def __init__(self, datatype_descriptors, descriptor_to_schema):
+        self.datatype_descriptors = datatype_descriptors
+        self.descriptor_to_schema = descriptor_to_schema
+        # name -> (schema with references to definitions, names of the datatypes it references)
+        self.local_schemas = {}
+        self.schemas = {}
+        self.validators = {}
+
+    def __bool__(self):
+        return bool(self.datatype_descriptors)
+
+    def get(self, name):
+        """Schema for datatype, with every datatype it references in its definitions, or None if the datatype is
+        unknown. Raises SchemaError if the schema references an unknown datatype"""
+        if name not in self.schemas:
+            local_schema = self._get_local(name)
+            if local_schema is None:
+                return None
+            definitions = {}
+            pending = [name]
+            while pending:
+                referenced_name = pending.pop()
+                if referenced_name in definitions:
+                    continue
+                referenced_schema = self._get_local(referenced_name)
+                if referenced_schema is None:
+                    raise SchemaError(f"Unable to resolve reference to datatype {referenced_name}")
+                schema, references = referenced_schema
+                definitions[referenced_name] = {key: value for key, value in schema.items() if key != "$schema"}
+                pending += references
+            self.schemas[name] = dict(local_schema[0], definitions=definitions)
+        return self.schemas[name]
+
+    def get_validator(self, name):
+        """Validator for datatype, or None if the datatype is unknown. Raises SchemaError on an invalid schema"""
+        if name not in self.validators:
+            schema = self.get(name)
+            if schema is None:
+                return None
+            validator_class = validator_for(schema)
+            validator_class.check_schema(schema)
+            self.validators[name] = validator_class(schema, format_checker=FormatChecker(["ipv4", "ipv6", "uri"]))
+        return self.validators[name]
+
+    def _get_local(self, name):
+        """Schema for datatype with its references to other datatypes not yet resolved, and the names of those
+        datatypes, or None if the datatype is unknown"""
+        if name not in self.local_schemas:
+            descriptor = self.datatype_descriptors.get(name)
+            if descriptor is None:
+                return None
+            references = set()
+            schema = self._replace_refs(self.descriptor_to_schema(descriptor), references)
+            self.local_schemas[name] = (schema, sorted(references))
+        return self.local_schemas[name]
+
+    def _replace_refs(self, schema, references):
+        """Replace each {"$ref": "<datatype name>.json"} with a reference to the definition of that datatype,
+        adding the datatype name to references"""
+        if isinstance(schema, list):
+            return [self._replace_refs(s, references) for s in schema]
+        if not isinstance(schema, dict):
+            return schema
+        if "$ref" in schema:
+            # As in draft-07, any keywords alongside $ref are ignored
+            name, _ = os.path.splitext(schema["$ref"])
+            references.add(name)
+            return {"$ref": f"#/definitions/{name}"}
+        return {key: self._replace_refs(value, references) for key, value in schema.items()}
+
+
 class MS05Utils(NMOSUtils):
     def __init__(self, apis, protocol_api_key):
         NMOSUtils.__init__(self, apis[NODE_API_KEY]["url"])
@@ -717,6 +892,8 @@ class MS05Utils(NMOSUtils):
     def reset(self):
         self.device_model = None
         self.class_manager = None
+        # Raw results of the property gets made to discover the Device Model, keyed by role path and property id
+        self.device_model_property_values = {}
         self.datatype_schemas = None
         self.load_reference_resources()
 
@@ -777,6 +954,10 @@ class MS05Utils(NMOSUtils):
         """Query Class Manager for NcDatatypeDescriptor. Raises NMOSTestException on error"""
         pass
 
+    def get_property_values_override(self, test, property_requests):
+        """Get several property values, from one or more objects. Raises NMOSTestException on error"""
+        return [self.get_property_override(test, property_id, **kwargs) for property_id, kwargs in property_requests]
+
     # End of overridden functions
 
     def get_property(self, test, property_id, **kwargs):
@@ -786,6 +967,20 @@ class MS05Utils(NMOSUtils):
                                                 role_path=kwargs.get("role_path"))
         return NcMethodResult.factory(result)
 
+    def get_property_values(self, test, property_requests):
+        """Get several properties, from one or more objects, given a list of (property_id, kwargs) where kwargs are
+        as for get_property. Returns NcMethodResult for each, in order. Raises NMOSTestException on error"""
+        results = self.get_property_values_override(test, property_requests)
+        return self._create_method_results(test, results, property_requests)
+
+    def _create_method_results(self, test, results, property_requests):
+        method_results = []
+        for result, (_, kwargs) in zip(results, property_requests):
+            self.reference_datatype_schema_validate(test, result, NcMethodResult.__name__,
+                                                    role_path=kwargs.get("role_path"))
+            method_results.append(NcMethodResult.factory(result))
+        return method_results
+
     def set_property(self, test, property_id, argument, **kwargs):
         """Set property from object. Returns NcMethodResult. Raises NMOSTestException on error"""
         result = self.set_property_override(test, property_id, argument, **kwargs)
@@ -906,16 +1101,111 @@ class MS05Utils(NMOSUtils):
             self.device_model_metadata set on Device Model validation error.
             NMOSTestException raised if unable to query Device Model """
         if not self.device_model:
+            snapshot = self._load_device_model_snapshot(test) if CONFIG.MS05_DEVICE_MODEL_CACHE else None
+
             self.device_model = self.create_block(
                 test,
                 StandardClassIds.NCBLOCK.value,
                 self.ROOT_BLOCK_OID,
-                "root")
+                "root",
+                property_values=snapshot)
 
             if not self.device_model:
                 raise NMOSTestException(test.FAIL("Unable to query Device Model"))
+
+            if CONFIG.MS05_DEVICE_MODEL_CACHE and snapshot is None:
+                self._save_device_model_snapshot(test)
         return self.device_model
 
+    def _get_device_model_snapshot_path(self):
+        """Snapshots are keyed by the URL of the protocol API of the Node under test"""
+        identity = self.apis[self.protocol_api_key]["url"]
+        file_name = hashlib.sha1(identity.encode("utf-8")).hexdigest() + ".json"
+        return os.path.join(CONFIG.CACHE_PATH, "device_models", file_name)
+
+    def _load_device_model_snapshot(self, test):
+        """Load a previously saved snapshot of the Device Model discovery results, provided the members of every
+        block, the class and datatype descriptors of the Class Manager and the versions in the Device Manager of the
+        Node under test still match those in the snapshot. Returns None if there is no valid snapshot"""
+        try:
+            with open(self._get_device_model_snapshot_path()) as f:
+                snapshot = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        if not isinstance(snapshot, dict) \
+                or snapshot.get("identity") != self.apis[self.protocol_api_key]["url"] \
+                or not isinstance(snapshot.get("revalidate"), list) \
+                or not isinstance(snapshot.get("property_values"), dict):
+            return None
+
+        # Revalidate the snapshot by getting the properties which determine the rest of the discovery results
+        # together, rather than walking the model
+        property_values = snapshot["property_values"]
+        property_requests = [(NcPropertyId({"level": level, "index": index}), {"oid": oid, "role_path": role_path})
+                             for oid, role_path, level, index in snapshot["revalidate"]]
+        keys = [self._create_property_value_key(kwargs["role_path"], property_id)
+                for property_id, kwargs in property_requests]
+        if any(key not in property_values for key in keys):
+            return None
+        results = self.get_property_values_override(test, property_requests)
+        if any(result != property_values[key] for result, key in zip(results, keys)):
+            return None
+
+        return property_values
+
+    def _save_device_model_snapshot(self, test):
+        """Save the results of discovering the Device Model, so that they can be reused by later test runs"""
+        def find_objects(class_id):
+            return self.device_model.find_members_by_class_id(class_id,
+                                                              include_derived=True,
+                                                              recurse=True,
+                                                              get_objects=True)
+
+        def property_requests(objects, property_ids):
+            return [(property_id.value, {"oid": o.oid, "role_path": o.role_path})
+                    for o in objects for property_id in property_ids]
+
+        # The versions in the Device Manager aren't otherwise part of the discovery results, so get them now
+        device_manager_requests = property_requests(find_objects(StandardClassIds.NCDEVICEMANAGER.value),
+                                                    NcDeviceManagerProperties)
+        try:
+            results = self.get_property_values_override(test, device_manager_requests)
+        except NMOSTestException:
+            print(" * WARNING: Unable to save Device Model snapshot: unable to get Device Manager versions")
+            return
+        property_values = dict(self.device_model_property_values)
+        property_values.update(zip([self._create_property_value_key(kwargs["role_path"], property_id)
+                                    for property_id, kwargs in device_manager_requests], results))
+
+        # Properties which must be unchanged for the snapshot to be reused
+        revalidate = property_requests([self.device_model] + find_objects(StandardClassIds.NCBLOCK.value),
+                                       [NcBlockProperties.MEMBERS])
+        revalidate += property_requests(find_objects(StandardClassIds.NCCLASSMANAGER.value),
+                                        NcClassManagerProperties)
+        revalidate += device_manager_requests
+
+        snapshot = {
+            "identity": self.apis[self.protocol_api_key]["url"],
+            "revalidate": [[kwargs["oid"], kwargs["role_path"], property_id.level, property_id.index]
+                           for property_id, kwargs in revalidate],
+            "property_values": property_values
+        }
+
+        snapshot_path = self._get_device_model_snapshot_path()
+        try:
+            os.makedirs(os.path.dirname(snapshot_path), exist_ok=True)
+            # Write then rename so that another test run never reads a partial snapshot
+            temp_path = f"{snapshot_path}.{os.getpid()}"
+            with open(temp_path, "w") as f:
+                json.dump(snapshot, f)
+            os.replace(temp_path, snapshot_path)
+        except OSError as e:
+            print(f" * WARNING: Unable to save Device Model snapshot: {e}")
+
+    def _create_property_value_key(self, role_path, property_id):
+        return f"{self.create_role_path_string(role_path)}:{property_id.level}p{property_id.index}"
+
     def _primitive_to_JSON(self, type):
         """Convert MS-05 primitive type to corresponding JSON type"""
 
@@ -962,8 +1252,7 @@ class MS05Utils(NMOSUtils):
 
         # Generate reference MS-05 datatype schemas from MS-05 datatype descriptors
         self.reference_datatype_schemas = self.generate_json_schemas(
-            datatype_descriptors=self.reference_datatype_descriptors,
-            schema_path=os.path.join(self.apis[self.protocol_api_key]["spec_path"], "APIs/schemas/"))
+            datatype_descriptors=self.reference_datatype_descriptors)
 
     def _load_model_descriptors(self, descriptor_paths):
         descriptors = {}
@@ -980,25 +1269,9 @@ class MS05Utils(NMOSUtils):
 
         return descriptors
 
-    def generate_json_schemas(self, datatype_descriptors, schema_path):
-        """Generate datatype schemas from datatype descriptors"""
-        datatype_schema_names = []
-        base_schema_path = os.path.abspath(schema_path)
-        if not os.path.exists(base_schema_path):
-            os.makedirs(base_schema_path)
-
-        for name, descriptor in datatype_descriptors.items():
-            json_schema = self._datatype_descriptor_to_schema(descriptor)
-            with open(os.path.join(base_schema_path, f"{name}.json"), "w") as output_file:
-                json.dump(json_schema, output_file, indent=4)
-                datatype_schema_names.append(name)
-
-        # Load resolved MS-05 datatype schemas
-        datatype_schemas = {}
-        for name in datatype_schema_names:
-            datatype_schemas[name] = load_resolved_schema(schema_path, f"{name}.json", path_prefix=False)
-
-        return datatype_schemas
+    def generate_json_schemas(self, datatype_descriptors):
+        """Generate datatype schemas from datatype descriptors. Returns a DatatypeSchemaRegistry"""
+        return DatatypeSchemaRegistry(datatype_descriptors, self._datatype_descriptor_to_schema)
 
     def _datatype_descriptor_to_schema(self, descriptor):
         """Convert NcDatatypeDescriptor to json schema"""
@@ -1074,46 +1347,39 @@ class MS05Utils(NMOSUtils):
         # This will include any Non-standard data types
         class_manager = self.get_class_manager(test)
 
-        try:
-            # Create JSON schemas for the queried datatypes
-            return self.generate_json_schemas(
-                datatype_descriptors=class_manager.datatype_descriptors,
-                schema_path=os.path.join(self.apis[self.protocol_api_key]["spec_path"], "APIs/tmp_schemas/"))
-        except Exception as e:
-            raise NMOSTestException(test.FAIL(f"Unable to create Device Model schemas: {e.message}"))
+        # Create JSON schemas for the queried datatypes
+        return self.generate_json_schemas(datatype_descriptors=class_manager.datatype_descriptors)
 
     def queried_datatype_schema_validate(self, test, payload, datatype_name, role_path=None):
         """Validate payload against datatype schema queried from Node under Test's Class Manager"""
         if not self.datatype_schemas:
-            # Generate datatype schemas based on the datatype decriptors
-            # queried from the Node under test's Device Model.
-            # This will include any Non-standard data types
-            class_manager = self.get_class_manager(test)
+            self.datatype_schemas = self._generate_device_model_datatype_schemas(test)
 
-            try:
-                # Create JSON schemas for the queried datatypes
-                self.datatype_schemas = self.generate_json_schemas(
-                    datatype_descriptors=class_manager.datatype_descriptors,
-                    schema_path=os.path.join(self.apis[self.protocol_api_key]["spec_path"], "APIs/tmp_schemas/"))
-            except Exception as e:
-                raise NMOSTestException(test.FAIL(f"Unable to create Device Model schemas: {e.message}"))
-
-        self._validate_schema(test, payload, self.datatype_schemas.get(datatype_name),
+        self._validate_schema(test, payload, self.datatype_schemas, datatype_name,
                               f"role path={self.create_role_path_string(role_path)}: datatype={datatype_name}: ")
 
     def reference_datatype_schema_validate(self, test, payload, datatype_name, role_path=None):
         """Validate payload against specification reference datatype schema"""
-        self._validate_schema(test, payload, self.reference_datatype_schemas.get(datatype_name),
+        self._validate_schema(test, payload, self.reference_datatype_schemas, datatype_name,
                               f"role path={self.create_role_path_string(role_path)}: datatype={datatype_name}: ")
 
-    def _validate_schema(self, test, payload, schema, context=""):
-        """Delegates to jsonschema validate. Raises NMOSTestExceptions on error"""
-        if not schema:
-            raise NMOSTestException(test.FAIL(f"{context}Missing schema. Possible unknown type"))
+    def reference_datatype_schema_validate_all(self, test, payloads, datatype_name, role_path=None):
+        """Validate each of a list of payloads against specification reference datatype schema"""
+        context = f"role path={self.create_role_path_string(role_path)}: datatype={datatype_name}: "
+        for payload in payloads:
+            self._validate_schema(test, payload, self.reference_datatype_schemas, datatype_name, context)
+
+    def _validate_schema(self, test, payload, datatype_schemas, datatype_name, context=""):
+        """Validate payload against the schema for datatype_name in a DatatypeSchemaRegistry.
+        Raises NMOSTestExceptions on error"""
         try:
             # Validate the JSON schema is correct
-            checker = FormatChecker(["ipv4", "ipv6", "uri"])
-            validate(payload, schema, format_checker=checker)
+            validator = datatype_schemas.get_validator(datatype_name)
+            if not validator:
+                raise NMOSTestException(test.FAIL(f"{context}Missing schema. Possible unknown type"))
+            error = best_match(validator.iter_errors(payload))
+            if error is not None:
+                raise error
         except ValidationError as e:
             raise NMOSTestException(test.FAIL(f"{context}Schema validation error: {e.message}. "
                                               "Note that error may originate from a subschema of this schema."))
@@ -1239,7 +1505,9 @@ class MS05Utils(NMOSUtils):
     def _get_class_manager_datatype_descriptors(self, test, class_manager_oid, role_path):
         method_result = self.get_property(test, NcClassManagerProperties.DATATYPES.value,
                                           oid=class_manager_oid, role_path=role_path)
+        return self._create_class_manager_datatype_descriptors(test, method_result, role_path)
 
+    def _create_class_manager_datatype_descriptors(self, test, method_result, role_path):
         if isinstance(method_result, NcMethodResultError):
             raise NMOSTestException(test.FAIL(f"role path={self.create_role_path_string(role_path)}: "
                                               "Error getting Class Manager Datatype property: "
@@ -1261,7 +1529,9 @@ class MS05Utils(NMOSUtils):
     def _get_class_manager_class_descriptors(self, test, class_manager_oid, role_path):
         method_result = self.get_property(test, NcClassManagerProperties.CONTROL_CLASSES.value,
                                           oid=class_manager_oid, role_path=role_path)
+        return self._create_class_manager_class_descriptors(test, method_result, role_path)
 
+    def _create_class_manager_class_descriptors(self, test, method_result, role_path):
         if isinstance(method_result, NcMethodResultError):
             raise NMOSTestException(test.FAIL(f"role path={self.create_role_path_string(role_path)}: "
                                               "Error getting Class Manager Control Classes property: "
@@ -1278,13 +1548,61 @@ class MS05Utils(NMOSUtils):
         descriptors = {self.create_class_id_string(r.get("classId")): NcClassDescriptor(r) for r in response}
         return descriptors
 
-    def create_block(self, test, class_id, oid, role, base_role_path=None, member_descriptor=None, owner=None):
-        """Recursively create Device Model hierarchy"""
+    def create_block(self, test, class_id, oid, role, base_role_path=None, member_descriptor=None, owner=None,
+                     property_values=None):
+        """Create Device Model hierarchy, discovering it breadth-first.
+        property_values may provide the raw results of the property gets, e.g. from a Device Model snapshot"""
         # will set self.device_model_error to True if problems encountered
+        root_object = None
+        # Each level of the hierarchy is a list of (member, parent block) where member is
+        # (class_id, oid, role, base_role_path, member_descriptor, owner)
+        level = [((class_id, oid, role, base_role_path, member_descriptor, owner), None)]
+        while level:
+            # Retrieve the properties of every object in this level together
+            property_requests = []
+            for (class_id, oid, role, base_role_path, _, _), _ in level:
+                kwargs = {"oid": oid, "role_path": self.create_role_path(base_role_path, role)}
+                property_requests.append((NcObjectProperties.RUNTIME_PROPERTY_CONSTRAINTS.value, kwargs))
+                if self.is_block(class_id):
+                    property_requests.append((NcBlockProperties.MEMBERS.value, kwargs))
+                elif self._is_class_manager(class_id):
+                    property_requests.append((NcClassManagerProperties.CONTROL_CLASSES.value, kwargs))
+                    property_requests.append((NcClassManagerProperties.DATATYPES.value, kwargs))
+            method_results = iter(self._get_device_model_property_values(test, property_requests, property_values))
+
+            next_level = []
+            for member, parent in level:
+                nc_object, child_members = self._create_object(test, method_results, *member)
+                if parent is None:
+                    root_object = nc_object
+                else:
+                    parent.add_child_object(nc_object)
+                next_level += [(child_member, nc_object) for child_member in child_members]
+            level = next_level
+
+        if isinstance(root_object, NcBlock):
+            root_object.build_indexes()
+
+        return root_object
+
+    def _get_device_model_property_values(self, test, property_requests, property_values):
+        """Get properties as for get_property_values, but using property_values when it has all the results, and
+        recording the results in self.device_model_property_values"""
+        keys = [self._create_property_value_key(kwargs["role_path"], property_id)
+                for property_id, kwargs in property_requests]
+        if property_values is not None and all(key in property_values for key in keys):
+            results = [property_values[key] for key in keys]
+        else:
+            results = self.get_property_values_override(test, property_requests)
+        self.device_model_property_values.update(zip(keys, results))
+        return self._create_method_results(test, results, property_requests)
+
+    def _create_object(self, test, method_results, class_id, oid, role, base_role_path, member_descriptor, owner):
+        """Create an object from the results of getting the properties requested by create_block.
+        Returns the object and, for a block, its members"""
         role_path = self.create_role_path(base_role_path, role)
 
-        method_result = self.get_property(test, NcObjectProperties.RUNTIME_PROPERTY_CONSTRAINTS.value,
-                                          oid=oid, role_path=role_path)
+        method_result = next(method_results)
 
         if isinstance(method_result, NcMethodResultError):
             raise NMOSTestException(test.FAIL(f"role path={self.create_role_path_string(role_path)}: "
@@ -1300,8 +1618,7 @@ class MS05Utils(NMOSUtils):
             runtime_constraints = [NcPropertyConstraints.factory(c) for c in runtime_constraints]
 
         if self.is_block(class_id):
-            method_result = self.get_property(test, NcBlockProperties.MEMBERS.value,
-                                              oid=oid, role_path=role_path)
+            method_result = next(method_results)
 
             if isinstance(method_result, NcMethodResultError):
                 raise NMOSTestException(test.FAIL(f"role path={self.create_role_path_string(role_path)}: "
@@ -1315,20 +1632,18 @@ class MS05Utils(NMOSUtils):
 
             nc_block = NcBlock(class_id, oid, owner, role, role_path, runtime_constraints, member_descriptor)
 
-            for m in method_result.value:
-                self.reference_datatype_schema_validate(test, m, NcBlockMemberDescriptor.__name__, role_path)
-                child_object = self.create_block(test, m["classId"], m["oid"], m["role"], role_path,
-                                                 NcBlockMemberDescriptor(m), m["owner"])
-                nc_block.add_child_object(child_object)
+            self.reference_datatype_schema_validate_all(test, method_result.value, NcBlockMemberDescriptor.__name__,
+                                                        role_path)
 
-            return nc_block
+            return nc_block, [(m["classId"], m["oid"], m["role"], role_path, NcBlockMemberDescriptor(m), m["owner"])
+                              for m in method_result.value]
         else:
             if self._is_class_manager(class_id):
-                class_descriptors = self._get_class_manager_class_descriptors(
-                    test, class_manager_oid=oid, role_path=role_path)
+                class_descriptors = self._create_class_manager_class_descriptors(
+                    test, next(method_results), role_path=role_path)
 
-                datatype_descriptors = self._get_class_manager_datatype_descriptors(
-                    test, class_manager_oid=oid, role_path=role_path)
+                datatype_descriptors = self._create_class_manager_datatype_descriptors(
+                    test, next(method_results), role_path=role_path)
 
                 if not class_descriptors or not datatype_descriptors:
                     raise NMOSTestException(test.FAIL("No class descriptors or datatype descriptors "
@@ -1336,9 +1651,9 @@ class MS05Utils(NMOSUtils):
 
                 return NcClassManager(class_id, oid, owner, role, role_path,
                                       class_descriptors, datatype_descriptors,
-                                      runtime_constraints, member_descriptor)
+                                      runtime_constraints, member_descriptor), []
 
-            return NcObject(class_id, oid, owner, role, role_path, runtime_constraints, member_descriptor)
+            return NcObject(class_id, oid, owner, role, role_path, runtime_constraints, member_descriptor), []
 
     def _get_singleton_object_by_class_id(self, test, class_id):
         device_model = self.query_device_model(test)
@@ -14,21 +14,54 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from threading import Thread
-from queue import Queue
+import socket
+import time
+
+from collections import deque, OrderedDict
+from threading import Condition, Lock, Thread
+from zeroconf import ServiceBrowser
+
+from . import Config as CONFIG
+
+# Upper bound on the number of threads concurrently resolving service info
+MAX_RESOLVER_THREADS = 4
+
+# Time in seconds allowed for resolutions already in progress to complete, as for Zeroconf.get_service_info
+RESOLUTION_TIMEOUT = 3
 
 
 class MdnsListener(object):
-    def __init__(self, zeroconf):
+    def __init__(self, zeroconf, max_resolver_threads=MAX_RESOLVER_THREADS):
         self.zeroconf = zeroconf
-        self.services = list()
-        self.resolve_queue = Queue()
+        self.max_resolver_threads = max_resolver_threads
+        self.resolve_cond = Condition()
+        self.resolve_queue = deque()
+        # (srv_type, name) -> True if an update arrived while the resolution was in progress
+        self.pending = dict()
+        self.workers = 0
+        # name -> ServiceInfo, most recently resolved last
+        self.services = OrderedDict()
+        # (port, address) -> OrderedDict of name -> ServiceInfo
+        self.index = dict()
+        # srv_type -> ServiceBrowser, shared by every browse of that service type
+        self.browsers = dict()
+        self.browsers_lock = Lock()
 
     def _resolve_service(self, srv_type, name):
-        self.resolve_queue.put((srv_type, name))
-        t = Thread(target=self.worker)
-        t.daemon = True
-        t.start()
+        key = (srv_type, name)
+        with self.resolve_cond:
+            if key in self.pending:
+                # Already queued or being resolved, so just ensure the latest data is picked up
+                if key not in self.resolve_queue:
+                    self.pending[key] = True
+                return
+            self.pending[key] = False
+            self.resolve_queue.append(key)
+            if self.workers < self.max_resolver_threads:
+                self.workers += 1
+                t = Thread(target=self.worker)
+                t.daemon = True
+                t.start()
 
     def add_service(self, zeroconf, srv_type, name):
         self._resolve_service(srv_type, name)
@@ -39,13 +72,96 @@ class MdnsListener(object):
     def update_service(self, zeroconf, srv_type, name):
         self._resolve_service(srv_type, name)
 
+    def wait_for_resolution(self, timeout=None):
+        """Wait for all in-flight resolutions to complete, returning False on timeout"""
+        with self.resolve_cond:
+            return self.resolve_cond.wait_for(lambda: not self.pending, timeout)
+
     def get_service_list(self):
-        self.resolve_queue.join()
-        return self.services
+        self.wait_for_resolution(RESOLUTION_TIMEOUT)
+        with self.resolve_cond:
+            return list(self.services.values())
+
+    def get_service(self, name):
+        """Get the most recently resolved ServiceInfo for the given service instance name, if any"""
+        with self.resolve_cond:
+            return self.services.get(name)
+
+    def find_services(self, port=None, address=None, srv_type=None):
+        """Get the resolved ServiceInfo objects matching the given port, IPv4 address and service type"""
+        with self.resolve_cond:
+            return self._find_services(port, address, srv_type)
+
+    def _find_services(self, port, address, srv_type):
+        if port is not None and address is not None:
+            candidates = self.index.get((port, address), {}).values()
+        else:
+            candidates = self.services.values()
+        return [info for info in candidates
+                if (port is None or info.port == port)
+                and (address is None or address in self.get_addresses(info))
+                and (srv_type is None or info.type == srv_type)]
+
+    def browse(self, srv_type, port=None, address=None, txt_keys=None, timeout=None):
+        """Browse for the given service type and get the resolved ServiceInfo objects matching the given port and
+        IPv4 address. Returns as soon as a match with all the given TXT record keys has been resolved, otherwise
+        after the timeout, which defaults to DNS_SD_BROWSE_TIMEOUT. If no port, address or TXT record keys are given,
+        always waits for the full timeout. Each service type is only browsed once per listener, so results from
+        earlier browses are immediately available to later ones."""
+        if timeout is None:
+            timeout = CONFIG.DNS_SD_BROWSE_TIMEOUT
+
+        with self.browsers_lock:
+            if srv_type not in self.browsers:
+                self.browsers[srv_type] = ServiceBrowser(self.zeroconf, srv_type, self)
+
+        if port is None and address is None and not txt_keys:
+            time.sleep(timeout)
+            self.wait_for_resolution(RESOLUTION_TIMEOUT)
+            return self.find_services(port, address, srv_type)
+
+        txt_keys = [key.encode("ascii") for key in txt_keys or []]
+
+        def matched():
+            return any(all(key in info.properties for key in txt_keys)
+                       for info in self._find_services(port, address, srv_type))
+
+        with self.resolve_cond:
+            if not self.resolve_cond.wait_for(matched, timeout):
+                # Allow any resolutions which were already in progress to complete, but don't wait indefinitely
+                # for one which never does
+                self.resolve_cond.wait_for(lambda: not self.pending, RESOLUTION_TIMEOUT)
+            return self._find_services(port, address, srv_type)
+
+    @staticmethod
+    def get_addresses(info):
+        return [socket.inet_ntoa(address) for address in info.addresses]
+
+    def _store(self, info):
+        previous = self.services.pop(info.name, None)
+        if previous is not None:
+            for address in self.get_addresses(previous):
+                self.index.get((previous.port, address), {}).pop(info.name, None)
+        self.services[info.name] = info
+        for address in self.get_addresses(info):
+            self.index.setdefault((info.port, address), OrderedDict())[info.name] = info
 
     def worker(self):
-        item = self.resolve_queue.get()
-        info = self.zeroconf.get_service_info(item[0], item[1])
-        if info is not None:
-            self.services.append(info)
-        self.resolve_queue.task_done()
+        while True:
+            with self.resolve_cond:
+                if not self.resolve_queue:
+                    self.workers -= 1
+                    return
+                key = self.resolve_queue.popleft()
+            try:
+                info = self.zeroconf.get_service_info(key[0], key[1])
+            except Exception:
+                info = None
+            with self.resolve_cond:
+                if info is not None:
+                    self._store(info)
+                if self.pending.pop(key):
+                    # An update arrived during resolution, so resolve again
+                    self.pending[key] = False
+                    self.resolve_queue.append(key)
+                self.resolve_cond.notify_all()
@@ -0,0 +1,216 @@
+# Copyright (C) 2026 Advanced Media Workflow Association
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import bisect
+import threading
+import time
+
+# Upper bounds in seconds of the buckets of the request latency histograms
+LATENCY_BUCKETS = [0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10]
+
+# Content type of the Prometheus text exposition format
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def format_labels(label_names, label_values):
+    if not label_names:
+        return ""
+    escaped = [str(value).replace("\\", "\\\\").replace("\"", "\\\"").replace("\n", "\\n") for value in label_values]
+    return "{" + ",".join("{}=\"{}\"".format(name, value) for name, value in zip(label_names, escaped)) + "}"
+
+
+def format_value(value):
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Metric(object):
+    """
+    A metric with a value for each combination of label values, formatted in the Prometheus text exposition format.
+    Updates take a lock only for as long as it takes to update the value, so they can be made on every request.
+    """
+    metric_type = "untyped"
+
+    def __init__(self, name, documentation, label_names=()):
+        self.name = name
+        self.documentation = documentation
+        self.label_names = tuple(label_names)
+        self.lock = threading.Lock()
+        # label values -> value
+        self.values = {}
+
+    def samples(self):
+        """Returns a list of (suffix, label names, label values, value)"""
+        with self.lock:
+            values = list(self.values.items())
+        return [("", self.label_names, label_values, value) for label_values, value in sorted(values)]
+
+    def format(self):
+        lines = ["# HELP {} {}".format(self.name, self.documentation),
+                 "# TYPE {} {}".format(self.name, self.metric_type)]
+        for suffix, label_names, label_values, value in self.samples():
+            lines.append("{}{}{} {}".format(self.name, suffix, format_labels(label_names, label_values),
+                                            format_value(value)))
+        return lines
+
+
+class Counter(Metric):
+    """A total which only goes up, e.g. the number of requests handled"""
+    metric_type = "counter"
+
+    def inc(self, *label_values, amount=1):
+        with self.lock:
+            self.values[label_values] = self.values.get(label_values, 0) + amount
+
+
+class Gauge(Metric):
+    """A value which goes up and down, e.g. the number of resources in a mock Registry"""
+    metric_type = "gauge"
+
+    def set(self, value, *label_values):
+        with self.lock:
+            self.values[label_values] = value
+
+
+class Histogram(Metric):
+    """Counts of observations, e.g. request latencies, in cumulative buckets, with their count and sum"""
+    metric_type = "histogram"
+
+    def __init__(self, name, documentation, label_names=(), buckets=LATENCY_BUCKETS):
+        Metric.__init__(self, name, documentation, label_names)
+        self.buckets = list(buckets)
+
+    def observe(self, value, *label_values):
+        index = bisect.bisect_left(self.buckets, value)
+        with self.lock:
+            # [count of each bucket, followed by the count above the largest bucket], sum
+            counts, total = self.values.get(label_values, ([0] * (len(self.buckets) + 1), 0))
+            counts[index] += 1
+            self.values[label_values] = (counts, total + value)
+
+    def samples(self):
+        with self.lock:
+            values = [(label_values, (list(counts), total)) for label_values, (counts, total) in self.values.items()]
+        samples = []
+        bucket_label_names = self.label_names + ("le",)
+        for label_values, (counts, total) in sorted(values):
+            cumulative = 0
+            for bound, count in zip(self.buckets + [float("inf")], counts):
+                cumulative += count
+                samples.append(("_bucket", bucket_label_names, label_values + (format_value(bound),), cumulative))
+            samples.append(("_count", self.label_names, label_values, cumulative))
+            samples.append(("_sum", self.label_names, label_values, total))
+        return samples
+
+
+# Metrics maintained as the mock services handle requests
+MOCK_REQUESTS = Counter(
+    "nmos_testing_mock_requests_total",
+    "Requests handled by the mock services, by port, blueprint, endpoint, method and status code",
+    ["port", "blueprint", "endpoint", "method", "code"])
+MOCK_REQUEST_DURATION = Histogram(
+    "nmos_testing_mock_request_duration_seconds",
+    "Time taken by the mock services to handle requests, by port, blueprint and endpoint",
+    ["port", "blueprint", "endpoint"])
+MOCK_REGISTRY_HEARTBEATS = Counter(
+    "nmos_testing_mock_registry_heartbeats_total",
+    "Heartbeats received by the mock Registries, by port",
+    ["port"])
+
+
+def record_mock_request(port, blueprint, endpoint, method, code, duration):
+    MOCK_REQUESTS.inc(str(port), blueprint or "", endpoint or "", method, str(code))
+    MOCK_REQUEST_DURATION.observe(duration, str(port), blueprint or "", endpoint or "")
+
+
+def collect_mock_registry_metrics():
+    """Returns gauges of the current state of each mock Registry, which are read when the metrics are requested
+    rather than maintained as the state changes"""
+    from .mocks.Registry import REGISTRIES
+
+    resources = Gauge("nmos_testing_mock_registry_resources",
+                      "Resources registered with the mock Registries, by port and resource type",
+                      ["port", "type"])
+    last_heartbeat = Gauge("nmos_testing_mock_registry_last_heartbeat_timestamp_seconds",
+                           "Time of the most recent heartbeat received by each mock Registry, since the last test",
+                           ["port"])
+    subscriptions = Gauge("nmos_testing_mock_registry_subscriptions",
+                          "Query API subscriptions of the mock Registries, by port",
+                          ["port"])
+    clients = Gauge("nmos_testing_mock_subscription_websocket_clients",
+                    "Clients connected to the subscription WebSockets of the mock Registries, by port",
+                    ["port"])
+    queue_depth = Gauge("nmos_testing_mock_subscription_websocket_queue_depth",
+                        "Messages waiting to be sent to clients of the subscription WebSockets, by port",
+                        ["port"])
+    max_queue_depth = Gauge("nmos_testing_mock_subscription_websocket_max_queue_depth",
+                            "Deepest any client's send buffer has been for the current subscriptions, by port",
+                            ["port"])
+    sent = Gauge("nmos_testing_mock_subscription_websocket_messages_sent",
+                 "Messages sent to clients of the current subscription WebSockets, by port",
+                 ["port"])
+    dropped = Gauge("nmos_testing_mock_subscription_websocket_messages_dropped",
+                    "Messages dropped because a client's send buffer was full, for the current subscriptions, by port",
+                    ["port"])
+
+    # Registries which share a data store share the same resources, so each registry is reported by its own port
+    for registry in REGISTRIES:
+        port = str(registry.port)
+        for resource_type, resources_of_type in list(registry.get_resources().items()):
+            resources.set(len(resources_of_type), port, resource_type)
+        last_heartbeat.set(registry.last_hb_time, port)
+        subscription_metrics = list(registry.get_subscription_metrics().values())
+        subscriptions.set(len(subscription_metrics), port)
+        clients.set(sum(_["clients"] for _ in subscription_metrics), port)
+        queue_depth.set(sum(_["queue_depth"] for _ in subscription_metrics), port)
+        max_queue_depth.set(max([0] + [_["max_queue_depth"] for _ in subscription_metrics]), port)
+        sent.set(sum(_["sent"] for _ in subscription_metrics), port)
+        dropped.set(sum(_["dropped"] for _ in subscription_metrics), port)
+
+    return [resources, last_heartbeat, subscriptions, clients, queue_depth, max_queue_depth, sent, dropped]
+
+
+def collect_test_metrics(current_run):
+    """Returns gauges of the test suite and test which are running, from the progress of the current run"""
+    active = Gauge("nmos_testing_test_active",
+                   "Whether a test suite is running")
+    info = Gauge("nmos_testing_test_info",
+                 "The test suite and test which are running",
+                 ["suite", "test"])
+    suite_elapsed = Gauge("nmos_testing_test_suite_elapsed_seconds",
+                          "Time since the running test suite started")
+    test_elapsed = Gauge("nmos_testing_test_elapsed_seconds",
+                         "Time since the running test started")
+    completed = Gauge("nmos_testing_test_suite_completed_tests",
+                      "Tests of the running test suite which have completed")
+
+    now = time.time()
+    active.set(1 if current_run else 0)
+    if current_run:
+        info.set(1, current_run["suite"], current_run.get("test") or "")
+        suite_elapsed.set(now - current_run["start_time"])
+        if current_run.get("test_start_time"):
+            test_elapsed.set(now - current_run["test_start_time"])
+        completed.set(current_run.get("completed", 0))
+
+    return [active, info, suite_elapsed, test_elapsed, completed]
+
+
+def format_metrics(metrics):
+    """Format metrics in the Prometheus text exposition format"""
+    lines = []
+    for metric in metrics:
+        lines.extend(metric.format())
+    return "\n".join(lines) + "\n"
@@ -14,9 +14,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import git
 import os
 import copy
+import functools
 import pickle
 import random
 import threading
@@ -30,35 +30,31 @@ import ipaddress
 import socket
 import ssl
 import subprocess
-import pkgutil
+import importlib.util
+import hashlib
 import shlex
+import shutil
+import tempfile
 import re
 
-from flask import Flask, render_template, flash, request, make_response, jsonify
+from flask import Flask, Response, g, render_template, flash, request, make_response, jsonify
 from flask_cors import CORS
 from wtforms import Form, validators, StringField, SelectField, SelectMultipleField, IntegerField, HiddenField
 from wtforms import FormField, FieldList
-from werkzeug.serving import WSGIRequestHandler
+from werkzeug.serving import WSGIRequestHandler, make_server
 from enum import IntEnum
-from junit_xml import TestSuite, TestCase
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from types import SimpleNamespace
 from requests.compat import json
 
 from . import Config as CONFIG
-from .DNS import DNS
-from .GenericTest import NMOSInitException
-from . import TestingFacadeUtils
+from . import Instrumentation
+from . import Metrics
+from .Progress import PROGRESS, ProgressSink
+from .ResultSink import format_result, make_junit_test_case, open_result_sink
+from .TestDefinitions import DEFAULT_ARGS, TEST_DEFINITIONS, get_test_class
 from .TestResult import TestStates
-from .TestHelper import get_default_ip
-from .NMOSUtils import DEFAULT_ARGS
-from .CRL import CRL, CRL_API
-from .OCSP import OCSP, OCSP_API
-from .mocks.Node import NODE, NODE_API
-from .mocks.Registry import NUM_REGISTRIES, REGISTRIES, REGISTRY_API
-from .mocks.System import NUM_SYSTEMS, SYSTEMS, SYSTEM_API
-from .mocks.Auth import AUTH_API, PRIMARY_AUTH, SECONDARY_AUTH
-from zeroconf import Zeroconf
 
 # Make ANSI escape character sequences (for producing coloured terminal text) work under Windows
 try:
@@ -67,34 +63,6 @@ try:
 except ImportError:
     pass
 
-from .suites import IS0401Test
-from .suites import IS0402Test
-from .suites import IS0403Test
-from .suites import IS0404Test
-from .suites import IS0501Test
-from .suites import IS0502Test
-from .suites import IS0503Test
-from .suites import IS0601Test
-from .suites import IS0701Test
-from .suites import IS0702Test
-from .suites import IS0801Test
-from .suites import IS0802Test
-from .suites import IS0901Test
-from .suites import IS0902Test
-# from .suites import IS1001Test
-from .suites import IS1101Test
-from .suites import IS1201Test
-from .suites import IS1401Test
-from .suites import BCP00301Test
-from .suites import BCP0050101Test
-from .suites import BCP0060101Test
-from .suites import BCP0060102Test
-from .suites import BCP0070302Test
-from .suites import BCP00604Test
-from .suites import BCP0070301Test
-from .suites import BCP0080101Test
-from .suites import BCP0080201Test
-
 
 FLASK_APPS = []
 DNS_SERVER = None
@@ -106,6 +74,9 @@ if not CONFIG.RANDOM_SEED:
 
 CACHEBUSTER = random.randint(1, 10000)
 
+# State and results of the test suite most recently started via /api/start
+API_RUN = {}
+
 core_app = Flask(__name__)
 CORS(core_app)
 core_app.debug = False
@@ -113,474 +84,113 @@ core_app.config['SECRET_KEY'] = 'nmos-interop-testing-jtnm'
 core_app.config['TEST_ACTIVE'] = False
 core_app.config['PORT'] = CONFIG.PORT_BASE
 core_app.config['SECURE'] = False
-core_app.register_blueprint(NODE_API)  # Dependency for IS0401Test
-core_app.register_blueprint(TestingFacadeUtils.TEST_API)
 FLASK_APPS.append(core_app)
 
-for instance in range(NUM_REGISTRIES):
-    reg_app = Flask(__name__)
-    CORS(
-        reg_app, origins=['*'],
-        allow_headers=['*'],
-        expose_headers=['Content-Length',
-                        'Link',
-                        'Server-Timing',
-                        'Timing-Allow-Origin',
-                        'Vary',
-                        'X-Paging-Limit',
-                        'X-Paging-Since',
-                        'X-Paging-Until'])
-    reg_app.debug = False
-    reg_app.config['REGISTRY_INSTANCE'] = instance
-    reg_app.config['PORT'] = REGISTRIES[instance].port
-    reg_app.config['SECURE'] = CONFIG.ENABLE_HTTPS
-    reg_app.register_blueprint(REGISTRY_API)  # Dependency for IS0401Test
-    FLASK_APPS.append(reg_app)
-
-for instance in range(NUM_SYSTEMS):
-    sys_app = Flask(__name__)
-    sys_app.debug = False
-    sys_app.config['SYSTEM_INSTANCE'] = instance
-    sys_app.config['PORT'] = SYSTEMS[instance].port
-    sys_app.config['SECURE'] = CONFIG.ENABLE_HTTPS
-    sys_app.register_blueprint(SYSTEM_API)  # Dependency for IS0902Test
-    FLASK_APPS.append(sys_app)
-
-sender_app = Flask(__name__)
-CORS(sender_app)
-sender_app.debug = False
-sender_app.config['PORT'] = NODE.port
-sender_app.config['SECURE'] = CONFIG.ENABLE_HTTPS
-sender_app.register_blueprint(NODE_API)  # Dependency for IS0401Test
-FLASK_APPS.append(sender_app)
-
-crl_app = Flask(__name__)
-crl_app.debug = False
-crl_app.config['PORT'] = CRL.port
-crl_app.config['SECURE'] = False
-crl_app.register_blueprint(CRL_API)  # CRL server
-FLASK_APPS.append(crl_app)
-
-ocsp_app = Flask(__name__)
-ocsp_app.debug = False
-ocsp_app.config['PORT'] = OCSP.port
-ocsp_app.config['SECURE'] = False
-ocsp_app.register_blueprint(OCSP_API)  # OCSP server
-FLASK_APPS.append(ocsp_app)
-
-# Primary Authorization server
-if CONFIG.ENABLE_AUTH:
-    auth_app = Flask(__name__)
-    CORS(auth_app)
-    auth_app.debug = False
-    auth_app.config['AUTH_INSTANCE'] = 0
-    auth_app.config['PORT'] = PRIMARY_AUTH.port
-    auth_app.config['SECURE'] = CONFIG.ENABLE_HTTPS
-    auth_app.register_blueprint(AUTH_API)
-    FLASK_APPS.append(auth_app)
-
-# Definitions of each set of tests made available from the dropdowns
-TEST_DEFINITIONS = {
-    "IS-04-01": {
-        "name": "IS-04 Node API",
-        "specs": [{
-            "spec_key": "is-04",
-            "api_key": "node"
-        }],
-        "extra_specs": [{
-            "spec_key": "bcp-002-01",
-            "api_key": "grouphint"
-        }, {
-            "spec_key": "bcp-002-02",
-            "api_key": "asset"
-        }, {
-            "spec_key": "bcp-004-01",
-            "api_key": "receiver-caps"
-        }, {
-            "spec_key": "nmos-parameter-registers",
-            "api_key": "caps-register"
-        }],
-        "class": IS0401Test.IS0401Test
-    },
-    "IS-04-02": {
-        "name": "IS-04 Registry APIs",
-        "specs": [{
-            "spec_key": "is-04",
-            "api_key": "registration"
-        }, {
-            "spec_key": "is-04",
-            "api_key": "query"
-        }],
-        "class": IS0402Test.IS0402Test
-    },
-    "IS-04-03": {
-        "name": "IS-04 Node API (Peer to Peer)",
-        "specs": [{
-            "spec_key": "is-04",
-            "api_key": "node"
-        }],
-        "class": IS0403Test.IS0403Test
-    },
-    "IS-04-04": {
-        "name": "IS-04 Controller",
-        "specs": [{
-            "spec_key": "testing-facade",
-            "api_key": "testquestion"
-        }, {
-            "spec_key": "is-04",
-            "api_key": "query",
-            "disable_fields": ["host", "port"]
-        }],
-        "class": IS0404Test.IS0404Test
-    },
-    "IS-05-01": {
-        "name": "IS-05 Connection Management API",
-        "specs": [{
-            "spec_key": "is-05",
-            "api_key": "connection"
-        }],
-        "class": IS0501Test.IS0501Test
-    },
-    "IS-05-02": {
-        "name": "IS-05 Interaction with IS-04",
-        "specs": [{
-            "spec_key": "is-04",
-            "api_key": "node"
-        }, {
-            "spec_key": "is-05",
-            "api_key": "connection"
-        }],
-        "class": IS0502Test.IS0502Test
-    },
-    "IS-05-03": {
-        "name": "IS-05 Controller",
-        "specs": [{
-            "spec_key": "testing-facade",
-            "api_key": "testquestion"
-        }, {
-            "spec_key": "is-04",
-            "api_key": "query",
-            "disable_fields": ["host", "port"]
-        }, {
-            "spec_key": "is-05",
-            "api_key": "connection",
-            "disable_fields": ["host", "port"]
-        }],
-        "class": IS0503Test.IS0503Test
-    },
-    "IS-06-01": {
-        "name": "IS-06 Network Control API",
-        "specs": [{
-            "spec_key": "is-06",
-            "api_key": "netctrl"
-        }],
-        "class": IS0601Test.IS0601Test
-    },
-    "IS-07-01": {
-        "name": "IS-07 Event & Tally API",
-        "specs": [{
-            "spec_key": "is-07",
-            "api_key": "events"
-        }],
-        "class": IS0701Test.IS0701Test
-    },
-    "IS-07-02": {
-        "name": "IS-07 Interaction with IS-04 and IS-05",
-        "specs": [{
-            "spec_key": "is-04",
-            "api_key": "node"
-        }, {
-            "spec_key": "is-05",
-            "api_key": "connection"
-        }, {
-            "spec_key": "is-07",
-            "api_key": "events"
-        }],
-        "class": IS0702Test.IS0702Test
-    },
-    "IS-08-01": {
-        "name": "IS-08 Channel Mapping API",
-        "specs": [{
-            "spec_key": "is-08",
-            "api_key": "channelmapping"
-        }],
-        "class": IS0801Test.IS0801Test,
-        "selector": True
-    },
-    "IS-08-02": {
-        "name": "IS-08 Interaction with IS-04",
-        "specs": [{
-            "spec_key": "is-04",
-            "api_key": "node",
-            "disable_fields": ["selector"]
-        }, {
-            "spec_key": "is-08",
-            "api_key": "channelmapping"
-        }],
-        "class": IS0802Test.IS0802Test,
-        "selector": True
-    },
-    "IS-09-01": {
-        "name": "IS-09 System API",
-        "specs": [{
-            "spec_key": "is-09",
-            "api_key": "system"
-        }],
-        "class": IS0901Test.IS0901Test
-    },
-    "IS-09-02": {
-        "name": "IS-09 System API Discovery",
-        "specs": [{
-            "spec_key": "is-04",
-            "api_key": "node",
-            "disable_fields": ["port", "version"]
-        }, {
-            "spec_key": "is-09",
-            "api_key": "system",
-            "disable_fields": ["host", "port"]
-        }],
-        "class": IS0902Test.IS0902Test
-    },
-    # IS-10 testing is disabled until testing can be refactored to deal with commercial servers
-    # "IS-10-01": {
-    #     "name": "IS-10 Authorization API",
-    #     "specs": [{
-    #         "spec_key": "is-10",
-    #         "api_key": "auth"
-    #     }],
-    #     "class": IS1001Test.IS1001Test
-    # },
-    "IS-11-01": {
-        "name": "IS-11 Stream Compatibility Management API",
-        "specs": [{
-            "spec_key": "is-11",
-            "api_key": "streamcompatibility"
-        }, {
-            "spec_key": "is-04",
-            "api_key": "node"
-        }, {
-            "spec_key": "is-05",
-            "api_key": "connection"
-        }],
-        "class": IS1101Test.IS1101Test
-    },
-    "IS-12-01": {
-        "name": "IS-12 NMOS Control Protocol",
-        "specs": [{
-            "spec_key": "is-04",
-            "api_key": "node",
-            "disable_fields": ["urlpath"]
-        }, {
-            "spec_key": "is-12",
-            "api_key": "ncp",
-            "websocket": True,
-        }, {
-            "spec_key": "ms-05-02",
-            "api_key": "controlframework",
-            "disable_fields": ["host", "port", "urlpath"]
-        }, {
-            "spec_key": "testing-facade",
-            "api_key": "testquestion",
-            "disable_fields": ["urlpath"] if CONFIG.MS05_INTERACTIVE_TESTING else ["host", "port", "urlpath"]
-        }],
-        "extra_specs": [{
-            "spec_key": "nmos-control-feature-sets",
-            "api_key": "featuresets"
-        }],
-        "class": IS1201Test.IS1201Test,
-        "urlpath": True
-    },
-    "IS-14-01": {
-        "name": "IS-14 Device Configuration",
-        "specs": [{
-            "spec_key": "is-04",
-            "api_key": "node",
-            "disable_fields": ["selector"]
-        }, {
-            "spec_key": "is-14",
-            "api_key": "configuration"
-        }, {
-            "spec_key": "ms-05-02",
-            "api_key": "controlframework",
-            "disable_fields": ["host", "port", "selector"]
-        }, {
-            "spec_key": "testing-facade",
-            "api_key": "testquestion",
-            "disable_fields": ["selector"] if CONFIG.MS05_INTERACTIVE_TESTING else ["host", "port", "selector"]
-        }],
-        "extra_specs": [{
-            "spec_key": "nmos-control-feature-sets",
-            "api_key": "featuresets"
-        }],
-        "class": IS1401Test.IS1401Test,
-        "selector": True
-    },
-    "BCP-003-01": {
-        "name": "BCP-003-01 Secure Communication",
-        "specs": [{
-            "spec_key": "bcp-003-01",
-            "api_key": "secure"
-        }],
-        "class": BCP00301Test.BCP00301Test
-    },
-    "BCP-005-01-01": {
-        "name": "BCP-005-01 EDID to Receiver Capabilities Mapping",
-        "specs": [{
-            "spec_key": "is-04",
-            "api_key": "node"
-        }],
-        "class": BCP0050101Test.BCP0050101Test
-    },
-    "BCP-006-01-01": {
-        "name": "BCP-006-01 NMOS With JPEG XS",
-        "specs": [{
-            "spec_key": "is-04",
-            "api_key": "node"
-        }],
-        "extra_specs": [{
-            "spec_key": "nmos-parameter-registers",
-            "api_key": "flow-register"
-        }, {
-            "spec_key": "nmos-parameter-registers",
-            "api_key": "sender-register"
-        }],
-        "class": BCP0060101Test.BCP0060101Test
-    },
-    "BCP-006-01-02": {
-        "name": "BCP-006-01 Controller",
-        "specs": [{
-            "spec_key": "testing-facade",
-            "api_key": "testquestion"
-        }, {
-            "spec_key": "is-04",
-            "api_key": "query",
-            "disable_fields": ["host", "port"]
-        }, {
-            "spec_key": "is-05",
-            "api_key": "connection",
-            "disable_fields": ["host", "port"]
-        }],
-        "class": BCP0060102Test.BCP0060102Test
-    },
-    "BCP-007-03-01": {
-        "name": "BCP-007-03 NMOS With MXL",
-        "specs": [{
-            "spec_key": "is-04",
-            "api_key": "node"
-        }, {
-            "spec_key": "is-05",
-            "api_key": "connection"
-        }],
-        "extra_specs": [{
-            "spec_key": "bcp-004-01",
-            "api_key": "receiver-caps"
-        }, {
-            "spec_key": "nmos-parameter-registers",
-            "api_key": "caps-register"
-        }, {
-            "spec_key": "nmos-parameter-registers",
-            "api_key": "formats-register"
-        }, {
-            "spec_key": "nmos-parameter-registers",
-            "api_key": "media-types-register"
-        }, {
-            "spec_key": "bcp-007-03",
-            "api_key": "mxl-schemas"
-        }],
-        "class": BCP0070301Test.BCP0070301Test
-    },
-    "BCP-007-03-02": {
-        "name": "BCP-007-03 Controller",
-        "specs": [{
-            "spec_key": "testing-facade",
-            "api_key": "testquestion"
-        }, {
-            "spec_key": "is-04",
-            "api_key": "query",
-            "disable_fields": ["host", "port"]
-        }, {
-            "spec_key": "is-05",
-            "api_key": "connection",
-            "disable_fields": ["host", "port"]
-        }],
-        "class": BCP0070302Test.BCP0070302Test
-    },
-    "BCP-008-01-01": {
-        "name": "BCP-008-01 Receiver Status Monitoring",
-        "specs": [{
-            "spec_key": "is-04",
-            "api_key": "node",
-            "disable_fields": ["urlpath"]
-        }, {
-            "spec_key": "is-05",
-            "api_key": "connection",
-            "disable_fields": ["urlpath"]
-        }, {
-            "spec_key": "is-12",
-            "api_key": "ncp",
-            "websocket": True,
-        }, {
-            "spec_key": "ms-05-02",
-            "api_key": "controlframework",
-            "disable_fields": ["host", "port", "urlpath"]
-        }],
-        "extra_specs": [{
-            "spec_key": "nmos-control-feature-sets",
-            "api_key": "featuresets"
-        }, {
-            "spec_key": "bcp-008-01",
-            "api_key": "receivermonitor",
-            "disable_fields": ["host", "port", "urlpath"]
-        }],
-        "class": BCP0080101Test.BCP0080101Test,
-        "urlpath": True
-    },
-    "BCP-008-02-01": {
-        "name": "BCP-008-02 Sender Status Monitoring",
-        "specs": [{
-            "spec_key": "is-04",
-            "api_key": "node",
-            "disable_fields": ["urlpath"]
-        }, {
-            "spec_key": "is-05",
-            "api_key": "connection",
-            "disable_fields": ["urlpath"]
-        }, {
-            "spec_key": "is-12",
-            "api_key": "ncp",
-            "websocket": True,
-        }, {
-            "spec_key": "ms-05-02",
-            "api_key": "controlframework",
-            "disable_fields": ["host", "port", "urlpath"]
-        }],
-        "extra_specs": [{
-            "spec_key": "nmos-control-feature-sets",
-            "api_key": "featuresets"
-        }, {
-            "spec_key": "bcp-008-02",
-            "api_key": "sendermonitor",
-            "disable_fields": ["host", "port", "urlpath"]
-        }],
-        "class": BCP0080201Test.BCP0080201Test,
-        "urlpath": True
-    },
-    "BCP-006-04": {
-        "name": "BCP-006-04 NMOS With MPEG TS",
-        "specs": [{
-            "spec_key": "is-04",
-            "api_key": "node"
-        }],
-        "extra_specs": [{
-            "spec_key": "nmos-parameter-registers",
-            "api_key": "flow-register"
-        }, {
-            "spec_key": "nmos-parameter-registers",
-            "api_key": "sender-register"
-        }],
-        "class": BCP00604Test.BCP00604Test
-    }
-}
+
+def create_mock_apps():
+    """Create the Flask apps of the mock services, importing the mocks when the testing tool starts rather than
+    whenever this module is imported"""
+    from . import TestingFacadeUtils
+    from .CRL import CRL, CRL_API
+    from .OCSP import OCSP, OCSP_API
+    from .mocks.Node import NODE, NODE_API
+    from .mocks.Registry import NUM_REGISTRIES, REGISTRIES, REGISTRY_API
+    from .mocks.System import NUM_SYSTEMS, SYSTEMS, SYSTEM_API
+    from .mocks.Auth import AUTH_API, PRIMARY_AUTH
+
+    core_app.register_blueprint(NODE_API)  # Dependency for IS0401Test
+    core_app.register_blueprint(TestingFacadeUtils.TEST_API)
+
+    for instance in range(NUM_REGISTRIES):
+        reg_app = Flask(__name__)
+        CORS(
+            reg_app, origins=['*'],
+            allow_headers=['*'],
+            expose_headers=['Content-Length',
+                            'Link',
+                            'Server-Timing',
+                            'Timing-Allow-Origin',
+                            'Vary',
+                            'X-Paging-Limit',
+                            'X-Paging-Since',
+                            'X-Paging-Until'])
+        reg_app.debug = False
+        reg_app.config['REGISTRY_INSTANCE'] = instance
+        reg_app.config['PORT'] = REGISTRIES[instance].port
+        reg_app.config['SECURE'] = CONFIG.ENABLE_HTTPS
+        reg_app.register_blueprint(REGISTRY_API)  # Dependency for IS0401Test
+        FLASK_APPS.append(reg_app)
+
+    for instance in range(NUM_SYSTEMS):
+        sys_app = Flask(__name__)
+        sys_app.debug = False
+        sys_app.config['SYSTEM_INSTANCE'] = instance
+        sys_app.config['PORT'] = SYSTEMS[instance].port
+        sys_app.config['SECURE'] = CONFIG.ENABLE_HTTPS
+        sys_app.register_blueprint(SYSTEM_API)  # Dependency for IS0902Test
+        FLASK_APPS.append(sys_app)
+
+    sender_app = Flask(__name__)
+    CORS(sender_app)
+    sender_app.debug = False
+    sender_app.config['PORT'] = NODE.port
+    sender_app.config['SECURE'] = CONFIG.ENABLE_HTTPS
+    sender_app.register_blueprint(NODE_API)  # Dependency for IS0401Test
+    FLASK_APPS.append(sender_app)
+
+    crl_app = Flask(__name__)
+    crl_app.debug = False
+    crl_app.config['PORT'] = CRL.port
+    crl_app.config['SECURE'] = False
+    crl_app.register_blueprint(CRL_API)  # CRL server
+    FLASK_APPS.append(crl_app)
+
+    ocsp_app = Flask(__name__)
+    ocsp_app.debug = False
+    ocsp_app.config['PORT'] = OCSP.port
+    ocsp_app.config['SECURE'] = False
+    ocsp_app.register_blueprint(OCSP_API)  # OCSP server
+    FLASK_APPS.append(ocsp_app)
+
+    # Primary Authorization server
+    if CONFIG.ENABLE_AUTH:
+        auth_app = Flask(__name__)
+        CORS(auth_app)
+        auth_app.debug = False
+        auth_app.config['AUTH_INSTANCE'] = 0
+        auth_app.config['PORT'] = PRIMARY_AUTH.port
+        auth_app.config['SECURE'] = CONFIG.ENABLE_HTTPS
+        auth_app.register_blueprint(AUTH_API)
+        FLASK_APPS.append(auth_app)
+
+    for app in FLASK_APPS:
+        instrument_mock_app(app)
+
+
+def instrument_mock_app(app):
+    """Attribute the time spent handling requests to the mock services to the test which is running, and count them
+    in the metrics"""
+    def is_mock_request():
+        # The core app also serves the web UI and API of the testing tool itself
+        return app is not core_app or request.blueprint is not None
+
+    @app.before_request
+    def start_mock_request():
+        if is_mock_request():
+            g.instrumentation_start_time = time.time()
+
+    @app.after_request
+    def note_mock_response(response):
+        g.instrumentation_status_code = response.status_code
+        return response
+
+    @app.teardown_request
+    def finish_mock_request(exception):
+        if "instrumentation_start_time" in g:
+            duration = time.time() - g.instrumentation_start_time
+            Instrumentation.record(Instrumentation.MOCK_SERVER, duration, str(app.config['PORT']))
+            Metrics.record_mock_request(app.config['PORT'], request.blueprint, request.endpoint, request.method,
+                                        g.get("instrumentation_status_code", 500), duration)
 
 
 def enumerate_tests(class_def, describe=False):
@@ -607,6 +217,18 @@ def enumerate_tests(class_def, describe=False):
     return tests
 
 
+@functools.lru_cache(maxsize=None)
+def get_test_data():
+    """Describe every test suite and its tests for the web form, which requires importing every test suite"""
+    test_data = {}
+    for test_id in TEST_DEFINITIONS:
+        test_data[test_id] = copy.deepcopy(TEST_DEFINITIONS[test_id])
+        test_data[test_id].pop("module")
+        test_data[test_id]["test_methods"] = enumerate_tests(get_test_class(test_id))
+        test_data[test_id]["test_descriptions"] = enumerate_tests(get_test_class(test_id), describe=True)
+    return json.dumps(test_data)
+
+
 class NonValidatingSelectField(SelectField):
     def pre_validate(self, form):
         pass
@@ -652,15 +274,8 @@ class DataForm(Form):
                                                                                         ("auto", "auto")])
 
     # Hide test data in the web form for dynamic modification of behaviour
-    test_data = {}
-    for test_id in TEST_DEFINITIONS:
-        test_data[test_id] = copy.deepcopy(TEST_DEFINITIONS[test_id])
-        test_data[test_id].pop("class")
-        test_data[test_id]["test_methods"] = enumerate_tests(TEST_DEFINITIONS[test_id]["class"])
-        test_data[test_id]["test_descriptions"] = enumerate_tests(TEST_DEFINITIONS[test_id]["class"], describe=True)
-
     hidden_options = HiddenField(default=max_endpoints)
-    hidden_tests = HiddenField(default=json.dumps(test_data))
+    hidden_tests = HiddenField(default=lambda: get_test_data())
     hidden_specs = HiddenField(default=json.dumps(CONFIG.SPECIFICATIONS))
 
 
@@ -738,7 +353,24 @@ def index_page():
     return r
 
 
-def run_tests(test, endpoints, test_selection=["all"]):
+def run_tests(test, endpoints, test_selection=["all"], result_sinks=[], profile_directory=None):
+    """Run a test suite, passing each result to the result sinks, which are finished however the run ends"""
+    try:
+        return run_test_suite(test, endpoints, test_selection, result_sinks, profile_directory)
+    finally:
+        # The sinks have already been finished if the test suite ran, but not if it failed to start, e.g. because
+        # an endpoint was invalid, so that a partially written destination is never left open
+        for sink in result_sinks:
+            sink.finish(False)
+
+
+def run_test_suite(test, endpoints, test_selection, result_sinks, profile_directory):
+    from .GenericTest import NMOSInitException
+    from .mocks.Node import NODE
+    from .mocks.Registry import REGISTRIES
+    from .mocks.System import SYSTEMS
+    from .mocks.Auth import PRIMARY_AUTH, SECONDARY_AUTH
+
     if test in TEST_DEFINITIONS:
         test_def = TEST_DEFINITIONS[test]
         apis = {}
@@ -821,27 +453,46 @@ def run_tests(test, endpoints, test_selection=["all"]):
                     apis[api_key]["raml"] = spec_api["raml"]
 
         # Instantiate the test class
-        test_obj = test_def["class"](apis,
-                                     systems=SYSTEMS,
-                                     registries=REGISTRIES,
-                                     node=NODE,
-                                     dns_server=DNS_SERVER,
-                                     auths=[PRIMARY_AUTH, SECONDARY_AUTH])
+        test_obj = get_test_class(test)(apis,
+                                        systems=SYSTEMS,
+                                        registries=REGISTRIES,
+                                        node=NODE,
+                                        dns_server=DNS_SERVER,
+                                        auths=[PRIMARY_AUTH, SECONDARY_AUTH])
+
+        # Progress is always published, for the web UI and any other subscribers
+        result_sinks = [ProgressSink(PROGRESS)] + result_sinks
+        for sink in result_sinks:
+            sink.start(test, test_def["name"], tested_urls, endpoints)
+            test_obj.add_result_sink(sink)
+
+        if profile_directory:
+            from .Profiler import SuiteProfiler
+            test_obj.profiler = SuiteProfiler(profile_directory)
+            test_obj.profiler.start()
 
         core_app.config['TEST_ACTIVE'] = time.time()
+        complete = False
         try:
             result = test_obj.run_tests(test_selection)
+            complete = True
         except Exception as ex:
             print(" * ERROR: {}".format(ex))
             raise ex
         finally:
             core_app.config['TEST_ACTIVE'] = False
+            for sink in result_sinks:
+                sink.finish(complete)
+            if test_obj.profiler:
+                test_obj.profiler.stop()
         return {"result": result, "def": test_def, "urls": tested_urls, "suite": test}
     else:
         raise NMOSInitException("This test definition does not exist")
 
 
 def init_spec_cache():
+    import git
+
     print(" * Initialising specification repositories...")
 
     if not os.path.exists(CONFIG.CACHE_PATH):
@@ -911,6 +562,8 @@ def _export_config():
 
 
 def format_test_results(results, endpoints, format, args):
+    from junit_xml import TestSuite
+
     formatted = None
     total_time = 0
     max_name_len = 0
@@ -931,46 +584,49 @@ def format_test_results(results, endpoints, format, args):
             "endpoints": endpoints
         }
         for test_result in results["result"]:
-            formatted["results"].append({
-                "name": test_result.name,
-                "state": str(TestStates.DISABLED if test_result.name in ignored_tests else test_result.state),
-                "detail": test_result.detail,
-                "duration": test_result.elapsed_time,
-                "description": test_result.description
-            })
+            formatted["results"].append(format_result(test_result, ignored_tests))
         formatted = json.dumps(formatted, sort_keys=True, indent=4)
     elif format == "junit":
-        test_cases = []
-        for test_result in results["result"]:
-            test_case = TestCase(test_result.name, classname=results["suite"],
-                                 elapsed_sec=test_result.elapsed_time, timestamp=test_result.timestamp)
-            if test_result.name in ignored_tests or test_result.state in [
-                TestStates.DISABLED,
-                TestStates.UNCLEAR,
-                TestStates.MANUAL,
-                TestStates.NA,
-                TestStates.OPTIONAL
-            ]:
-                test_case.add_skipped_info(test_result.detail)
-            elif test_result.state in [TestStates.WARNING, TestStates.FAIL]:
-                test_case.add_failure_info(test_result.detail, failure_type=str(test_result.state))
-            elif test_result.state != TestStates.PASS:
-                test_case.add_error_info(test_result.detail, error_type=str(test_result.state))
-            test_cases.append(test_case)
+        test_cases = [make_junit_test_case(test_result, results["suite"], ignored_tests)
+                      for test_result in results["result"]]
         formatted = TestSuite(results["def"]["name"] + ": " + ", ".join(results["urls"]), test_cases)
     elif format == "console":
-        formatted = "\r\nPrinting test results for suite '{}' using API(s) '{}'\r\n" \
-                    .format(results["suite"], ", ".join(results["urls"]))
-        formatted += "----------------------------\r\n"
+        lines = ["",
+                 "Printing test results for suite '{}' using API(s) '{}'"
+                 .format(results["suite"], ", ".join(results["urls"])),
+                 "----------------------------"]
         for test_result in results["result"]:
             num_extra_dots = max_name_len - len(test_result.name)
             test_state = str(TestStates.DISABLED if test_result.name in ignored_tests else test_result.state)
-            formatted += "{} ...{} {}\r\n".format(test_result.name, ("." * num_extra_dots), test_state)
-        formatted += "----------------------------\r\n"
-        formatted += "Ran {} tests in ".format(len(results["result"])) + "{0:.3f}s".format(total_time) + "\r\n"
+            lines.append("{} ...{} {}".format(test_result.name, ("." * num_extra_dots), test_state))
+        lines.append("----------------------------")
+        lines.append("Ran {} tests in ".format(len(results["result"])) + "{0:.3f}s".format(total_time))
+        timings = Instrumentation.merge_summaries(test_result.timings for test_result in results["result"])
+        if timings:
+            lines.append("")
+            lines.append("Time spent by the tests in each activity (concurrent activity may total more than the "
+                         "time taken):")
+            lines += Instrumentation.format_summary(timings)
+        formatted = "\r\n".join(lines) + "\r\n"
     return formatted
 
 
+def get_profile_directory(args):
+    """Returns the directory to write profiles to if profiling was requested, next to the results file if any"""
+    if not getattr(args, "profile", False):
+        return None
+    if args.output and "." in args.output:
+        return os.path.splitext(args.output)[0] + "-profile"
+    return "{}-profile-{}".format(args.suite, datetime.now().strftime("%Y%m%dT%H%M%S"))
+
+
+def open_result_sinks(args):
+    """Open the ResultSink to stream results to as each test completes, if one was requested"""
+    if not getattr(args, "stream_output", None):
+        return []
+    return [open_result_sink(args.stream_output, args.ignore)]
+
+
 def identify_exit_code(results, args):
     exit_code = ExitCodes.OK
     for test_result in results["result"]:
@@ -984,6 +640,8 @@ def identify_exit_code(results, args):
 
 
 def write_test_results(results, endpoints, args):
+    from junit_xml import TestSuite
+
     if args.output.endswith(".xml"):
         formatted = format_test_results(results, endpoints, "junit", args)
     else:
@@ -1032,6 +690,11 @@ def parse_arguments():
                               help="space separated test names to ignore the results from")
     suite_parser.add_argument('--output', default=DEFAULT_ARGS["output"],
                               help="filename to save test results to (ending .xml or .json), otherwise print to stdout")
+    suite_parser.add_argument('--stream-output', default=DEFAULT_ARGS["stream_output"],
+                              help="filename (ending .xml for JUnit, otherwise NDJSON) or tcp://<host>:<port> to "
+                                   "write each test result to as soon as it is produced")
+    suite_parser.add_argument('--profile', action='store_true', default=DEFAULT_ARGS["profile"],
+                              help="profile each test, writing the profiles to a directory next to the output file")
 
     return parser.parse_args()
 
@@ -1051,14 +714,14 @@ def validate_args(args, access_type="cli"):
             msg = "ERROR: The requested test suite '{}' does not exist".format(args.suite)
             return_type = ExitCodes.ERROR
         elif args.list_tests:
-            tests = enumerate_tests(TEST_DEFINITIONS[args.suite]["class"])
+            tests = enumerate_tests(get_test_class(args.suite))
             for test_name in tests:
                 msg += test_name + '\n'
         elif args.describe_tests:
-            tests = enumerate_tests(TEST_DEFINITIONS[args.suite]["class"], describe=True)
+            tests = enumerate_tests(get_test_class(args.suite), describe=True)
             for test_description in tests:
                 msg += test_description + '\n'
-        elif getattr(args, "selection", "all") not in enumerate_tests(TEST_DEFINITIONS[args.suite]["class"]):
+        elif getattr(args, "selection", "all") not in enumerate_tests(get_test_class(args.suite)):
             msg = "ERROR: Test with name '{}' does not exist in test suite '{}'".format(args.selection,
                                                                                         args.suite)
             return_type = ExitCodes.ERROR
@@ -1142,25 +805,59 @@ def start_web_servers():
         ctx.check_hostname = False
         ctx.verify_mode = ssl.CERT_NONE
 
-    web_threads = []
+    # Bind every port up front, so that any port which is already in use is reported immediately
+    sockets = {}
+    for app in FLASK_APPS:
+        port = app.config['PORT']
+        try:
+            sockets[port] = bind_web_server_socket(port)
+        except OSError as e:
+            print(" * ERROR: Web server could not start on port {}: {}".format(port, e.strerror))
+    if len(sockets) != len(FLASK_APPS):
+        for sock in sockets.values():
+            sock.close()
+        sys.exit(ExitCodes.ERROR)
+
+    ready_events = []
     for app in FLASK_APPS:
         port = app.config['PORT']
         secure = app.config['SECURE']
-        t = threading.Thread(target=app.run, kwargs={'host': '0.0.0.0', 'port': port, 'threaded': True,
-                                                     'ssl_context': ctx if secure else None,
-                                                     'request_handler': PortLoggingHandler})
+        server = make_server('0.0.0.0', port, app, threaded=True, request_handler=PortLoggingHandler,
+                             ssl_context=ctx if secure else None, fd=sockets[port].fileno())
+        # The server uses a duplicate of the listening socket
+        sockets[port].close()
+        ready = threading.Event()
+        t = threading.Thread(target=serve_web_server, args=(server, ready))
         t.daemon = True
         t.start()
-        web_threads.append(t)
+        ready_events.append((port, ready))
 
-    # Wait for all threads to get going
-    time.sleep(1)
-    for thread in web_threads:
-        if not thread.is_alive():
-            print(" * ERROR: One or more web servers could not start. The port may already be in use")
+    # Connections are queued from the moment each socket is listening, so this only waits for the threads to start
+    for port, ready in ready_events:
+        if not ready.wait(CONFIG.API_PROCESSING_TIMEOUT):
+            print(" * ERROR: Web server on port {} did not start".format(port))
             sys.exit(ExitCodes.ERROR)
 
 
+def bind_web_server_socket(port):
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    try:
+        if platform.system() != "Windows":
+            # As for the servers created by Flask, allow the port to be reused while old connections are in TIME_WAIT
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        sock.bind(('0.0.0.0', port))
+        sock.listen(socket.SOMAXCONN)
+    except OSError:
+        sock.close()
+        raise
+    return sock
+
+
+def serve_web_server(server, ready):
+    ready.set()
+    server.serve_forever()
+
+
 def run_noninteractive_tests(args):
     endpoints = []
     for i in range(len(args.host)):
@@ -1179,7 +876,8 @@ def run_noninteractive_tests(args):
         endpoints.append({"host": args.host[i], "port": args.port[i], "version": args.version[i],
                           "selector": selector, "urlpath": urlpath})
     try:
-        results = run_tests(args.suite, endpoints, [args.selection])
+        results = run_tests(args.suite, endpoints, [args.selection], open_result_sinks(args),
+                            get_profile_directory(args))
         if args.output:
             exit_code = write_test_results(results, endpoints, args)
         else:
@@ -1198,24 +896,66 @@ def get_package_name(requirement):
     return None
 
 
+def get_path_mtime(path):
+    try:
+        return os.path.getmtime(path)
+    except (OSError, TypeError):
+        return None
+
+
+def cached_dependency_check(check_name, environment, check):
+    """Run a dependency check, or reuse its cached result if the given description of the environment is unchanged"""
+    cache_file = os.path.join(CONFIG.CACHE_PATH, "dependencies.json")
+    key = hashlib.sha1(json.dumps(environment, sort_keys=True).encode("utf-8")).hexdigest()
+    try:
+        with open(cache_file) as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        cache = {}
+    if cache.get(check_name, {}).get("key") == key:
+        return cache[check_name]["result"]
+
+    result = check()
+    cache[check_name] = {"key": key, "result": result}
+    try:
+        os.makedirs(CONFIG.CACHE_PATH, exist_ok=True)
+        # Write atomically, since several instances of the testing tool may start at once
+        fd, temp_path = tempfile.mkstemp(dir=CONFIG.CACHE_PATH, suffix=".tmp")
+        with os.fdopen(fd, "w") as f:
+            json.dump(cache, f)
+        os.replace(temp_path, cache_file)
+    except OSError as e:
+        print(" * WARNING: Unable to cache dependency checks: {}".format(e))
+    return result
+
+
 def check_internal_requirements():
     corrections = {"gitpython": "git",
                    "pyopenssl": "OpenSSL",
-                   "websocket-client": "websocket",
                    "paho-mqtt": "paho",
                    "Flask-Cors": "flask_cors",
                    "pycryptodome": "Crypto"}
-    installed_pkgs = [pkg[1] for pkg in pkgutil.iter_modules()]
     with open("requirements.txt") as requirements_file:
-        for requirement in requirements_file.readlines():
+        requirements = requirements_file.readlines()
+
+    def find_missing_requirements():
+        missing = []
+        for requirement in requirements:
             requirement_name = get_package_name(requirement)
             if requirement_name in corrections:
                 corrected_req = corrections[requirement_name]
             else:
                 corrected_req = requirement_name.replace("-", "_")
-            if corrected_req not in installed_pkgs:
-                print(" * ERROR: Could not find Python requirement '{}'".format(requirement_name))
-                sys.exit(ExitCodes.ERROR)
+            if importlib.util.find_spec(corrected_req) is None:
+                missing.append(requirement_name)
+        return missing
+
+    # Installing or removing a package changes the modification time of its site-packages directory
+    environment = [sys.executable, sys.version, requirements,
+                   [(path, get_path_mtime(path)) for path in sys.path if os.path.isdir(path)]]
+    for requirement_name in cached_dependency_check("internal", environment, find_missing_requirements):
+        print(" * ERROR: Could not find Python requirement '{}'".format(requirement_name))
+        sys.exit(ExitCodes.ERROR)
 
 
 def check_external_requirements():
@@ -1223,13 +963,27 @@ def check_external_requirements():
         "sdpoker": ("sdpoker --version", "0.3.0"),
         "testssl": ("{} testssl/testssl.sh -v".format(shlex.quote(CONFIG.TEST_SSL_BASH)), "3.0.7")
     }
-    for dep_name, dep_ver in deps.items():
+
+    def get_version_output(dep_ver):
         try:
-            output = subprocess.check_output(dep_ver[0], stderr=subprocess.STDOUT, shell=True)
-            if dep_ver[1] not in str(output):
-                print(" * WARNING: Version of '{}' does not match the expected '{}'".format(dep_name, dep_ver[1]))
+            return str(subprocess.check_output(dep_ver[0], stderr=subprocess.STDOUT, shell=True))
         except subprocess.CalledProcessError:
+            return None
+
+    def get_versions():
+        # Each check spawns a process, so run them concurrently
+        with ThreadPoolExecutor(max_workers=len(deps)) as executor:
+            return dict(zip(deps, executor.map(get_version_output, deps.values())))
+
+    environment = [os.environ.get("PATH"), CONFIG.TEST_SSL_BASH,
+                   get_path_mtime(shutil.which("sdpoker")), get_path_mtime("testssl/testssl.sh")]
+    versions = cached_dependency_check("external", environment, get_versions)
+    for dep_name, dep_ver in deps.items():
+        output = versions.get(dep_name)
+        if output is None:
             print(" * WARNING: Could not find an installation of '{}'. Some tests will be disabled.".format(dep_name))
+        elif dep_ver[1] not in output:
+            print(" * WARNING: Version of '{}' does not match the expected '{}'".format(dep_name, dep_ver[1]))
 
 
 class ExitCodes(IntEnum):
@@ -1241,6 +995,7 @@ class ExitCodes(IntEnum):
 
 @core_app.route('/api', methods=["GET", "POST"])
 def api():
+    """Run a test suite, responding with the results once it completes"""
     if request.method == "GET":
         example_dict = {}
         example_dict["description"] = "An example of the body to POST to this endpoint might include:"
@@ -1253,34 +1008,105 @@ def api():
         example_dict["output"] = "xml"
         example_dict["ignore"] = ["test_23"]
         return jsonify(example_dict), 200
-    elif core_app.config['TEST_ACTIVE'] is not False:
-        return jsonify("""Error: A test is currently in progress.
-                        Please wait until it has completed or restart the testing tool."""), 400
+    request_args, data_format, error_response = parse_api_request()
+    if error_response:
+        return error_response
+    try:
+        results = run_api_tests(request_args, data_format)
+        return api_results_response(results, data_format)
+    except Exception as e:
+        print(e)
+        results = traceback.format_exc()
+        return results, 400
+
+
+@core_app.route('/api/start', methods=["POST"])
+def api_start():
+    """Start a test suite running in the background, responding immediately. Progress is published via /progress,
+    and the results are available from /api/results once it completes"""
+    request_args, data_format, error_response = parse_api_request()
+    if error_response:
+        return error_response
+    # Mark the test as active immediately, so that another run cannot start before this one gets going
+    core_app.config['TEST_ACTIVE'] = time.time()
+    API_RUN.clear()
+    API_RUN.update({"suite": request_args.suite, "state": "running", "data_format": data_format})
+    t = threading.Thread(target=run_api_tests_in_background, args=(request_args, data_format))
+    t.daemon = True
+    t.start()
+    return jsonify({"suite": request_args.suite, "state": "running",
+                    "progress": "/progress", "results": "/api/results"}), 202
+
+
+@core_app.route('/api/results', methods=["GET"])
+def api_results():
+    """Get the results of the test suite most recently started via /api/start"""
+    if not API_RUN:
+        return jsonify("Error: No test suite has been started via /api/start"), 404
+    if API_RUN["state"] == "running":
+        return jsonify({"suite": API_RUN["suite"], "state": "running", "progress": "/progress"}), 202
+    if API_RUN["state"] == "error":
+        return API_RUN["results"], 400
+    return api_results_response(API_RUN["results"], API_RUN["data_format"])
+
+
+@core_app.route('/progress', methods=["GET"])
+def progress():
+    """Stream the progress of test runs as Server-Sent Events"""
+    return Response(PROGRESS.stream(), mimetype="text/event-stream",
+                    headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"})
+
+
+@core_app.route('/metrics', methods=["GET"])
+def metrics():
+    """Get the metrics of the mock services and of the running test suite in the Prometheus text format"""
+    collected = [Metrics.MOCK_REQUESTS, Metrics.MOCK_REQUEST_DURATION, Metrics.MOCK_REGISTRY_HEARTBEATS]
+    collected += Metrics.collect_mock_registry_metrics()
+    collected += Metrics.collect_test_metrics(PROGRESS.get_current_run())
+    return Response(Metrics.format_metrics(collected), content_type=Metrics.CONTENT_TYPE)
+
+
+def parse_api_request():
+    """Parse and validate the body of a request to run a test suite via the API, returning the arguments, the data
+    format of the results and, if the request cannot be run, the response to it"""
+    if core_app.config['TEST_ACTIVE'] is not False:
+        return None, None, (jsonify("""Error: A test is currently in progress.
+                        Please wait until it has completed or restart the testing tool."""), 400)
     if not request.is_json:
-        return jsonify("Error: Request mimetype is not set to a JSON specific type with a valid JSON Body"), 400
+        return None, None, (jsonify("Error: Request mimetype is not set to a JSON specific type with a valid JSON "
+                                    "Body"), 400)
     if not request.get_json(silent=True):
-        return jsonify("Error: Ensure the body of the request is valid JSON and non-empty"), 400
+        return None, None, (jsonify("Error: Ensure the body of the request is valid JSON and non-empty"), 400)
     request_data = dict(DEFAULT_ARGS, **request.json)
     request_args = SimpleNamespace(**request_data)
     return_message, return_type = validate_args(request_args, access_type="http")
     if return_message:
         if return_type == ExitCodes.OK:
-            return jsonify(return_message.split('\n')), 200
+            return None, None, (jsonify(return_message.split('\n')), 200)
         else:
-            return jsonify(return_message), 400
+            return None, None, (jsonify(return_message), 400)
     data_format = request_args.output if request_args.output is not None else "json"
     if "." in data_format:
         filename, data_format = data_format.split(".")
+    return request_args, data_format, None
+
+
+def api_results_response(results, data_format):
+    if data_format == "json":
+        return jsonify(results), 200
+    else:
+        return results, 200, {"Content-Type": "text/xml; charset=utf-8"}
+
+
+def run_api_tests_in_background(args, data_format):
     try:
-        results = run_api_tests(request_args, data_format)
-        if data_format == "json":
-            return jsonify(results), 200
-        else:
-            return results, 200, {"Content-Type": "text/xml; charset=utf-8"}
+        results = run_api_tests(args, data_format)
+        API_RUN.update({"state": "complete", "results": results})
     except Exception as e:
         print(e)
-        results = traceback.format_exc()
-        return results, 400
+        API_RUN.update({"state": "error", "results": traceback.format_exc()})
+    finally:
+        core_app.config['TEST_ACTIVE'] = False
 
 
 @core_app.route('/config', methods=["GET", "PATCH"])
@@ -1304,6 +1130,8 @@ def config():
 
 
 def run_api_tests(args, data_format):
+    from junit_xml import TestSuite
+
     endpoints = []
     for i in range(len(args.host)):
         if args.port[i] == 0:
@@ -1316,7 +1144,8 @@ def run_api_tests(args, data_format):
             urlpath = args.urlpath[i]
         endpoints.append({"host": args.host[i], "port": args.port[i], "version": args.version[i],
                           "selector": selector, "urlpath": urlpath})
-    results = run_tests(args.suite, endpoints, [args.selection])
+    results = run_tests(args.suite, endpoints, [args.selection], open_result_sinks(args),
+                        get_profile_directory(args))
     if data_format == "xml":
         formatted_test_results = format_test_results(results, endpoints, "junit", args)
         return TestSuite.to_xml_string([formatted_test_results], prettyprint=True)
@@ -1327,6 +1156,12 @@ def run_api_tests(args, data_format):
 
 def main(args):
     global CMD_ARGS, DNS_SERVER, TOOL_VERSION
+
+    # Parse and validate command line arguments first, so that listing or describing the test suites doesn't wait
+    # for the dependency checks, or import every test suite
+    CMD_ARGS = parse_arguments()
+    validate_args(CMD_ARGS)
+
     # Check if we're testing unicast DNS discovery, and if so ensure we have elevated privileges
     if CONFIG.ENABLE_DNS_SD and CONFIG.DNS_SD_MODE == "unicast":
         is_admin = False
@@ -1345,13 +1180,15 @@ def main(args):
     check_internal_requirements()
     check_external_requirements()
 
-    # Parse and validate command line arguments
-    CMD_ARGS = parse_arguments()
-    validate_args(CMD_ARGS)
-
     # Download up to date versions of each API specification
     init_spec_cache()
 
+    import git
+    from zeroconf import Zeroconf
+    from .DNS import DNS
+    from .TestHelper import get_default_ip
+    from .mocks.Auth import PRIMARY_AUTH
+
     # Identify current testing tool version
     try:
         repo = git.Repo(".")
@@ -1359,18 +1196,29 @@ def main(args):
     except git.exc.InvalidGitRepositoryError:
         TOOL_VERSION = "Unknown"
 
-    # Start the DNS server
-    if CONFIG.ENABLE_DNS_SD and CONFIG.DNS_SD_MODE == "unicast":
-        DNS_SERVER = DNS()
-
-    # Advertise the primary mock Authorization server to allow the Node to find it
-    if CONFIG.ENABLE_AUTH and CONFIG.DNS_SD_MODE == "multicast":
+    def advertise_primary_auth():
         primary_auth_info = PRIMARY_AUTH.make_mdns_info()
         zc = Zeroconf()
         zc.register_service(primary_auth_info)
-
-    # Start the HTTP servers
-    start_web_servers()
+        return zc, primary_auth_info
+
+    # Start the DNS server, advertise the primary mock Authorization server to allow the Node to find it, and start
+    # the HTTP servers, concurrently since the mDNS advertisement in particular takes some time
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        dns_future = None
+        if CONFIG.ENABLE_DNS_SD and CONFIG.DNS_SD_MODE == "unicast":
+            dns_future = executor.submit(DNS)
+        auth_future = None
+        if CONFIG.ENABLE_AUTH and CONFIG.DNS_SD_MODE == "multicast":
+            auth_future = executor.submit(advertise_primary_auth)
+
+        create_mock_apps()
+        start_web_servers()
+
+        if dns_future:
+            DNS_SERVER = dns_future.result()
+        if auth_future:
+            zc, primary_auth_info = auth_future.result()
 
     print(" * Testing tool running on 'http://{}:{}'. Version '{}'"
           .format(get_default_ip(), core_app.config['PORT'], TOOL_VERSION))
@@ -12,9 +12,12 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import copy
 import time
 import functools
 import random
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from urllib.parse import urlparse
 from requests.compat import json
 
@@ -60,21 +63,6 @@ UTC_LEAP = [
     (63072000, 63072009),  # 1 Jan 1972, 10 leap seconds
 ]
 
-DEFAULT_ARGS = {
-    "list_suites": False,
-    "describe_suites": False,
-    "list_tests": False,
-    "describe_tests": False,
-    "host": [],
-    "port": [],
-    "version": [],
-    "selector": [],
-    "urlpath": [],
-    "ignore": [],
-    "output": None,
-    "selection": "all"
-}
-
 
 class NMOSUtils(object):
 
@@ -211,14 +199,14 @@ class NMOSUtils(object):
     def do_test_device_control(test, node_url, type, href, authorization):
         """At least one Device is showing the given control advertisement matching the API under test"""
 
-        valid, devices = TestHelper.do_request("GET", node_url + "devices")
+        valid, devices = NodeResourceSnapshot.for_node(node_url).get("devices")
         if not valid:
-            return test.FAIL("Node API did not respond as expected: {}".format(devices))
+            return test.FAIL(devices)
 
         found_type = False
         found_api = False
         try:
-            for device in devices.json():
+            for device in devices:
                 controls = device["controls"]
                 for control in controls:
                     if control["type"] == type:
@@ -226,8 +214,6 @@ class NMOSUtils(object):
                         if NMOSUtils.compare_urls(href, control["href"]) and \
                                 authorization is control.get("authorization", False):
                             found_api = True
-        except json.JSONDecodeError:
-            return test.FAIL("Non-JSON response returned from Node API")
         except KeyError:
             return test.FAIL("One or more Devices were missing the 'controls' attribute")
 
@@ -238,3 +224,138 @@ class NMOSUtils(object):
                              "API under test")
         else:
             return test.FAIL("Unable to find any Devices which expose the control type '{}'".format(type))
+
+
+class NodeResourceSnapshot(object):
+    """
+    Snapshot of the resources of a Node API, shared by the test suites and utilities during a test run.
+    All the resource types are fetched concurrently on first use, and are indexed by ID and by the foreign keys
+    which reference their parent resources. Tests which change the state of a resource can invalidate a resource
+    type, or refresh a single resource. Callers receive copies of the resources, so they may modify them freely.
+    """
+    RESOURCE_TYPES = ["self", "devices", "sources", "flows", "senders", "receivers"]
+
+    FOREIGN_KEYS = {
+        "devices": ["node_id"],
+        "sources": ["device_id"],
+        "flows": ["device_id", "source_id"],
+        "senders": ["device_id", "flow_id"],
+        "receivers": ["device_id"]
+    }
+
+    _snapshots = {}
+    _snapshots_lock = threading.Lock()
+
+    @classmethod
+    def for_node(cls, node_url):
+        """Get the snapshot of the Node API at the given URL, creating it if necessary"""
+        with cls._snapshots_lock:
+            if node_url not in cls._snapshots:
+                cls._snapshots[node_url] = cls(node_url)
+            return cls._snapshots[node_url]
+
+    @classmethod
+    def reset_all(cls):
+        """Discard the snapshots of every Node API, e.g. at the start of a test run"""
+        with cls._snapshots_lock:
+            cls._snapshots = {}
+
+    def __init__(self, node_url):
+        self.node_url = node_url
+        self.lock = threading.RLock()
+        # resource type -> (valid, list of resources or error message)
+        self.resources = {}
+        # resource type -> resource ID -> resource
+        self.by_id = {}
+        # resource type -> foreign key -> foreign key value -> list of resources
+        self.by_foreign_key = {}
+
+    def get(self, resource_type):
+        """Get all the resources of the given type, or the Node's self resource, as a (valid, result) tuple, where
+        result is the resources or an error message. Any resource types not already in the snapshot are fetched."""
+        assert resource_type in self.RESOURCE_TYPES
+
+        with self.lock:
+            valid, result = self._load(resource_type)
+            if valid and resource_type == "self":
+                return True, copy.deepcopy(result[0])
+            return valid, copy.deepcopy(result)
+
+    def get_by_id(self, resource_type, resource_id):
+        """Get the resource of the given type with the given ID, or None if it is not in the snapshot"""
+        with self.lock:
+            valid, _ = self._load(resource_type)
+            return copy.deepcopy(self.by_id[resource_type].get(resource_id)) if valid else None
+
+    def find(self, resource_type, foreign_key, value):
+        """Get the resources of the given type which reference the given parent resource ID, e.g. the Senders of
+        a Device using find("senders", "device_id", device_id)"""
+        with self.lock:
+            valid, _ = self._load(resource_type)
+            return copy.deepcopy(self.by_foreign_key[resource_type][foreign_key].get(value, [])) if valid else []
+
+    def invalidate(self, resource_type=None):
+        """Discard the given resource type, or all resource types, so that it is fetched again when next used"""
+        with self.lock:
+            for _ in [resource_type] if resource_type else self.RESOURCE_TYPES:
+                self.resources.pop(_, None)
+
+    def refresh(self, resource_type, resource_id):
+        """Fetch a single resource which is known to have changed state, updating the snapshot, and returning it as
+        a (valid, result) tuple, where result is the resource or an error message"""
+        valid, response = TestHelper.do_request("GET", self.node_url + resource_type + "/" + resource_id)
+        if not valid:
+            return False, "Node API did not respond as expected: {}".format(response)
+        if response.status_code != 200:
+            return False, "Node API returned an unexpected response for {} {}: {}".format(
+                resource_type.rstrip("s").capitalize(), resource_id, response.status_code)
+        try:
+            resource = response.json()
+        except json.JSONDecodeError:
+            return False, "Non-JSON response returned from Node API"
+
+        with self.lock:
+            if self.resources.get(resource_type, (False, None))[0]:
+                resources = [resource if _.get("id") == resource_id else _ for _ in self.resources[resource_type][1]]
+                if resource_id not in self.by_id[resource_type]:
+                    resources.append(resource)
+                self._store(resource_type, True, resources)
+        return True, copy.deepcopy(resource)
+
+    def _load(self, resource_type):
+        """Fetch any resource types not already in the snapshot, returning the stored (valid, result) of the given
+        resource type. Must be called with the lock held"""
+        missing = [_ for _ in self.RESOURCE_TYPES if _ not in self.resources]
+        if missing:
+            with ThreadPoolExecutor(max_workers=len(missing)) as executor:
+                for missing_type, result in zip(missing, executor.map(self._fetch, missing)):
+                    self._store(missing_type, *result)
+        return self.resources[resource_type]
+
+    def _fetch(self, resource_type):
+        valid, response = TestHelper.do_request("GET", self.node_url + resource_type)
+        if not valid:
+            return False, "Node API did not respond as expected: {}".format(response)
+        if response.status_code != 200:
+            return False, "Node API returned an unexpected response for {}: {}".format(
+                resource_type, response.status_code)
+        try:
+            resources = response.json()
+        except json.JSONDecodeError:
+            return False, "Non-JSON response returned from Node API"
+        if resource_type == "self":
+            resources = [resources]
+        if not isinstance(resources, list) or not all(isinstance(_, dict) for _ in resources):
+            return False, "Node API returned an unexpected response for {}".format(resource_type)
+        return True, resources
+
+    def _store(self, resource_type, valid, result):
+        self.resources[resource_type] = (valid, result)
+        if not valid:
+            return
+        self.by_id[resource_type] = {_.get("id"): _ for _ in result}
+        self.by_foreign_key[resource_type] = {}
+        for foreign_key in self.FOREIGN_KEYS.get(resource_type, []):
+            index = self.by_foreign_key[resource_type][foreign_key] = {}
+            for resource in result:
+                index.setdefault(resource.get(foreign_key), []).append(resource)
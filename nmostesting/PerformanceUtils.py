@@ -0,0 +1,103 @@
+# Copyright (C) 2026 Advanced Media Workflow Association
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import math
+import requests
+import time
+
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib.parse import urlparse
+
+from . import Config as CONFIG
+from . import Instrumentation
+from .Progress import PROGRESS
+
+
+def percentile(values, pct):
+    """Nearest-rank percentile of a list of values, or None if the list is empty"""
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = max(int(math.ceil(pct / 100.0 * len(ordered))), 1)
+    return ordered[rank - 1]
+
+
+def summarise_latencies(latencies):
+    """Summary statistics for a list of latencies in seconds"""
+    return {
+        "count": len(latencies),
+        "min": min(latencies) if latencies else None,
+        "p50": percentile(latencies, 50),
+        "p95": percentile(latencies, 95),
+        "p99": percentile(latencies, 99),
+        "max": max(latencies) if latencies else None
+    }
+
+
+def format_latencies(latencies):
+    """Human-readable summary of a list of latencies in seconds"""
+    summary = summarise_latencies(latencies)
+    if not summary["count"]:
+        return "no samples"
+    return "n={count}, p50={p50:.1f}ms, p95={p95:.1f}ms, p99={p99:.1f}ms, max={max:.1f}ms".format(
+        count=summary["count"],
+        **{key: summary[key] * 1000 for key in ["p50", "p95", "p99", "max"]}
+    )
+
+
+class HTTPClientPool(object):
+    """
+    Pooled HTTP client for making many concurrent requests against an API under test.
+    Unlike TestHelper.do_request, connections are kept alive and shared between requests.
+    """
+
+    def __init__(self, concurrency):
+        self.concurrency = concurrency
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=concurrency, pool_maxsize=concurrency)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.executor = ThreadPoolExecutor(max_workers=concurrency)
+
+    def request(self, method, url, headers=None, **kwargs):
+        """
+        Perform an HTTP request, returning a Boolean indicating whether a response was received,
+        the response or an error message, and the request latency in seconds
+        """
+        if not headers:
+            headers = {}
+        if "Authorization" not in headers and CONFIG.ENABLE_AUTH and CONFIG.AUTH_TOKEN:
+            headers["Authorization"] = "Bearer " + CONFIG.AUTH_TOKEN
+        headers["Origin"] = "null"
+
+        PROGRESS.request(method, url)
+        start_time = time.time()
+        try:
+            with Instrumentation.measure(Instrumentation.HTTP, urlparse(url).netloc):
+                response = self.session.request(method, url, headers=headers, timeout=CONFIG.HTTP_TIMEOUT,
+                                                verify=CONFIG.CERT_TRUST_ROOT_CA, **kwargs)
+                # Consume the body within the measured latency
+                response.content
+            return True, response, time.time() - start_time
+        except requests.exceptions.RequestException as e:
+            return False, str(e), time.time() - start_time
+
+    def submit(self, method, url, **kwargs):
+        """Perform an HTTP request on the pool, returning a Future for the result of request()"""
+        return self.executor.submit(self.request, method, url, **kwargs)
+
+    def close(self):
+        self.executor.shutdown(wait=True)
+        self.session.close()
@@ -0,0 +1,124 @@
+# Copyright (C) 2026 Advanced Media Workflow Association
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import cProfile
+import os
+import re
+import sys
+import threading
+
+from collections import Counter
+
+from . import Config as CONFIG
+
+
+def get_frame_label(frame):
+    code = frame.f_code
+    return "{}:{}".format(os.path.basename(code.co_filename), getattr(code, "co_qualname", code.co_name))
+
+
+def get_thread_label(thread_name):
+    # Group threads which differ only by number, such as the threads handling requests to the mock servers
+    return re.sub(r"-\d+", "", thread_name)
+
+
+def write_folded_stacks(path, stacks):
+    """Write stack samples in the 'folded' format read by flame graph tools, e.g. FlameGraph and speedscope"""
+    with open(path, "w") as f:
+        for stack, count in sorted(stacks.items()):
+            f.write("{} {}\n".format(stack, count))
+
+
+class StackSampler(threading.Thread):
+    """
+    Samples the stacks of every other thread at PROFILE_SAMPLE_INTERVAL, counting the samples of each stack
+    """
+    def __init__(self):
+        threading.Thread.__init__(self, name="profile-sampler", daemon=True)
+        self.lock = threading.Lock()
+        self.stopped = threading.Event()
+        self.stacks = Counter()
+
+    def run(self):
+        while not self.stopped.wait(CONFIG.PROFILE_SAMPLE_INTERVAL):
+            thread_names = {thread.ident: thread.name for thread in threading.enumerate()}
+            samples = Counter()
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id == self.ident:
+                    continue
+                labels = []
+                while frame is not None:
+                    labels.append(get_frame_label(frame))
+                    frame = frame.f_back
+                labels.append(get_thread_label(thread_names.get(thread_id, "unknown")))
+                samples[";".join(reversed(labels))] += 1
+            with self.lock:
+                self.stacks.update(samples)
+
+    def take(self):
+        """Returns the samples since the last call"""
+        with self.lock:
+            stacks, self.stacks = self.stacks, Counter()
+        return stacks
+
+    def stop(self):
+        self.stopped.set()
+        self.join()
+
+
+class SuiteProfiler(object):
+    """
+    Profiles each test of a test suite run, writing to the given directory:
+    - <index>-<test>.prof, a deterministic profile of the thread running the test, readable by pstats or snakeviz
+    - <index>-<test>.folded, stack samples of every thread, including the mock servers, for a flame graph
+    - all.folded, the stack samples of the whole test suite run
+    """
+    def __init__(self, directory):
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+        self.sampler = StackSampler()
+        self.all_stacks = Counter()
+        self.index = 0
+        self.test_name = None
+        self.profile = None
+
+    def start(self):
+        self.sampler.start()
+
+    def start_test(self, test_name):
+        # In case the previous test was interrupted
+        self.stop_test()
+        self.index += 1
+        self.test_name = test_name
+        self.all_stacks.update(self.sampler.take())
+        self.profile = cProfile.Profile()
+        self.profile.enable()
+
+    def stop_test(self):
+        if self.profile is None:
+            return
+        self.profile.disable()
+        path = os.path.join(self.directory, "{:03d}-{}".format(self.index, self.test_name))
+        self.profile.dump_stats(path + ".prof")
+        self.profile = None
+        stacks = self.sampler.take()
+        self.all_stacks.update(stacks)
+        write_folded_stacks(path + ".folded", stacks)
+
+    def stop(self):
+        self.stop_test()
+        self.sampler.stop()
+        self.all_stacks.update(self.sampler.take())
+        write_folded_stacks(os.path.join(self.directory, "all.folded"), self.all_stacks)
+        print(" * Profiles written to directory: {}".format(self.directory))
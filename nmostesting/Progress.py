@@ -0,0 +1,141 @@
+# Copyright (C) 2026 Advanced Media Workflow Association
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import queue
+import threading
+import time
+
+from collections import deque
+
+from . import Config as CONFIG
+from .ResultSink import ResultSink, format_result
+
+# Maximum number of events of the current run replayed to a new subscriber
+PROGRESS_HISTORY_LENGTH = 1000
+
+# Interval in seconds between keep-alive comments on an idle event stream, so that proxies don't time it out
+PROGRESS_KEEPALIVE_INTERVAL = 15
+
+
+class ProgressChannel(object):
+    """
+    Publishes the progress of test runs to any number of subscribers, e.g. Server-Sent Events clients.
+    The events of the current run are kept so that a subscriber which connects part way through a run catches up,
+    and discarded once the run finishes, so that a subscriber which connects between runs isn't sent the last one.
+    """
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.subscribers = []
+        self.history = deque(maxlen=PROGRESS_HISTORY_LENGTH)
+        self.next_id = 1
+        self.last_request_time = 0
+        # The suite and test which are running, if any
+        self.current_run = None
+
+    def publish(self, event_type, data, keep=True):
+        """Publish an event to every subscriber, keeping it for later subscribers unless keep is False"""
+        with self.lock:
+            if event_type == "run-started":
+                self.history.clear()
+            event = (self.next_id, event_type, dict(data, timestamp=time.time()))
+            self.next_id += 1
+            self._update_current_run(event_type, event[2])
+            if event_type == "run-finished":
+                self.history.clear()
+            elif keep:
+                self.history.append(event)
+            for subscriber in self.subscribers:
+                subscriber.put(event)
+
+    def _update_current_run(self, event_type, data):
+        if event_type == "run-started":
+            self.current_run = {"suite": data["suite"], "start_time": data["timestamp"], "completed": 0}
+        elif event_type == "run-finished":
+            self.current_run = None
+        elif self.current_run and event_type == "test-started":
+            self.current_run.update({"test": data["test"], "test_start_time": data["timestamp"]})
+        elif self.current_run and event_type == "test-finished":
+            self.current_run.update({"test": None, "test_start_time": None, "completed": data["completed"]})
+
+    def get_current_run(self):
+        """Returns the suite and test which are running, their start times and the number of tests completed"""
+        with self.lock:
+            return dict(self.current_run) if self.current_run else None
+
+    def request(self, method, url):
+        """Publish the HTTP request being made, at most once every PROGRESS_REQUEST_INTERVAL seconds, since a test may
+        make thousands of requests"""
+        now = time.time()
+        with self.lock:
+            if not self.subscribers or now - self.last_request_time < CONFIG.PROGRESS_REQUEST_INTERVAL:
+                return
+            self.last_request_time = now
+        self.publish("request", {"method": method.upper(), "url": url}, keep=False)
+
+    def subscribe(self):
+        """Returns a queue of events, beginning with those of the current run, if any"""
+        subscriber = queue.Queue()
+        with self.lock:
+            for event in self.history:
+                subscriber.put(event)
+            self.subscribers.append(subscriber)
+        return subscriber
+
+    def unsubscribe(self, subscriber):
+        with self.lock:
+            self.subscribers.remove(subscriber)
+
+    def stream(self):
+        """Generate a Server-Sent Events stream of the events, until the client disconnects"""
+        subscriber = self.subscribe()
+        try:
+            while True:
+                try:
+                    event_id, event_type, data = subscriber.get(timeout=PROGRESS_KEEPALIVE_INTERVAL)
+                except queue.Empty:
+                    yield ": keep-alive\n\n"
+                    continue
+                yield "id: {}\nevent: {}\ndata: {}\n\n".format(event_id, event_type, json.dumps(data))
+        finally:
+            self.unsubscribe(subscriber)
+
+
+class ProgressSink(ResultSink):
+    """
+    Publishes the start and end of a test run, and of each test in it, to a ProgressChannel
+    """
+    def __init__(self, channel, ignored_tests=None):
+        ResultSink.__init__(self, ignored_tests)
+        self.channel = channel
+        self.start_time = None
+
+    def _start(self, suite_name, urls, endpoints):
+        self.start_time = time.time()
+        self.channel.publish("run-started", {"suite": self.suite, "name": suite_name, "urls": urls})
+
+    def _test_started(self, test_name):
+        self.channel.publish("test-started", {"suite": self.suite, "test": test_name, "completed": self.count,
+                                              "elapsed": time.time() - self.start_time})
+
+    def _add(self, test_result):
+        self.channel.publish("test-finished", dict(format_result(test_result, self.ignored_tests), suite=self.suite,
+                                                   completed=self.count, elapsed=time.time() - self.start_time))
+
+    def _finish(self, complete):
+        self.channel.publish("run-finished", {"suite": self.suite, "complete": complete, "completed": self.count,
+                                              "elapsed": time.time() - self.start_time})
+
+
+PROGRESS = ProgressChannel()
@@ -0,0 +1,215 @@
+# Copyright (C) 2026 Advanced Media Workflow Association
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import os
+import socket
+import tempfile
+import threading
+import time
+
+from urllib.parse import urlparse
+
+from .TestResult import TestStates
+
+# States reported as skipped, rather than as failures or errors, in JUnit output
+JUNIT_SKIPPED_STATES = [
+    TestStates.DISABLED,
+    TestStates.UNCLEAR,
+    TestStates.MANUAL,
+    TestStates.NA,
+    TestStates.OPTIONAL
+]
+
+
+def format_result(test_result, ignored_tests=[]):
+    """Format a TestResult as it appears in the JSON output"""
+    formatted = {
+        "name": test_result.name,
+        "state": str(TestStates.DISABLED if test_result.name in ignored_tests else test_result.state),
+        "detail": test_result.detail,
+        "duration": test_result.elapsed_time,
+        "description": test_result.description
+    }
+    if test_result.metrics:
+        formatted["metrics"] = test_result.metrics
+    if test_result.timings:
+        formatted["timings"] = test_result.timings
+    return formatted
+
+
+def make_junit_test_case(test_result, suite, ignored_tests=[]):
+    """Make a junit_xml TestCase from a TestResult, with any metrics and timings as JSON system output"""
+    from junit_xml import TestCase
+
+    output = {}
+    if test_result.metrics:
+        output["metrics"] = test_result.metrics
+    if test_result.timings:
+        output["timings"] = test_result.timings
+    test_case = TestCase(test_result.name, classname=suite,
+                         elapsed_sec=test_result.elapsed_time, timestamp=test_result.timestamp,
+                         stdout=json.dumps(output, sort_keys=True) if output else None)
+    if test_result.name in ignored_tests or test_result.state in JUNIT_SKIPPED_STATES:
+        test_case.add_skipped_info(test_result.detail)
+    elif test_result.state in [TestStates.WARNING, TestStates.FAIL]:
+        test_case.add_failure_info(test_result.detail, failure_type=str(test_result.state))
+    elif test_result.state != TestStates.PASS:
+        test_case.add_error_info(test_result.detail, error_type=str(test_result.state))
+    return test_case
+
+
+class ResultSink(object):
+    """
+    Receives each TestResult as soon as it is produced, so that results can be followed while a test suite runs, and
+    the results so far survive a test suite which is interrupted.
+    A sink which fails, e.g. because its destination has gone away, is disabled without affecting the test suite.
+    """
+    def __init__(self, ignored_tests=None):
+        self.ignored_tests = ignored_tests or []
+        self.suite = None
+        self.count = 0
+        self.failed = False
+        self.finished = False
+        self.lock = threading.Lock()
+
+    def start(self, suite, suite_name, urls, endpoints):
+        """Begin the results of a run of the given test suite"""
+        self.suite = suite
+        self._call(self._start, suite_name, urls, endpoints)
+
+    def test_started(self, test_name):
+        """Note that a test has started"""
+        self._call(self._test_started, test_name)
+
+    def add(self, test_result):
+        """Add a result, as it is produced"""
+        if test_result is None:
+            # Reported once the test suite completes
+            return
+        self.count += 1
+        self._call(self._add, test_result)
+
+    def finish(self, complete=True):
+        """End the results of the run, which may not have completed, and release the destination. Only the first
+        call has any effect"""
+        if self.finished:
+            return
+        self.finished = True
+        self._call(self._finish, complete)
+        self._call(self._close)
+
+    def _call(self, method, *args):
+        with self.lock:
+            if self.failed:
+                return
+            try:
+                method(*args)
+            except OSError as e:
+                self.failed = True
+                print(" * WARNING: Unable to stream test results: {}".format(e))
+
+    def _start(self, suite_name, urls, endpoints):
+        pass
+
+    def _test_started(self, test_name):
+        pass
+
+    def _add(self, test_result):
+        pass
+
+    def _finish(self, complete):
+        pass
+
+    def _close(self):
+        pass
+
+
+class NDJSONResultSink(ResultSink):
+    """
+    Writes newline-delimited JSON, to a file or to a 'tcp://<host>:<port>' destination, flushing each line as it is
+    written. The first line describes the run, each following line is a result in the form used by the JSON output,
+    and the last line records whether the run completed.
+    """
+    def __init__(self, destination, ignored_tests=None):
+        ResultSink.__init__(self, ignored_tests)
+        self.connection = None
+        url = urlparse(destination)
+        if url.scheme == "tcp":
+            self.connection = socket.create_connection((url.hostname, url.port))
+            self.stream = self.connection.makefile("w", encoding="utf-8", newline="\n")
+        else:
+            self.stream = open(destination, "w", encoding="utf-8", newline="\n")
+        self.start_time = None
+
+    def _write(self, line):
+        self.stream.write(json.dumps(line, sort_keys=True) + "\n")
+        self.stream.flush()
+
+    def _start(self, suite_name, urls, endpoints):
+        self.start_time = time.time()
+        self._write({"type": "start", "suite": self.suite, "name": suite_name, "urls": urls, "endpoints": endpoints,
+                     "timestamp": self.start_time})
+
+    def _add(self, test_result):
+        self._write(dict(format_result(test_result, self.ignored_tests), type="result"))
+
+    def _finish(self, complete):
+        self._write({"type": "end", "suite": self.suite, "complete": complete, "count": self.count,
+                     "timestamp": time.time()})
+
+    def _close(self):
+        self.stream.close()
+        if self.connection:
+            self.connection.close()
+
+
+class JUnitResultSink(ResultSink):
+    """
+    Writes a JUnit XML file, which is replaced after each result so that it is always a complete document
+    """
+    def __init__(self, path, ignored_tests=None):
+        ResultSink.__init__(self, ignored_tests)
+        self.path = path
+        self.suite_name = None
+        self.test_cases = []
+
+    def _start(self, suite_name, urls, endpoints):
+        self.suite_name = suite_name + ": " + ", ".join(urls)
+        self._write()
+
+    def _add(self, test_result):
+        self.test_cases.append(make_junit_test_case(test_result, self.suite, self.ignored_tests))
+        self._write()
+
+    def _write(self):
+        from junit_xml import TestSuite
+
+        # Replace the file atomically, so that a reader never sees a partially written document
+        directory = os.path.dirname(os.path.abspath(self.path))
+        fd, temp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as f:
+                TestSuite.to_file(f, [TestSuite(self.suite_name, self.test_cases)], prettyprint=True)
+            os.replace(temp_path, self.path)
+        except OSError:
+            os.remove(temp_path)
+            raise
+
+
+def open_result_sink(destination, ignored_tests=None):
+    """Open a JUnit sink for a destination ending '.xml', otherwise an NDJSON sink"""
+    if destination.endswith(".xml") and urlparse(destination).scheme != "tcp":
+        return JUnitResultSink(destination, ignored_tests)
+    return NDJSONResultSink(destination, ignored_tests)
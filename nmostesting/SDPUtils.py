@@ -0,0 +1,192 @@
+# Copyright (C) 2026 Advanced Media Workflow Association
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import functools
+import hashlib
+import os
+import re
+import subprocess
+import tempfile
+
+from concurrent.futures import ThreadPoolExecutor
+
+from . import Config as CONFIG
+from . import Instrumentation
+
+SDPOKER_MIN_VERSION = (0, 3, 0)
+
+# Session description lines are <type>=<value>, where <type> is exactly one case-significant character (RFC 4566)
+SDP_LINE_REGEX = re.compile(r"^([a-z])=(.*)$")
+
+# Sender types of SMPTE ST 2110-21, signalled by the 'TP' format parameter of video/raw media
+SHAPING_TP_VALUES = ["2110TPN", "2110TPNL", "2110TPW"]
+
+
+@functools.lru_cache(maxsize=None)
+def get_sdpoker_version():
+    """Returns the version of the installed SDPoker as a tuple of integers, or None if it is unavailable"""
+    try:
+        with Instrumentation.measure(Instrumentation.SUBPROCESS, "sdpoker"):
+            output = subprocess.check_output(["sdpoker", "--version"], stderr=subprocess.STDOUT)
+        return tuple(int(_) for _ in output.decode("utf-8").strip().split(".")[:3])
+    except (OSError, subprocess.CalledProcessError, ValueError):
+        return None
+
+
+def check_sdp_structure(sdp):
+    """Check the basic structure of an SDP file, and the ST 2110-21 shaping parameters of any video/raw media,
+    returning a list of errors"""
+    errors = []
+    lines = sdp.splitlines()
+    media = []
+    session_types = set()
+    for number, line in enumerate(lines, 1):
+        if not line.strip():
+            continue
+        match = SDP_LINE_REGEX.match(line.strip())
+        if not match:
+            errors.append("Line {}: expected <type>=<value> but found '{}'".format(number, line))
+            continue
+        line_type, value = match.groups()
+        if number == 1 and line.strip() != "v=0":
+            errors.append("Line 1: SDP file must start with 'v=0'")
+        if line_type == "o" and len(value.split()) != 6:
+            errors.append("Line {}: origin must have 6 fields but found '{}'".format(number, value))
+        if line_type == "m":
+            fields = value.split()
+            if len(fields) < 4:
+                errors.append("Line {}: media description must have at least 4 fields but found '{}'"
+                              .format(number, value))
+            media.append({"type": fields[0] if fields else None, "formats": {}})
+        elif not media:
+            session_types.add(line_type)
+        elif line_type == "a" and value.startswith(("rtpmap:", "fmtp:")):
+            attribute, _, parameters = value.partition(":")
+            payload_type, _, parameters = parameters.partition(" ")
+            media[-1]["formats"].setdefault(payload_type, {})[attribute] = (number, parameters)
+
+    for line_type in ["v", "o", "s", "t"]:
+        if line_type not in session_types:
+            errors.append("Missing required session-level '{}=' line".format(line_type))
+    if not media:
+        errors.append("Missing media description")
+    for media_description in media:
+        if media_description["type"] == "video":
+            errors += [error for media_format in media_description["formats"].values()
+                       for error in check_shaping(media_format)]
+    return errors
+
+
+def check_shaping(media_format):
+    """Check the ST 2110-21 'TP' parameter of a video/raw media format, returning a list of errors"""
+    if "rtpmap" not in media_format or not media_format["rtpmap"][1].lower().startswith("raw/"):
+        return []
+    number, parameters = media_format.get("fmtp", (media_format["rtpmap"][0], ""))
+    parameters = dict(_.strip().partition("=")[::2] for _ in parameters.split(";") if _.strip())
+    if parameters.get("TP") not in SHAPING_TP_VALUES:
+        return ["Line {}: video/raw format parameters must include a 'TP' of {}"
+                .format(number, ", ".join(SHAPING_TP_VALUES))]
+    return []
+
+
+def check_sdp_formatting(sdp):
+    """Check the line endings and whitespace of an SDP file, returning a list of warnings"""
+    warnings = []
+    if not sdp.endswith("\r\n"):
+        warnings.append("SDP file must end with CRLF")
+    lines = sdp.split("\r\n")[:-1] if sdp.endswith("\r\n") else sdp.split("\r\n")
+    for number, line in enumerate(lines, 1):
+        if "\n" in line or "\r" in line:
+            warnings.append("Line {}: lines must end with CRLF".format(number))
+            break
+        if not line:
+            warnings.append("Line {}: blank lines are not permitted".format(number))
+        elif line != line.strip() and line != "s= " and not line.endswith("; "):
+            # 's= ' is the recommended session name when there is none, and ST 2110 format parameters are
+            # conventionally terminated by '; '
+            warnings.append("Line {}: unexpected leading or trailing whitespace in '{}'".format(number, line))
+        elif len(line) > 2 and line[1] == "=" and line[2].isspace() and line != "s= ":
+            warnings.append("Line {}: unexpected whitespace after '=' in '{}'".format(number, line))
+    return warnings
+
+
+class SDPLinter(object):
+    """
+    Lints SDP files, checking the structure, shaping, whitespace and line ending rules in-process and running SDPoker
+    only for its deeper rules.
+    Identical SDP files are linted once, and up to SDP_LINT_MAX_PROCESSES SDPoker processes are run at a time.
+    """
+    def __init__(self, use_sdpoker=True):
+        self.use_sdpoker = use_sdpoker
+
+    def lint(self, sdp_files, strict=False):
+        """Lint SDP files, given a dict of key -> (SDP file contents, whether it describes duplicate RTP streams).
+        When strict, the whitespace, line ending and SHOULD rules are also checked.
+        Returns a dict of key -> (fatal, message) for the files which did not pass, in the order of sdp_files,
+        where fatal is False for a finding of only the strict rules."""
+        digests = {}
+        unique_files = {}
+        for key, (sdp, duplicate) in sdp_files.items():
+            digests[key] = (hashlib.sha256(sdp.encode("utf-8")).hexdigest(), duplicate)
+            unique_files.setdefault(digests[key], (sdp, duplicate))
+
+        findings = {}
+        sdpoker_files = {}
+        for digest, (sdp, duplicate) in unique_files.items():
+            errors = check_sdp_structure(sdp)
+            warnings = check_sdp_formatting(sdp) if strict else []
+            if errors:
+                findings[digest] = (True, "; ".join(errors))
+            elif warnings:
+                findings[digest] = (False, "; ".join(warnings))
+            elif self.use_sdpoker:
+                sdpoker_files[digest] = (sdp, duplicate)
+
+        findings.update(self._run_sdpoker(sdpoker_files, strict))
+
+        return {key: findings[digest] for key, digest in digests.items() if digest in findings}
+
+    def _run_sdpoker(self, sdp_files, strict):
+        """Run SDPoker concurrently on each SDP file, returning a dict of digest -> (fatal, message)"""
+        if not sdp_files:
+            return {}
+        # SDPoker only accepts a single file per invocation, so each file is a separate process
+        with tempfile.TemporaryDirectory() as temp_dir, \
+                ThreadPoolExecutor(max_workers=CONFIG.SDP_LINT_MAX_PROCESSES) as executor:
+            futures = {}
+            for index, (digest, (sdp, duplicate)) in enumerate(sdp_files.items()):
+                path = os.path.join(temp_dir, "{}.sdp".format(index))
+                with open(path, "w", encoding="utf-8", newline="") as f:
+                    f.write(sdp)
+                futures[digest] = executor.submit(self._sdpoker, path, duplicate, strict)
+            results = {digest: future.result() for digest, future in futures.items()}
+        return {digest: result for digest, result in results.items() if result}
+
+    def _sdpoker(self, path, duplicate, strict):
+        cmd = ["sdpoker", "--shaping", "true"]
+        if strict:
+            cmd += ["--whitespace", "true", "--should", "true", "--checkEndings", "true"]
+        if duplicate:
+            cmd += ["--duplicate", "true"]
+        cmd.append(path)
+        with Instrumentation.measure(Instrumentation.SUBPROCESS, "sdpoker"):
+            process = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
+        output = process.stdout.decode("utf-8")
+        if process.returncode != 0:
+            return (not strict, output)
+        if "Error" in output:
+            # This case exits with a zero error code
+            # These usually start with "{ StatusCodeError:" or "Error:"
+            return (True, output)
+        return None
@@ -0,0 +1,492 @@
+# Copyright (C) 2026 Advanced Media Workflow Association
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import functools
+import importlib
+
+from . import Config as CONFIG
+
+# Default values of the arguments which select and configure a test run
+DEFAULT_ARGS = {
+    "list_suites": False,
+    "describe_suites": False,
+    "list_tests": False,
+    "describe_tests": False,
+    "host": [],
+    "port": [],
+    "version": [],
+    "selector": [],
+    "urlpath": [],
+    "ignore": [],
+    "output": None,
+    "stream_output": None,
+    "profile": False,
+    "selection": "all"
+}
+
+# Definitions of each set of tests made available from the dropdowns.
+# Each test suite's module is only imported when its test class is first needed
+TEST_DEFINITIONS = {
+    "IS-04-01": {
+        "name": "IS-04 Node API",
+        "specs": [{
+            "spec_key": "is-04",
+            "api_key": "node"
+        }],
+        "extra_specs": [{
+            "spec_key": "bcp-002-01",
+            "api_key": "grouphint"
+        }, {
+            "spec_key": "bcp-002-02",
+            "api_key": "asset"
+        }, {
+            "spec_key": "bcp-004-01",
+            "api_key": "receiver-caps"
+        }, {
+            "spec_key": "nmos-parameter-registers",
+            "api_key": "caps-register"
+        }],
+        "module": "IS0401Test"
+    },
+    "IS-04-02": {
+        "name": "IS-04 Registry APIs",
+        "specs": [{
+            "spec_key": "is-04",
+            "api_key": "registration"
+        }, {
+            "spec_key": "is-04",
+            "api_key": "query"
+        }],
+        "module": "IS0402Test"
+    },
+    "IS-04-03": {
+        "name": "IS-04 Node API (Peer to Peer)",
+        "specs": [{
+            "spec_key": "is-04",
+            "api_key": "node"
+        }],
+        "module": "IS0403Test"
+    },
+    "IS-04-04": {
+        "name": "IS-04 Controller",
+        "specs": [{
+            "spec_key": "testing-facade",
+            "api_key": "testquestion"
+        }, {
+            "spec_key": "is-04",
+            "api_key": "query",
+            "disable_fields": ["host", "port"]
+        }],
+        "module": "IS0404Test"
+    },
+    "IS-04-05": {
+        "name": "IS-04 Registry Load Testing",
+        "specs": [{
+            "spec_key": "is-04",
+            "api_key": "registration"
+        }, {
+            "spec_key": "is-04",
+            "api_key": "query"
+        }],
+        "module": "IS0405Test"
+    },
+    "IS-04-06": {
+        "name": "IS-04 Query API Benchmarking",
+        "specs": [{
+            "spec_key": "is-04",
+            "api_key": "registration"
+        }, {
+            "spec_key": "is-04",
+            "api_key": "query"
+        }],
+        "module": "IS0406Test"
+    },
+    "IS-05-01": {
+        "name": "IS-05 Connection Management API",
+        "specs": [{
+            "spec_key": "is-05",
+            "api_key": "connection"
+        }],
+        "module": "IS0501Test"
+    },
+    "IS-05-02": {
+        "name": "IS-05 Interaction with IS-04",
+        "specs": [{
+            "spec_key": "is-04",
+            "api_key": "node"
+        }, {
+            "spec_key": "is-05",
+            "api_key": "connection"
+        }],
+        "module": "IS0502Test"
+    },
+    "IS-05-03": {
+        "name": "IS-05 Controller",
+        "specs": [{
+            "spec_key": "testing-facade",
+            "api_key": "testquestion"
+        }, {
+            "spec_key": "is-04",
+            "api_key": "query",
+            "disable_fields": ["host", "port"]
+        }, {
+            "spec_key": "is-05",
+            "api_key": "connection",
+            "disable_fields": ["host", "port"]
+        }],
+        "module": "IS0503Test"
+    },
+    "IS-06-01": {
+        "name": "IS-06 Network Control API",
+        "specs": [{
+            "spec_key": "is-06",
+            "api_key": "netctrl"
+        }],
+        "module": "IS0601Test"
+    },
+    "IS-07-01": {
+        "name": "IS-07 Event & Tally API",
+        "specs": [{
+            "spec_key": "is-07",
+            "api_key": "events"
+        }],
+        "module": "IS0701Test"
+    },
+    "IS-07-02": {
+        "name": "IS-07 Interaction with IS-04 and IS-05",
+        "specs": [{
+            "spec_key": "is-04",
+            "api_key": "node"
+        }, {
+            "spec_key": "is-05",
+            "api_key": "connection"
+        }, {
+            "spec_key": "is-07",
+            "api_key": "events"
+        }],
+        "module": "IS0702Test"
+    },
+    "IS-08-01": {
+        "name": "IS-08 Channel Mapping API",
+        "specs": [{
+            "spec_key": "is-08",
+            "api_key": "channelmapping"
+        }],
+        "module": "IS0801Test",
+        "selector": True
+    },
+    "IS-08-02": {
+        "name": "IS-08 Interaction with IS-04",
+        "specs": [{
+            "spec_key": "is-04",
+            "api_key": "node",
+            "disable_fields": ["selector"]
+        }, {
+            "spec_key": "is-08",
+            "api_key": "channelmapping"
+        }],
+        "module": "IS0802Test",
+        "selector": True
+    },
+    "IS-09-01": {
+        "name": "IS-09 System API",
+        "specs": [{
+            "spec_key": "is-09",
+            "api_key": "system"
+        }],
+        "module": "IS0901Test"
+    },
+    "IS-09-02": {
+        "name": "IS-09 System API Discovery",
+        "specs": [{
+            "spec_key": "is-04",
+            "api_key": "node",
+            "disable_fields": ["port", "version"]
+        }, {
+            "spec_key": "is-09",
+            "api_key": "system",
+            "disable_fields": ["host", "port"]
+        }],
+        "module": "IS0902Test"
+    },
+    # IS-10 testing is disabled until testing can be refactored to deal with commercial servers
+    # "IS-10-01": {
+    #     "name": "IS-10 Authorization API",
+    #     "specs": [{
+    #         "spec_key": "is-10",
+    #         "api_key": "auth"
+    #     }],
+    #     "module": "IS1001Test"
+    # },
+    "IS-11-01": {
+        "name": "IS-11 Stream Compatibility Management API",
+        "specs": [{
+            "spec_key": "is-11",
+            "api_key": "streamcompatibility"
+        }, {
+            "spec_key": "is-04",
+            "api_key": "node"
+        }, {
+            "spec_key": "is-05",
+            "api_key": "connection"
+        }],
+        "module": "IS1101Test"
+    },
+    "IS-12-01": {
+        "name": "IS-12 NMOS Control Protocol",
+        "specs": [{
+            "spec_key": "is-04",
+            "api_key": "node",
+            "disable_fields": ["urlpath"]
+        }, {
+            "spec_key": "is-12",
+            "api_key": "ncp",
+            "websocket": True,
+        }, {
+            "spec_key": "ms-05-02",
+            "api_key": "controlframework",
+            "disable_fields": ["host", "port", "urlpath"]
+        }, {
+            "spec_key": "testing-facade",
+            "api_key": "testquestion",
+            "disable_fields": ["urlpath"] if CONFIG.MS05_INTERACTIVE_TESTING else ["host", "port", "urlpath"]
+        }],
+        "extra_specs": [{
+            "spec_key": "nmos-control-feature-sets",
+            "api_key": "featuresets"
+        }],
+        "module": "IS1201Test",
+        "urlpath": True
+    },
+    "IS-12-02": {
+        "name": "IS-12 Notification Performance",
+        "specs": [{
+            "spec_key": "is-04",
+            "api_key": "node",
+            "disable_fields": ["urlpath"]
+        }, {
+            "spec_key": "is-12",
+            "api_key": "ncp",
+            "websocket": True,
+        }, {
+            "spec_key": "ms-05-02",
+            "api_key": "controlframework",
+            "disable_fields": ["host", "port", "urlpath"]
+        }],
+        "extra_specs": [{
+            "spec_key": "nmos-control-feature-sets",
+            "api_key": "featuresets"
+        }],
+        "module": "IS1202Test",
+        "urlpath": True
+    },
+    "IS-14-01": {
+        "name": "IS-14 Device Configuration",
+        "specs": [{
+            "spec_key": "is-04",
+            "api_key": "node",
+            "disable_fields": ["selector"]
+        }, {
+            "spec_key": "is-14",
+            "api_key": "configuration"
+        }, {
+            "spec_key": "ms-05-02",
+            "api_key": "controlframework",
+            "disable_fields": ["host", "port", "selector"]
+        }, {
+            "spec_key": "testing-facade",
+            "api_key": "testquestion",
+            "disable_fields": ["selector"] if CONFIG.MS05_INTERACTIVE_TESTING else ["host", "port", "selector"]
+        }],
+        "extra_specs": [{
+            "spec_key": "nmos-control-feature-sets",
+            "api_key": "featuresets"
+        }],
+        "module": "IS1401Test",
+        "selector": True
+    },
+    "BCP-003-01": {
+        "name": "BCP-003-01 Secure Communication",
+        "specs": [{
+            "spec_key": "bcp-003-01",
+            "api_key": "secure"
+        }],
+        "module": "BCP00301Test"
+    },
+    "BCP-005-01-01": {
+        "name": "BCP-005-01 EDID to Receiver Capabilities Mapping",
+        "specs": [{
+            "spec_key": "is-04",
+            "api_key": "node"
+        }],
+        "module": "BCP0050101Test"
+    },
+    "BCP-006-01-01": {
+        "name": "BCP-006-01 NMOS With JPEG XS",
+        "specs": [{
+            "spec_key": "is-04",
+            "api_key": "node"
+        }],
+        "extra_specs": [{
+            "spec_key": "nmos-parameter-registers",
+            "api_key": "flow-register"
+        }, {
+            "spec_key": "nmos-parameter-registers",
+            "api_key": "sender-register"
+        }],
+        "module": "BCP0060101Test"
+    },
+    "BCP-006-01-02": {
+        "name": "BCP-006-01 Controller",
+        "specs": [{
+            "spec_key": "testing-facade",
+            "api_key": "testquestion"
+        }, {
+            "spec_key": "is-04",
+            "api_key": "query",
+            "disable_fields": ["host", "port"]
+        }, {
+            "spec_key": "is-05",
+            "api_key": "connection",
+            "disable_fields": ["host", "port"]
+        }],
+        "module": "BCP0060102Test"
+    },
+    "BCP-007-03-01": {
+        "name": "BCP-007-03 NMOS With MXL",
+        "specs": [{
+            "spec_key": "is-04",
+            "api_key": "node"
+        }, {
+            "spec_key": "is-05",
+            "api_key": "connection"
+        }],
+        "extra_specs": [{
+            "spec_key": "bcp-004-01",
+            "api_key": "receiver-caps"
+        }, {
+            "spec_key": "nmos-parameter-registers",
+            "api_key": "caps-register"
+        }, {
+            "spec_key": "nmos-parameter-registers",
+            "api_key": "formats-register"
+        }, {
+            "spec_key": "nmos-parameter-registers",
+            "api_key": "media-types-register"
+        }, {
+            "spec_key": "bcp-007-03",
+            "api_key": "mxl-schemas"
+        }],
+        "module": "BCP0070301Test"
+    },
+    "BCP-007-03-02": {
+        "name": "BCP-007-03 Controller",
+        "specs": [{
+            "spec_key": "testing-facade",
+            "api_key": "testquestion"
+        }, {
+            "spec_key": "is-04",
+            "api_key": "query",
+            "disable_fields": ["host", "port"]
+        }, {
+            "spec_key": "is-05",
+            "api_key": "connection",
+            "disable_fields": ["host", "port"]
+        }],
+        "module": "BCP0070302Test"
+    },
+    "BCP-008-01-01": {
+        "name": "BCP-008-01 Receiver Status Monitoring",
+        "specs": [{
+            "spec_key": "is-04",
+            "api_key": "node",
+            "disable_fields": ["urlpath"]
+        }, {
+            "spec_key": "is-05",
+            "api_key": "connection",
+            "disable_fields": ["urlpath"]
+        }, {
+            "spec_key": "is-12",
+            "api_key": "ncp",
+            "websocket": True,
+        }, {
+            "spec_key": "ms-05-02",
+            "api_key": "controlframework",
+            "disable_fields": ["host", "port", "urlpath"]
+        }],
+        "extra_specs": [{
+            "spec_key": "nmos-control-feature-sets",
+            "api_key": "featuresets"
+        }, {
+            "spec_key": "bcp-008-01",
+            "api_key": "receivermonitor",
+            "disable_fields": ["host", "port", "urlpath"]
+        }],
+        "module": "BCP0080101Test",
+        "urlpath": True
+    },
+    "BCP-008-02-01": {
+        "name": "BCP-008-02 Sender Status Monitoring",
+        "specs": [{
+            "spec_key": "is-04",
+            "api_key": "node",
+            "disable_fields": ["urlpath"]
+        }, {
+            "spec_key": "is-05",
+            "api_key": "connection",
+            "disable_fields": ["urlpath"]
+        }, {
+            "spec_key": "is-12",
+            "api_key": "ncp",
+            "websocket": True,
+        }, {
+            "spec_key": "ms-05-02",
+            "api_key": "controlframework",
+            "disable_fields": ["host", "port", "urlpath"]
+        }],
+        "extra_specs": [{
+            "spec_key": "nmos-control-feature-sets",
+            "api_key": "featuresets"
+        }, {
+            "spec_key": "bcp-008-02",
+            "api_key": "sendermonitor",
+            "disable_fields": ["host", "port", "urlpath"]
+        }],
+        "module": "BCP0080201Test",
+        "urlpath": True
+    },
+    "BCP-006-04": {
+        "name": "BCP-006-04 NMOS With MPEG TS",
+        "specs": [{
+            "spec_key": "is-04",
+            "api_key": "node"
+        }],
+        "extra_specs": [{
+            "spec_key": "nmos-parameter-registers",
+            "api_key": "flow-register"
+        }, {
+            "spec_key": "nmos-parameter-registers",
+            "api_key": "sender-register"
+        }],
+        "module": "BCP00604Test"
+    }
+}
+
+
+@functools.lru_cache(maxsize=None)
+def get_test_class(test_id):
+    """Get the test class of a test suite, importing its module from nmostesting.suites on first use"""
+    module_name = TEST_DEFINITIONS[test_id]["module"]
+    module = importlib.import_module(".suites." + module_name, __package__)
+    return getattr(module, module_name)
@@ -18,14 +18,12 @@ import asyncio
 import ipaddress
 import threading
 import requests
-import websocket
 import websockets
 import ssl
 import os
 import jsonref
 import netifaces
 import paho.mqtt.client as mqtt
-from copy import deepcopy
 from pathlib import Path
 from enum import IntEnum
 from numbers import Number
@@ -36,6 +34,8 @@ from time import time
 from urllib.parse import urlparse
 
 from . import Config as CONFIG
+from . import Instrumentation
+from .Progress import PROGRESS
 
 
 class JsonType(IntEnum):
@@ -185,6 +185,7 @@ def is_ip_address(arg):
 def do_request(method, url, headers=None, **kwargs):
     """Perform a basic HTTP request with appropriate error handling"""
     response = None
+    PROGRESS.request(method, url)
     try:
         s = requests.Session()
 
@@ -202,7 +203,8 @@ def do_request(method, url, headers=None, **kwargs):
         req = requests.Request(method, url, headers={k: v for k, v in headers.items() if v is not None}, **kwargs)
         prepped = s.prepare_request(req)
         settings = s.merge_environment_settings(prepped.url, {}, None, CONFIG.CERT_TRUST_ROOT_CA, None)
-        response = s.send(prepped, timeout=CONFIG.HTTP_TIMEOUT, **settings)
+        with Instrumentation.measure(Instrumentation.HTTP, urlparse(prepped.url).netloc):
+            response = s.send(prepped, timeout=CONFIG.HTTP_TIMEOUT, **settings)
         if prepped.url.startswith("https://"):
             if not response.url.startswith("https://"):
                 return False, "Redirect changed protocol"
@@ -286,99 +288,213 @@ def check_content_type(headers, expected_type="application/json"):
     return True, ""
 
 
-class WebsocketWorker(threading.Thread):
-    """Websocket Client Worker Thread"""
+# Default maximum number of received messages buffered for each WebSocket client connection
+# before reading from the connection is paused
+WS_CLIENT_QUEUE_SIZE = 10000
 
-    class Message():
-        def __init__(self, message):
-            self.received_time = time()
-            self.message = message
 
-    def __init__(self, ws_href):
-        """
-        Initializer
-        :param ws_href: websocket url (string)
-        """
+class WebsocketMessage(object):
+    """A message received by a WebSocket client connection, and the time at which it was received"""
+    __slots__ = ["received_time", "message"]
+
+    def __init__(self, message):
+        self.received_time = time()
+        self.message = message
+
+
+class WebsocketClientHub(object):
+    """
+    Runs any number of WebSocket client connections on a single asyncio event loop in a background thread.
+    Use get_instance() to obtain the shared hub.
+    """
+    _instance = None
+    _instance_lock = Lock()
+
+    def __init__(self):
+        self.loop = asyncio.new_event_loop()
+        self.thread = threading.Thread(target=self.loop.run_forever, daemon=True)
+        self.thread.start()
+
+    @classmethod
+    def get_instance(cls):
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = cls()
+            return cls._instance
+
+    def run_coroutine(self, coro):
+        """Schedule a coroutine on the hub's event loop from any thread, returning a concurrent.futures.Future"""
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+    def connect(self, ws_href, max_queue=WS_CLIENT_QUEUE_SIZE):
+        """Open a WebSocket client connection, returning a WebsocketClientConnection without waiting for it to open"""
+        connection = WebsocketClientConnection(self, ws_href, max_queue)
+        self.run_coroutine(connection._start()).result()
+        return connection
+
+
+class WebsocketClientConnection(object):
+    """
+    A WebSocket client connection managed by a WebsocketClientHub.
+    Received messages are buffered in a bounded queue; when it is full, reading from the connection is paused.
+    """
+
+    def __init__(self, hub, ws_href, max_queue):
         if CONFIG.ENABLE_AUTH and CONFIG.AUTH_TOKEN and "access_token" not in ws_href:
             if "?" in ws_href:
                 ws_href += "&access_token={}".format(CONFIG.AUTH_TOKEN)
             else:
                 ws_href += "?access_token={}".format(CONFIG.AUTH_TOKEN)
-        threading.Thread.__init__(self, daemon=True)
+        self.hub = hub
         self.ws_href = ws_href
-        try:
-            self.ws = websocket.WebSocketApp(ws_href,
-                                             on_message=self.on_message,
-                                             on_close=self.on_close,
-                                             on_open=self.on_open,
-                                             on_error=self.on_error)
-        except AttributeError:
-            print(" * ERROR: You have the wrong Python websocket module installed. "
-                  "Please uninstall 'websocket' and install 'websocket-client'")
-            raise
-        self.messages = list()
-        self.error_occurred = False
+        self.max_queue = max_queue
         self.connected = False
+        self.error_occurred = False
         self.error_message = ""
-        self.mutex = Lock()
+        self.opened = threading.Event()
+        self.finished = threading.Event()
+        self._ws = None
+        self._queue = None
+        self._task = None
+
+    async def _start(self):
+        # The queue must be created on the hub's event loop
+        self._queue = asyncio.Queue(maxsize=self.max_queue)
+        self._task = asyncio.ensure_future(self._run())
+
+    async def _run(self):
+        url = urlparse(self.ws_href)
+        kwargs = {}
+        if url.scheme == "wss":
+            kwargs["ssl"] = ssl.create_default_context(cafile=CONFIG.CERT_TRUST_ROOT_CA)
+            # strip the trailing dot of the hostname to prevent SSL certificate hostname mismatch
+            kwargs["server_hostname"] = url.hostname.rstrip('.')
+        try:
+            # Don't limit message size or close the connection due to unanswered pings, like websocket-client
+            async with websockets.connect(self.ws_href, max_size=None, ping_interval=None, **kwargs) as ws:
+                self._ws = ws
+                self.connected = True
+                self.opened.set()
+                async for message in ws:
+                    await self._queue.put(WebsocketMessage(message))
+        except websockets.exceptions.ConnectionClosedOK:
+            pass
+        except asyncio.CancelledError:
+            pass
+        except Exception as e:
+            self.error_occurred = True
+            self.error_message = e
+        finally:
+            self.connected = False
+            self.opened.set()
+            self.finished.set()
+
+    def wait_for_open(self, timeout=None):
+        """Wait until the connection has been opened or has failed, returning whether it is open"""
+        with Instrumentation.measure(Instrumentation.WEBSOCKET):
+            self.opened.wait(timeout)
+        return self.connected
+
+    def is_open(self):
+        return self.connected
 
-    def run(self):
-        url = urlparse(self.ws.url)
-        # strip the trailing dot of the hostname to prevent SSL certificate hostname mismatch
-        hostname = url.hostname.rstrip('.')
-        # sslopt needs to be Falsey when not doing Secure WebSocket
-        sslopt = {"ca_certs": CONFIG.CERT_TRUST_ROOT_CA, "server_hostname": hostname} if url.scheme == "wss" else {}
-        self.ws.run_forever(sslopt=sslopt)
+    def send(self, message):
+        if self.connected:
+            self.hub.run_coroutine(self._ws.send(message)).result()
 
-    def on_open(self, ws):
-        self.connected = True
+    def close(self):
+        self.hub.run_coroutine(self._close()).result()
+        self.finished.wait()
 
-    def on_message(self, ws, message):
-        with self.mutex:
-            self.messages.append(WebsocketWorker.Message(message))
+    async def _close(self):
+        if self._ws is not None:
+            await self._ws.close()
+        # Also stop the connection if it is still opening, or paused because the queue is full
+        self._task.cancel()
 
-    def on_close(self, ws, close_status, close_message):
-        self.connected = False
+    async def get_async(self, timeout=None):
+        """Get the next WebsocketMessage, or None if none is received before the timeout, from any event loop"""
+        try:
+            if asyncio.get_event_loop() is self.hub.loop:
+                return await asyncio.wait_for(self._queue.get(), timeout)
+            return await asyncio.wrap_future(self.hub.run_coroutine(asyncio.wait_for(self._queue.get(), timeout)))
+        except asyncio.TimeoutError:
+            return None
+
+    def get(self, timeout=None):
+        """Get the next WebsocketMessage, or None if none is received before the timeout"""
+        try:
+            return self.hub.run_coroutine(asyncio.wait_for(self._queue.get(), timeout)).result()
+        except asyncio.TimeoutError:
+            return None
 
-    def on_error(self, ws, error):
-        self.error_occurred = True
-        self.error_message = error
-        self.connected = False
+    def get_all(self):
+        """Get all the WebsocketMessages which have been received and not yet read"""
+        return self.hub.run_coroutine(self._drain()).result()
+
+    async def _drain(self):
+        messages = []
+        while not self._queue.empty():
+            messages.append(self._queue.get_nowait())
+        return messages
+
+    def is_messages_received(self):
+        return not self._queue.empty()
+
+
+class WebsocketWorker(object):
+    """Websocket Client Worker, which uses a connection on the shared WebsocketClientHub"""
+
+    Message = WebsocketMessage
+
+    def __init__(self, ws_href):
+        """
+        Initializer
+        :param ws_href: websocket url (string)
+        """
+        self.ws_href = ws_href
+        self.connection = None
+
+    def start(self):
+        self.connection = WebsocketClientHub.get_instance().connect(self.ws_href)
 
     def close(self):
-        self.ws.close()
+        if self.connection:
+            self.connection.close()
 
     def send(self, message):
-        if self.connected is True:
-            self.ws.send(message)
+        if self.connection:
+            self.connection.send(message)
 
     def is_open(self):
-        return self.connected
+        return self.connection is not None and self.connection.is_open()
+
+    def wait_for_open(self, timeout=None):
+        return self.connection is not None and self.connection.wait_for_open(timeout)
 
     def get_messages(self):
-        with self.mutex:
-            msg_cpy = [m.message for m in self.messages]
-            self.messages.clear()  # Reset message list after reading
-        return msg_cpy
+        # Reset message list after reading
+        return [m.message for m in self.get_timestamped_messages()]
 
     def get_timestamped_messages(self):
-        with self.mutex:
-            msg_cpy = deepcopy(self.messages)
-            self.messages.clear()  # Reset message list after reading
-        return msg_cpy
+        # Reset message list after reading
+        return self.connection.get_all() if self.connection else []
+
+    def get_timestamped_message(self, timeout=None):
+        """Get the next message, or None if none is received before the timeout"""
+        return self.connection.get(timeout) if self.connection else None
 
     def did_error_occur(self):
-        return self.error_occurred
+        return self.connection is not None and self.connection.error_occurred
 
     def get_error_message(self):
-        return self.error_message
+        return self.connection.error_message if self.connection else ""
 
     def is_messages_received(self):
-        return len(self.messages) > 0
+        return self.connection is not None and self.connection.is_messages_received()
 
     def clear_messages(self):
-        with self.mutex:
-            self.messages.clear()
+        self.get_timestamped_messages()
 
 
 class MQTTClientWorker:
@@ -470,76 +586,185 @@ class MQTTClientWorker:
         print("MQTT log: {}: {}".format(level, buf))
 
 
-class SubscriptionWebsocketWorker(threading.Thread):
-    """Subscription Server Worker Thread"""
+# Default maximum number of messages buffered for each client of a subscription WebSocket
+# before further messages to that client are dropped
+WS_SERVER_SEND_QUEUE_SIZE = 1000
 
-    async def consumer_handler(self, websocket, path):
-        async for message in websocket:
-            # ignore incoming websocket messages
-            pass
 
-    async def producer_handler(self, websocket, path):
-        # handle multiple client connections per socket
-        self._connected_clients.add(websocket)
+class SubscriptionWebsocketClient(object):
+    """A client connected to a subscription WebSocket, with its own bounded send buffer"""
 
-        # when websocket client first connects we immediately queue a 'sync' data grain message to be sent
-        self._loop.call_soon_threadsafe(self.queue_sync_data_grain_callback, self._resource_type)
+    def __init__(self, websocket, max_queue):
+        self.websocket = websocket
+        self.queue = asyncio.Queue(maxsize=max_queue)
+        # Messages broadcast while the client is waiting for its initial sync message
+        self.backlog = []
+        self.syncing = True
+        self.sent = 0
+        self.dropped = 0
+        self.max_queue_depth = 0
 
-        # will automatically exit loop when websocket client disconnects or server closed
+    def put(self, message):
+        if self.syncing:
+            self.backlog.append(message)
+            return
+        try:
+            self.queue.put_nowait(message)
+            self.max_queue_depth = max(self.max_queue_depth, self.queue.qsize())
+        except asyncio.QueueFull:
+            self.dropped += 1
+
+    def synced(self, message):
+        """Queue the initial sync message, if any, followed by any messages broadcast while it was being created"""
+        self.syncing = False
+        for backlog_message in ([message] if message is not None else []) + self.backlog:
+            self.put(backlog_message)
+        self.backlog = []
+
+    async def send_messages(self):
         while True:
-            message = await self._message_queue.get()
-            # broadcast to all connected clients
-            await asyncio.wait([asyncio.ensure_future(ws.send(message)) for ws in self._connected_clients])
-
-    async def handler(self, websocket, path):
-        consumer_task = asyncio.ensure_future(self.consumer_handler(websocket, path))
-        producer_task = asyncio.ensure_future(self.producer_handler(websocket, path))
-
-        done, pending = await asyncio.wait([consumer_task, producer_task], return_when=asyncio.FIRST_COMPLETED)
+            message = await self.queue.get()
+            await self.websocket.send(message)
+            self.sent += 1
 
-        for task in pending:
-            task.cancel()
 
-    def __init__(self, host, port, resource_type, secure):
-        """
-        Initializer
-        :param resource_type: type of resource to which we are subscribing
-        :param host: host ip for websocket server (string)
-        :param port: port for websocket server (int)
-        """
-        threading.Thread.__init__(self, daemon=True)
+class SubscriptionWebsocketChannel(object):
+    """Fans out the messages for one subscription to all of its connected clients"""
 
-        self._resource_type = resource_type
+    def __init__(self, server, path, sync_callback):
+        self.server = server
+        self.path = path
+        self.sync_callback = sync_callback
+        self.clients = set()
+        # Totals for clients which have disconnected
+        self.sent = 0
+        self.dropped = 0
+        self.max_queue_depth = 0
 
-        self._loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(self._loop)
+    def queue_message(self, message):
+        """Send a message to every connected client. May be called from any thread."""
+        self.server.loop.call_soon_threadsafe(self._broadcast, message)
+
+    def _broadcast(self, message):
+        for client in self.clients:
+            client.put(message)
+
+    def _remove_client(self, client):
+        self.clients.discard(client)
+        self.sent += client.sent
+        self.dropped += client.dropped
+        self.max_queue_depth = max(self.max_queue_depth, client.max_queue_depth)
+
+    def get_metrics(self):
+        """Get the number of connected clients, and the numbers of messages sent and dropped because a client's send
+        buffer was full, together with the number of messages waiting to be sent and the deepest any send buffer
+        has been"""
+        clients = list(self.clients)
+        return {
+            "clients": len(clients),
+            "queue_depth": sum(_.queue.qsize() for _ in clients),
+            "sent": self.sent + sum(_.sent for _ in clients),
+            "dropped": self.dropped + sum(_.dropped for _ in clients),
+            "max_queue_depth": max([self.max_queue_depth] + [_.max_queue_depth for _ in clients])
+        }
 
-        self._message_queue = asyncio.Queue()
-        self._connected_clients = set()
 
-        ctx = None
-        if secure:
-            ctx = ssl.create_default_context(ssl.Purpose.CLIENT_AUTH)
-            for cert, key in zip(CONFIG.CERTS_MOCKS, CONFIG.KEYS_MOCKS):
-                ctx.load_cert_chain(cert, key)
-            # additionally disable TLS v1.0 and v1.1
-            ctx.options &= ssl.OP_NO_TLSv1 | ssl.OP_NO_TLSv1_1
-            # BCP-003-01 however doesn't require client certificates, so disable those
-            ctx.check_hostname = False
-            ctx.verify_mode = ssl.CERT_NONE
+class SubscriptionWebsocketServer(object):
+    """
+    Serves every subscription WebSocket from a single event loop in a background thread, routing clients to the
+    subscription channel identified by the request path. Plain and secure WebSockets are served on
+    WEBSOCKET_PORT_BASE and WEBSOCKET_PORT_BASE + 1 respectively. Use get_instance() to obtain the shared server.
+    """
+    _instance = None
+    _instance_lock = Lock()
+
+    def __init__(self, max_queue=WS_SERVER_SEND_QUEUE_SIZE):
+        self.max_queue = max_queue
+        self.channels = {}
+        self.listeners = {}
+        self.lock = Lock()
+        self.loop = asyncio.new_event_loop()
+        self.thread = threading.Thread(target=self.loop.run_forever, daemon=True)
+        self.thread.start()
 
-        self._ws_server = self._loop.run_until_complete(websockets.serve(self.handler, host, port, ssl=ctx))
+    @classmethod
+    def get_instance(cls):
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = cls()
+            return cls._instance
+
+    def get_port(self, secure):
+        """Get the port of the plain or secure listener, starting it if necessary"""
+        port = CONFIG.WEBSOCKET_PORT_BASE + (1 if secure else 0)
+        with self.lock:
+            if secure not in self.listeners:
+                ctx = None
+                if secure:
+                    ctx = ssl.create_default_context(ssl.Purpose.CLIENT_AUTH)
+                    for cert, key in zip(CONFIG.CERTS_MOCKS, CONFIG.KEYS_MOCKS):
+                        ctx.load_cert_chain(cert, key)
+                    # additionally disable TLS v1.0 and v1.1
+                    ctx.options &= ssl.OP_NO_TLSv1 | ssl.OP_NO_TLSv1_1
+                    # BCP-003-01 however doesn't require client certificates, so disable those
+                    ctx.check_hostname = False
+                    ctx.verify_mode = ssl.CERT_NONE
+                self.listeners[secure] = asyncio.run_coroutine_threadsafe(
+                    self._serve("0.0.0.0", port, ctx), self.loop).result()
+        return port
+
+    async def _serve(self, host, port, ctx):
+        return await websockets.serve(self.handler, host, port, ssl=ctx)
+
+    def add_channel(self, path, sync_callback):
+        """
+        Add a channel for the subscription WebSocket at the given path
+        :param path: request path of the subscription WebSocket (string)
+        :param sync_callback: called with no parameters when a client connects, from a worker thread, to get the
+                              initial 'sync' message to be sent to that client, or None (callable)
+        """
+        channel = SubscriptionWebsocketChannel(self, path, sync_callback)
+        with self.lock:
+            self.channels[path] = channel
+        return channel
+
+    def remove_channel(self, path):
+        """Remove the channel for the given path and disconnect its clients, without waiting for them to close"""
+        with self.lock:
+            channel = self.channels.pop(path, None)
+        if channel:
+            self.loop.call_soon_threadsafe(self._close_clients, channel)
+
+    def _close_clients(self, channel):
+        for client in channel.clients:
+            asyncio.ensure_future(client.websocket.close())
+
+    async def handler(self, websocket, path=None):
+        if path is None:
+            path = websocket.request.path
+        with self.lock:
+            channel = self.channels.get(path.split('?')[0])
+        if channel is None:
+            await websocket.close(code=1008, reason="Unknown subscription")
+            return
+
+        client = SubscriptionWebsocketClient(websocket, self.max_queue)
+        channel.clients.add(client)
+        try:
+            # when a websocket client first connects, it is immediately sent a 'sync' data grain message
+            client.synced(await self.loop.run_in_executor(None, channel.sync_callback))
 
-    def run(self):
-        self._loop.run_forever()
+            consumer_task = asyncio.ensure_future(self.consumer_handler(websocket))
+            producer_task = asyncio.ensure_future(client.send_messages())
 
-    def queue_message(self, message):
-        self._loop.call_soon_threadsafe(self._message_queue.put_nowait, message)
+            done, pending = await asyncio.wait([consumer_task, producer_task], return_when=asyncio.FIRST_COMPLETED)
 
-    def close(self):
-        print('Closing websocket for ' + self._resource_type)
-        self._ws_server.close()
+            for task in pending:
+                task.cancel()
+        finally:
+            channel._remove_client(client)
 
-    def set_queue_sync_data_grain_callback(self, callback):
-        """callback to queue sync data grain message with 1 parameter: resource_type (string) """
-        self.queue_sync_data_grain_callback = callback
+    async def consumer_handler(self, websocket):
+        async for message in websocket:
+            # ignore incoming websocket messages
+            pass
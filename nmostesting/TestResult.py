@@ -44,7 +44,7 @@ class TestStates(Enum):
 
 
 class TestResult(object):
-    def __init__(self, name, state, description, detail, link, timestamp, elapsed_time):
+    def __init__(self, name, state, description, detail, link, timestamp, elapsed_time, metrics=None):
         self.name = name
         self.state = state
         self.description = description
@@ -52,6 +52,10 @@ class TestResult(object):
         self.link = link
         self.timestamp = timestamp
         self.elapsed_time = elapsed_time
+        # Optional measurements made by the test, e.g. by benchmarks, which are included in JSON and JUnit output
+        self.metrics = metrics or {}
+        # Time spent by the test in each category of activity, e.g. HTTP requests, recorded by Instrumentation
+        self.timings = {}
 
     def output(self):
         return [self.name, str(self.state), self.state.css_class, self.description, self.detail, self.link,
@@ -66,6 +70,7 @@ class Test(object):
             # Get name of calling function
             self.name = inspect.stack()[1][3]
         self.timer = time.time()
+        self.metrics = {}
 
     def _current_time(self):
         return datetime.datetime.now().strftime("%H:%M:%S.%f")[:-3]
@@ -76,41 +81,41 @@ class Test(object):
     # Pass: Successful test case
     def PASS(self, detail="", link=None):
         return TestResult(self.name, TestStates.PASS, self.description, detail, link, self._current_time(),
-                          self._time_elapsed())
+                          self._time_elapsed(), self.metrics)
 
     # Warning: Not a failure, but the API being tested is responding or configured in a way which is
     # not recommended in most cases
     def WARNING(self, detail="", link=None):
         return TestResult(self.name, TestStates.WARNING, self.description, detail, link, self._current_time(),
-                          self._time_elapsed())
+                          self._time_elapsed(), self.metrics)
 
     # Manual: Test suite does not currently test this feature, so it must be tested manually
     def MANUAL(self, detail="", link=None):
         return TestResult(self.name, TestStates.MANUAL, self.description, detail, link, self._current_time(),
-                          self._time_elapsed())
+                          self._time_elapsed(), self.metrics)
 
     # Not Applicable: Test is not applicable, e.g. due to the version of the specification being tested
     def NA(self, detail, link=None):
         return TestResult(self.name, TestStates.NA, self.description, detail, link, self._current_time(),
-                          self._time_elapsed())
+                          self._time_elapsed(), self.metrics)
 
     # Fail: Required feature of the specification has been found to be implemented incorrectly
     def FAIL(self, detail, link=None):
         return TestResult(self.name, TestStates.FAIL, self.description, detail, link, self._current_time(),
-                          self._time_elapsed())
+                          self._time_elapsed(), self.metrics)
 
     # Optional: Recommended/optional feature of the specifications has been found to be not implemented
     # Detail message should explain the effect of this feature being unimplemented
     def OPTIONAL(self, detail, link=None):
         return TestResult(self.name, TestStates.OPTIONAL, self.description, detail, link, self._current_time(),
-                          self._time_elapsed())
+                          self._time_elapsed(), self.metrics)
 
     # Disabled: Test is disabled due to test suite configuration; change the config or test manually
     def DISABLED(self, detail="", link=None):
         return TestResult(self.name, TestStates.DISABLED, self.description, detail, link, self._current_time(),
-                          self._time_elapsed())
+                          self._time_elapsed(), self.metrics)
 
     # Unclear: Test was not run due to prior responses from the API, which may be OK, or indicate a fault
     def UNCLEAR(self, detail="", link=None):
         return TestResult(self.name, TestStates.UNCLEAR, self.description, detail, link, self._current_time(),
-                          self._time_elapsed())
+                          self._time_elapsed(), self.metrics)
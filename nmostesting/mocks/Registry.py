@@ -23,14 +23,14 @@ from flask import request, jsonify, abort, Blueprint, Response
 from threading import Event, Lock
 
 from ..IS10Utils import IS10Utils
-from ..Config import PORT_BASE, ENABLE_AUTH, \
-    WEBSOCKET_PORT_BASE, ENABLE_HTTPS, SPECIFICATIONS
+from ..Metrics import MOCK_REGISTRY_HEARTBEATS
+from ..Config import PORT_BASE, ENABLE_AUTH, ENABLE_HTTPS, SPECIFICATIONS
 from authlib.jose import jwt
 from ..IS04Utils import IS04Utils
 from ..RQLUtils import (
     RQLParseError, UnsupportedRQLOperator, has_unsupported_query_params, parse_query, resource_matches_query_params
 )
-from ..TestHelper import SubscriptionWebsocketWorker, get_default_ip, get_mocks_hostname
+from ..TestHelper import SubscriptionWebsocketServer, get_default_ip, get_mocks_hostname
 from .Auth import PRIMARY_AUTH
 
 
@@ -121,6 +121,7 @@ class Registry(object):
 
     def heartbeat(self, headers, payload, version, node_id):
         self.last_hb_time = time.time()
+        MOCK_REGISTRY_HEARTBEATS.inc(str(self.port))
         client_id = self._get_client_id(headers)
         if node_id in self.auth_clients and self.auth_clients[node_id] != client_id:
             raise BCP00302Exception
@@ -192,7 +193,7 @@ class Registry(object):
     # Query API subscription support methods
 
     def subscribe_to_query_api(self, version, subscription_request, secure=False):
-        """creates a subscription and starts a Subscription WebSocket"""
+        """creates a subscription and adds its channel to the shared Subscription WebSocket server"""
         resource_type = self._get_resource_type(subscription_request["resource_path"])
 
         resource_types = ['node', 'device', 'source', 'flow', 'sender', 'receiver']
@@ -215,12 +216,13 @@ class Registry(object):
             if subscription:
                 return subscription, False
 
-            websocket_port = WEBSOCKET_PORT_BASE + len(self.subscription_websockets)
-            websocket_server = SubscriptionWebsocketWorker('0.0.0.0', websocket_port, resource_type, secure)
-            websocket_server.set_queue_sync_data_grain_callback(self.queue_sync_data_grain)
-            websocket_server.start()
+            websocket_server = SubscriptionWebsocketServer.get_instance()
+            websocket_port = websocket_server.get_port(secure)
 
             subscription_id = str(uuid.uuid4())
+            websocket_path = '/x-nmos/query/' + version + '/subscriptions/' + subscription_id
+            channel = websocket_server.add_channel(websocket_path,
+                                                   lambda: self.get_sync_data_grain(subscription_id))
 
             protocol = 'wss' if secure else 'ws'
 
@@ -232,11 +234,11 @@ class Registry(object):
                             'persist': subscription_request['persist'],
                             'resource_path': subscription_request['resource_path'],
                             'secure': secure,
-                            'ws_href': protocol + '://' + host + ':' + str(websocket_port)
-                            + '/x-nmos/query/' + version + '/subscriptions/' + subscription_id,
+                            'ws_href': protocol + '://' + host + ':' + str(websocket_port) + websocket_path,
                             'version': IS04Utils.get_TAI_time()}
 
-            self.subscription_websockets[subscription_id] = {'server': websocket_server, 'api_version': version}
+            self.subscription_websockets[subscription_id] = {'channel': channel, 'path': websocket_path,
+                                                             'api_version': version}
 
             self.get_resources()['subscription'][subscription_id] = subscription
         finally:
@@ -250,12 +252,29 @@ class Registry(object):
         remove_slashes = remove_query.strip('/')  # strip leading and trailing slashes
         return remove_slashes.rstrip('s')  # remove trailing 's'
 
-    def queue_sync_data_grain(self, resource_type):
-        """ queues sync data grain to be sent by subscription websocket for resource_type"""
+    def get_sync_data_grain(self, subscription_id):
+        """ creates sync data grain to be sent to a new client of the subscription websocket, if any resources match"""
 
-        resource_data = self.get_resources()[resource_type]
+        try:
+            # Guard against concurrent subscription creation
+            self.subscription_lock.acquire()
 
-        self._create_and_queue_data_grains(resource_type, resource_data.keys(), resource_data, resource_data)
+            subscription = self.get_resources()['subscription'].get(subscription_id)
+            if subscription is None:
+                return None
+
+            resource_type = self._get_resource_type(subscription['resource_path'])
+            resource_data = self.get_resources()[resource_type]
+
+            return self._create_data_grain(subscription_id, subscription, resource_type, resource_data.keys(),
+                                           resource_data, resource_data, IS04Utils.get_TAI_time())
+        finally:
+            self.subscription_lock.release()
+
+    def get_subscription_metrics(self):
+        """ gets the client, sent and dropped message counts of each subscription websocket """
+        return {subscription_id: subscription_websocket['channel'].get_metrics()
+                for subscription_id, subscription_websocket in list(self.subscription_websockets.items())}
 
     def _queue_single_data_grain(self, resource_type, resource_id, pre_resource, post_resource):
         """ queues data grain to be sent by subscription websocket for resource_type """
@@ -277,64 +296,76 @@ class Registry(object):
             timestamp = IS04Utils.get_TAI_time()
 
             for subscription_id, subscription in subscriptions.items():
-                query_params = subscription.get('params', {})
-                rql_query_string = query_params.get('query.rql')
-                rql_expression = parse_query(rql_query_string) if rql_query_string else None
-                grain_entries = []
-                api_version = self.subscription_websockets[subscription_id]['api_version']
-                all_resources = self.get_resources()
-
-                for resource_id in resource_ids:
-                    pre_resource = pre_resources.get(resource_id)
-                    post_resource = post_resources.get(resource_id)
-                    pre_match = pre_resource and resource_matches_query_params(
-                        pre_resource, query_params, all_resources, rql_expression)
-                    post_match = post_resource and resource_matches_query_params(
-                        post_resource, query_params, all_resources, rql_expression)
-
-                    if not pre_match and not post_match:
-                        continue
-
-                    data = {'path': resource_id}
-                    if pre_match:
-                        data['pre'] = IS04Utils.downgrade_resource(resource_type,
-                                                                   pre_resource,
-                                                                   api_version)
-                    if post_match:
-                        data['post'] = IS04Utils.downgrade_resource(resource_type,
-                                                                    post_resource,
-                                                                    api_version)
-                    grain_entries.append(data)
-
-                if not grain_entries:
+                data_grain = self._create_data_grain(subscription_id, subscription, resource_type, resource_ids,
+                                                     pre_resources, post_resources, timestamp)
+                if data_grain is None:
                     continue
 
-                data_grain = {'grain_type': 'event',
-                              'source_id': self.query_api_id,
-                              'flow_id': subscription_id,
-                              'origin_timestamp': timestamp,
-                              'sync_timestamp': timestamp,
-                              'creation_timestamp': timestamp,
-                              'rate': {'denominator': 1, 'numerator': 0},
-                              'duration': {'denominator': 1, 'numerator': 0},
-                              'grain': {'type': 'urn:x-nmos:format:data.event',
-                                        'topic': '/' + resource_type + 's/', 'data': grain_entries}}
-
-                self.subscription_websockets[subscription_id]['server'].queue_message(json.dumps(data_grain))
+                self.subscription_websockets[subscription_id]['channel'].queue_message(data_grain)
 
         except KeyError as err:
             print('No subscription for resource type: {0}'.format(err))
         finally:
             self.subscription_lock.release()
 
+    def _create_data_grain(self, subscription_id, subscription, resource_type, resource_ids, pre_resources,
+                           post_resources, timestamp):
+        """ creates a JSON data grain for the subscription, or None if no resources match its query parameters"""
+
+        query_params = subscription.get('params', {})
+        rql_query_string = query_params.get('query.rql')
+        rql_expression = parse_query(rql_query_string) if rql_query_string else None
+        grain_entries = []
+        api_version = self.subscription_websockets[subscription_id]['api_version']
+        all_resources = self.get_resources()
+
+        for resource_id in resource_ids:
+            pre_resource = pre_resources.get(resource_id)
+            post_resource = post_resources.get(resource_id)
+            pre_match = pre_resource and resource_matches_query_params(
+                pre_resource, query_params, all_resources, rql_expression)
+            post_match = post_resource and resource_matches_query_params(
+                post_resource, query_params, all_resources, rql_expression)
+
+            if not pre_match and not post_match:
+                continue
+
+            data = {'path': resource_id}
+            if pre_match:
+                data['pre'] = IS04Utils.downgrade_resource(resource_type,
+                                                           pre_resource,
+                                                           api_version)
+            if post_match:
+                data['post'] = IS04Utils.downgrade_resource(resource_type,
+                                                            post_resource,
+                                                            api_version)
+            grain_entries.append(data)
+
+        if not grain_entries:
+            return None
+
+        data_grain = {'grain_type': 'event',
+                      'source_id': self.query_api_id,
+                      'flow_id': subscription_id,
+                      'origin_timestamp': timestamp,
+                      'sync_timestamp': timestamp,
+                      'creation_timestamp': timestamp,
+                      'rate': {'denominator': 1, 'numerator': 0},
+                      'duration': {'denominator': 1, 'numerator': 0},
+                      'grain': {'type': 'urn:x-nmos:format:data.event',
+                                'topic': '/' + resource_type + 's/', 'data': grain_entries}}
+
+        return json.dumps(data_grain)
+
     def _close_subscription_websockets(self):
-        """ closing websockets will automatically disconnect clients and stop websockets """
+        """ removing subscription channels will automatically disconnect their clients """
         try:
             # Guard against concurrent subscription creation
             self.subscription_lock.acquire()
 
+            websocket_server = SubscriptionWebsocketServer.get_instance()
             for id, subscription_websocket in list(self.subscription_websockets.items()):
-                subscription_websocket['server'].close()
+                websocket_server.remove_channel(subscription_websocket['path'])
                 del self.subscription_websockets[id]
         finally:
             self.subscription_lock.release()
@@ -722,8 +753,9 @@ def delete_subscription(version, subscription_id):
         if not subscription['persist']:
             abort(403)
 
-        # Close subscription WebSocket server and remove from resources
-        registry.subscription_websockets[subscription_id]['server'].close()
+        # Remove subscription WebSocket channel and remove from resources
+        SubscriptionWebsocketServer.get_instance().remove_channel(
+            registry.subscription_websockets[subscription_id]['path'])
         del registry.subscription_websockets[subscription_id]
         del registry.get_resources()['subscription'][subscription_id]
 
@@ -135,6 +135,56 @@ function disableRunbtn() {
     for (alert of alerts) {
         alert.remove()
     }
+    followProgress();
+}
+
+function followProgress() {
+    // Show the progress of the test run, which is published while the results page is awaited
+    if (typeof(EventSource) === "undefined") {
+        return;
+    }
+    var progress = document.getElementById("progress");
+    var completed = 0;
+    var currentTest = "";
+    var currentRequest = "";
+    var lastElapsed = 0;
+    // The stream may be opened before the run being awaited has started
+    var started = false;
+    var events = new EventSource("progress");
+    function update(elapsed) {
+        lastElapsed = elapsed;
+        progress.textContent = completed + " test(s) completed in " + Math.round(elapsed) + "s" +
+            (currentTest ? ", running " + currentTest : "") + (currentRequest ? ": " + currentRequest : "");
+    }
+    events.addEventListener("run-started", function(event) {
+        started = true;
+        completed = 0;
+        currentTest = "";
+        currentRequest = "";
+        update(0);
+    });
+    events.addEventListener("test-started", function(event) {
+        var data = JSON.parse(event.data);
+        currentTest = data.test;
+        currentRequest = "";
+        update(data.elapsed);
+    });
+    events.addEventListener("test-finished", function(event) {
+        var data = JSON.parse(event.data);
+        completed = data.completed;
+        update(data.elapsed);
+    });
+    events.addEventListener("request", function(event) {
+        var data = JSON.parse(event.data);
+        currentRequest = data.method + " " + data.url;
+        update(lastElapsed);
+    });
+    events.addEventListener("run-finished", function(event) {
+        // Ignore the end of a previous run
+        if (started) {
+            events.close();
+        }
+    });
 }
 
 document.addEventListener("DOMContentLoaded", function() {
@@ -21,6 +21,7 @@ import ipaddress
 
 from ..GenericTest import GenericTest, NMOSTestException, NMOSInitException
 from .. import Config as CONFIG
+from .. import Instrumentation
 
 SECURE_API_KEY = "secure"
 TMPFILE = "tls-report.json"
@@ -47,21 +48,22 @@ class BCP00301Test(GenericTest):
             return self.report_json[arg_key]
         else:
             try:
-                ret = subprocess.run([CONFIG.TEST_SSL_BASH,
-                                      "testssl/testssl.sh",
-                                      "--jsonfile",
-                                      TMPFILE,
-                                      "--warnings",
-                                      "off",
-                                      "--openssl-timeout",
-                                      str(CONFIG.HTTP_TIMEOUT),
-                                      "--add-ca",
-                                      CONFIG.CERT_TRUST_ROOT_CA,
-                                      "--ip",
-                                      self.apis[SECURE_API_KEY]["ip"]
-                                      ] + args + ["{}:{}".format(self.apis[SECURE_API_KEY]["hostname"],
-                                                                 self.apis[SECURE_API_KEY]["port"])]
-                                     )
+                with Instrumentation.measure(Instrumentation.SUBPROCESS, "testssl"):
+                    ret = subprocess.run([CONFIG.TEST_SSL_BASH,
+                                          "testssl/testssl.sh",
+                                          "--jsonfile",
+                                          TMPFILE,
+                                          "--warnings",
+                                          "off",
+                                          "--openssl-timeout",
+                                          str(CONFIG.HTTP_TIMEOUT),
+                                          "--add-ca",
+                                          CONFIG.CERT_TRUST_ROOT_CA,
+                                          "--ip",
+                                          self.apis[SECURE_API_KEY]["ip"]
+                                          ] + args + ["{}:{}".format(self.apis[SECURE_API_KEY]["hostname"],
+                                                                     self.apis[SECURE_API_KEY]["port"])]
+                                         )
                 if ret.returncode == 0:
                     with open(TMPFILE) as tls_data:
                         self.report_json[arg_key] = json.load(tls_data)
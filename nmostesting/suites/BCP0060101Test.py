@@ -12,13 +12,13 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import json
 import re
 
 from jsonschema import ValidationError
 
 from ..GenericTest import GenericTest, NMOSTestException
 from ..IS04Utils import IS04Utils
+from ..NMOSUtils import NodeResourceSnapshot
 from ..TestHelper import load_resolved_schema
 
 NODE_API_KEY = "node"
@@ -49,16 +49,12 @@ class BCP0060101Test(GenericTest):
         if resource_type in self.is04_resources["_requested"]:
             return True, ""
 
-        valid, resources = self.do_request("GET", self.node_url + resource_type)
+        valid, resources = NodeResourceSnapshot.for_node(self.node_url).get(resource_type)
         if not valid:
-            return False, "Node API did not respond as expected: {}".format(resources)
+            return False, resources
 
-        try:
-            for resource in resources.json():
-                self.is04_resources[resource_type].append(resource)
-            self.is04_resources["_requested"].append(resource_type)
-        except json.JSONDecodeError:
-            return False, "Non-JSON response returned from Node API"
+        self.is04_resources[resource_type] = list(resources)
+        self.is04_resources["_requested"].append(resource_type)
 
         return True, ""
 
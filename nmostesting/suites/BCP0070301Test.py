@@ -22,6 +22,7 @@ from jsonschema import ValidationError
 
 from ..GenericTest import GenericTest, NMOSTestException, requires_api_version
 from ..IS04Utils import IS04Utils
+from ..NMOSUtils import NodeResourceSnapshot
 from ..IS05Utils import IS05Utils
 from ..TestHelper import load_resolved_schema
 
@@ -69,16 +70,12 @@ class BCP0070301Test(GenericTest):
         if resource_type in self.is04_resources["_requested"]:
             return True, ""
 
-        valid, resources = self.do_request("GET", self.node_url + resource_type)
+        valid, resources = NodeResourceSnapshot.for_node(self.node_url).get(resource_type)
         if not valid:
-            return False, f"Node API did not respond as expected: {resources}"
+            return False, resources
 
-        try:
-            for resource in resources.json():
-                self.is04_resources[resource_type].append(resource)
-            self.is04_resources["_requested"].append(resource_type)
-        except json.JSONDecodeError:
-            return False, "Non-JSON response returned from Node API"
+        self.is04_resources[resource_type] = list(resources)
+        self.is04_resources["_requested"].append(resource_type)
 
         return True, ""
 
@@ -14,14 +14,16 @@
 
 
 from enum import Enum, IntEnum
-from time import sleep
+from time import time
 from typing import Dict, List, Optional
 
 from ..GenericTest import GenericTest, NMOSTestException
+from ..Instrumentation import sleep
 from ..IS05Utils import IS05Utils
 from ..IS12Utils import IS12Utils, IS12Notification
 from ..MS05Utils import NcMethodId, NcMethodResult, NcMethodStatus, NcObject, NcObjectProperties, \
     NcPropertyId, NcTouchpointNmos
+from ..PerformanceUtils import summarise_latencies
 from ..TestResult import TestStates
 
 NODE_API_KEY = "node"
@@ -110,6 +112,9 @@ class BCP008Test(GenericTest):
         super().set_up_tests()
 
         self.testable_resources_found = False
+        # Time from each activation or deactivation request to the resulting status change notification
+        self.activation_latencies = []
+        self.deactivation_latencies = []
         # Initialize cached test results
         self.check_activation_metadata = BCP008Test.TestMetadata()
         self.check_transition_to_unhealthy_metadata = BCP008Test.TestMetadata()
@@ -429,6 +434,7 @@ class BCP008Test(GenericTest):
 
         # Deactivate before the status reporting delay expires
         sleep(2.0)
+        deactivation_request_time = time()
         self.deactivate_resource(test, resource_id)
         sleep(2.0)  # Settling time
 
@@ -441,6 +447,14 @@ class BCP008Test(GenericTest):
 
         status_property_ids = self.get_inactiveable_status_property_ids()
 
+        inactive_notifications = [n for n in notifications if n.received_time >= deactivation_request_time
+                                  and n.eventData.propertyId in status_property_ids
+                                  and n.eventData.value == CONNECTION_STATUS_INACTIVE]
+        if inactive_notifications:
+            # Latency to the first status becoming Inactive, since they need not all change together
+            self.deactivation_latencies.append(min(n.received_time for n in inactive_notifications)
+                                               - deactivation_request_time)
+
         for property_id in status_property_ids:
             filtered_notifications = \
                     [n for n in deactivate_resource_notifications
@@ -678,6 +692,7 @@ class BCP008Test(GenericTest):
                                      for property_id in self.get_domain_status_property_ids()])
 
             # Activate resource being monitored
+            activation_request_time = time()
             self.activate_resource(test, resource_id)
 
             # Wait until slightly more that status reporting delay to
@@ -689,6 +704,8 @@ class BCP008Test(GenericTest):
 
             # Determine the actual activation time based on the notifications
             activation_time = self._get_activation_time(test, monitor, notifications)
+            if activation_time:
+                self.activation_latencies.append(activation_time - activation_request_time)
 
             # Check statuses before resource activated
             status_notifications = [n for n in notifications if n.received_time < activation_time]
@@ -756,6 +773,8 @@ class BCP008Test(GenericTest):
         if not self.testable_resources_found:
             return test.UNCLEAR("Unable to find any testable Monitors")
 
+        test.metrics = {"latency": summarise_latencies(self.activation_latencies)}
+
         if self.check_activation_metadata.error:
             return test.FAIL(self.check_activation_metadata.error_msg,
                              self.check_activation_metadata.link)
@@ -951,6 +970,8 @@ class BCP008Test(GenericTest):
         if not self.testable_resources_found:
             return test.UNCLEAR("Unable to find any testable Monitors")
 
+        test.metrics = {"latency": summarise_latencies(self.deactivation_latencies)}
+
         if self.check_deactivate_monitor_metadata.error:
             return test.FAIL(self.check_deactivate_monitor_metadata.error_msg,
                              self.check_deactivate_monitor_metadata.link)
@@ -24,9 +24,10 @@ from dnslib import QTYPE
 from copy import deepcopy
 from collections import defaultdict
 from pathlib import Path
-from zeroconf import ServiceBrowser, ServiceInfo, Zeroconf
+from zeroconf import ServiceInfo, Zeroconf
 
 from .. import Config as CONFIG
+from ..Instrumentation import sleep
 from ..MdnsListener import MdnsListener
 from ..GenericTest import GenericTest, NMOSTestException, NMOS_WIKI_URL
 from ..IS04Utils import IS04Utils
@@ -81,7 +82,7 @@ class IS0401Test(GenericTest):
                 CONFIG.DNS_SD_ADVERT_TIMEOUT
             )
             # Wait for a short time to allow the device to react after performing the query
-            time.sleep(CONFIG.API_PROCESSING_TIMEOUT)
+            sleep(CONFIG.API_PROCESSING_TIMEOUT)
 
     def tear_down_tests(self):
         if self.zc:
@@ -203,12 +204,12 @@ class IS0401Test(GenericTest):
                 break
             if self.invalid_registry.has_registrations():
                 break
-            time.sleep(0.2)
+            sleep(0.2)
 
         # Wait until we're sure the Node has registered everything it intends to, and we've had at least one heartbeat
         while (time.time() - self.primary_registry.last_time) < CONFIG.HEARTBEAT_INTERVAL + 1 or \
               (time.time() - self.invalid_registry.last_time) < CONFIG.HEARTBEAT_INTERVAL + 1:
-            time.sleep(0.2)
+            sleep(0.2)
 
         # Collect matching resources from the Node
         self.do_node_basics_prereqs()
@@ -218,7 +219,7 @@ class IS0401Test(GenericTest):
             # It is heartbeating, but we don't have enough of them yet
             while len(self.primary_registry.get_data().heartbeats) < 2 and \
                     len(self.invalid_registry.get_data().heartbeats) < 2:
-                time.sleep(0.2)
+                sleep(0.2)
 
             # Once registered, advertise all other registries at different (ascending) priorities
             for index, registry in enumerate(self.registries[1:]):
@@ -253,7 +254,7 @@ class IS0401Test(GenericTest):
 
                 while len(self.registries[index + 1].get_data().heartbeats) < 1 and heartbeat_countdown > 0:
                     # Wait until the heartbeat interval has elapsed or a heartbeat has been received
-                    time.sleep(0.2)
+                    sleep(0.2)
                     heartbeat_countdown -= 0.2
 
                 if len(self.registries[index + 1].get_data().heartbeats) < 1:
@@ -735,40 +736,33 @@ class IS0401Test(GenericTest):
         if self.is04_utils.compare_api_version(api["version"], "v1.3") >= 0:
             return test.DISABLED("This test is disabled for Nodes >= v1.3")
 
-        node_list = self.collect_mdns_announcements()
+        self.collect_mdns_announcements()
 
-        for node in node_list:
-            port = node.port
-            if port != api["port"]:
-                continue
-            for address in node.addresses:
-                address = socket.inet_ntoa(address)
-                if address != api["ip"]:
-                    continue
-                properties = self.convert_bytes(node.properties)
-                for prop in properties:
-                    if "ver_" in prop:
-                        return test.FAIL("Found 'ver_' TXT record while Node is registered.")
-
-                if self.is04_utils.compare_api_version(api["version"], "v1.1") >= 0:
-                    if "api_ver" not in properties:
-                        return test.FAIL("No 'api_ver' TXT record found in Node API advertisement.")
-                    elif api["version"] not in properties["api_ver"].split(","):
-                        return test.FAIL("Node does not claim to support version under test.")
-
-                    if "api_proto" not in properties:
-                        return test.FAIL("No 'api_proto' TXT record found in Node API advertisement.")
-                    elif properties["api_proto"] != self.protocol:
-                        return test.FAIL("API protocol ('api_proto') TXT record is not '{}'.".format(self.protocol))
-
-                if self.is04_utils.compare_api_version(api["version"], "v1.3") >= 0:
-                    if "api_auth" not in properties:
-                        return test.FAIL("No 'api_auth' TXT record found in Node API advertisement.")
-                    elif properties["api_auth"] != str(self.authorization).lower():
-                        return test.FAIL("API authorization ('api_auth') TXT record is not '{}'."
-                                         .format(str(self.authorization).lower()))
+        for node in self.zc_listener.find_services(api["port"], api["ip"], "_nmos-node._tcp.local."):
+            properties = self.convert_bytes(node.properties)
+            for prop in properties:
+                if "ver_" in prop:
+                    return test.FAIL("Found 'ver_' TXT record while Node is registered.")
 
-                return test.PASS()
+            if self.is04_utils.compare_api_version(api["version"], "v1.1") >= 0:
+                if "api_ver" not in properties:
+                    return test.FAIL("No 'api_ver' TXT record found in Node API advertisement.")
+                elif api["version"] not in properties["api_ver"].split(","):
+                    return test.FAIL("Node does not claim to support version under test.")
+
+                if "api_proto" not in properties:
+                    return test.FAIL("No 'api_proto' TXT record found in Node API advertisement.")
+                elif properties["api_proto"] != self.protocol:
+                    return test.FAIL("API protocol ('api_proto') TXT record is not '{}'.".format(self.protocol))
+
+            if self.is04_utils.compare_api_version(api["version"], "v1.3") >= 0:
+                if "api_auth" not in properties:
+                    return test.FAIL("No 'api_auth' TXT record found in Node API advertisement.")
+                elif properties["api_auth"] != str(self.authorization).lower():
+                    return test.FAIL("API authorization ('api_auth') TXT record is not '{}'."
+                                     .format(str(self.authorization).lower()))
+
+            return test.PASS()
 
         return test.WARNING("No matching mDNS announcement found for Node with IP/Port {}:{}. This will not affect "
                             "operation in registered mode but may indicate a lack of support for peer to peer "
@@ -786,28 +780,21 @@ class IS0401Test(GenericTest):
         if self.is04_utils.compare_api_version(api["version"], "v1.3") < 0:
             return test.DISABLED("This test is disabled for Nodes < v1.3")
 
-        node_list = self.collect_mdns_announcements()
+        self.collect_mdns_announcements()
 
-        for node in node_list:
-            port = node.port
-            if port != api["port"]:
-                continue
-            for address in node.addresses:
-                address = socket.inet_ntoa(address)
-                if address != api["ip"]:
-                    continue
-                properties = self.convert_bytes(node.properties)
-                if "api_ver" not in properties:
-                    return test.FAIL("No 'api_ver' TXT record found in Node API advertisement.")
+        for node in self.zc_listener.find_services(api["port"], api["ip"], "_nmos-node._tcp.local."):
+            properties = self.convert_bytes(node.properties)
+            if "api_ver" not in properties:
+                return test.FAIL("No 'api_ver' TXT record found in Node API advertisement.")
 
-                min_version_lt_v1_3 = False
-                for api_version in properties["api_ver"].split(","):
-                    if self.is04_utils.compare_api_version(api_version, "v1.3") < 0:
-                        min_version_lt_v1_3 = True
+            min_version_lt_v1_3 = False
+            for api_version in properties["api_ver"].split(","):
+                if self.is04_utils.compare_api_version(api_version, "v1.3") < 0:
+                    min_version_lt_v1_3 = True
 
-                if not min_version_lt_v1_3:
-                    return test.WARNING("Nodes which support v1.3+ only should not advertise via mDNS when in "
-                                        "registered mode.")
+            if not min_version_lt_v1_3:
+                return test.WARNING("Nodes which support v1.3+ only should not advertise via mDNS when in "
+                                    "registered mode.")
 
         return test.PASS()
 
@@ -875,7 +862,7 @@ class IS0401Test(GenericTest):
                 if CONFIG.DNS_SD_MODE == "multicast":
                     self.zc.unregister_service(sender_info)
 
-                time.sleep(CONFIG.API_PROCESSING_TIMEOUT)
+                sleep(CONFIG.API_PROCESSING_TIMEOUT)
 
                 valid, response = self.do_request("GET", self.node_url + "receivers/" + receiver["id"])
                 if not valid or response.status_code != 200:
@@ -923,7 +910,7 @@ class IS0401Test(GenericTest):
             if test_receiver is not None:
                 self.do_receiver_put(test, test_receiver["id"], {})
 
-                time.sleep(CONFIG.API_PROCESSING_TIMEOUT)
+                sleep(CONFIG.API_PROCESSING_TIMEOUT)
 
                 valid, response = self.do_request("GET", self.node_url + "receivers/" + test_receiver["id"])
                 if not valid or response.status_code != 200:
@@ -1471,7 +1458,7 @@ class IS0401Test(GenericTest):
 
         # Wait for the Node to finish its interactions
         while (time.time() - self.primary_registry.last_time) < CONFIG.HEARTBEAT_INTERVAL + 1:
-            time.sleep(0.2)
+            sleep(0.2)
 
         # By this point we should have had at least one Node POST and a corresponding DELETE
         if CONFIG.DNS_SD_MODE == "multicast":
@@ -2173,9 +2160,9 @@ class IS0401Test(GenericTest):
         # Wait for n seconds after advertising the service for the first POST from a Node
         self.primary_registry.wait_for_registration(CONFIG.DNS_SD_ADVERT_TIMEOUT)
 
-        ServiceBrowser(self.zc, "_nmos-node._tcp.local.", self.zc_listener)
-        time.sleep(CONFIG.DNS_SD_BROWSE_TIMEOUT)
-        node_list = self.zc_listener.get_service_list()
+        # The Node advertisement is expected to change once it has registered, so always wait for the full browse
+        # timeout rather than returning as soon as any advertisement has been resolved
+        node_list = self.zc_listener.browse("_nmos-node._tcp.local.")
 
         # Withdraw the registry advertisement now we've performed a browse for Node advertisements
         if CONFIG.DNS_SD_MODE == "multicast":
@@ -15,16 +15,16 @@
 # limitations under the License.
 
 import re
-import socket
 import uuid
 from requests.compat import json
 from copy import deepcopy
-from time import sleep
 from jsonschema import ValidationError
 from urllib.parse import urlparse
-from zeroconf import ServiceBrowser, Zeroconf
+from zeroconf import Zeroconf
 
 from .. import Config as CONFIG
+from .. import Instrumentation
+from ..Instrumentation import sleep
 from ..MdnsListener import MdnsListener
 from ..GenericTest import GenericTest, NMOSTestException, NMOSInitException, NMOS_WIKI_URL
 from ..IS04Utils import IS04Utils
@@ -70,50 +70,40 @@ class IS0402Test(GenericTest):
         if CONFIG.DNS_SD_MODE != "multicast":
             return test.DISABLED("This test cannot be performed when DNS_SD_MODE is not 'multicast'")
 
-        ServiceBrowser(self.zc, service_type, self.zc_listener)
-        sleep(CONFIG.DNS_SD_BROWSE_TIMEOUT)
-        serv_list = self.zc_listener.get_service_list()
-        for service in serv_list:
-            port = service.port
-            if port != api["port"]:
-                continue
-            for address in service.addresses:
-                address = socket.inet_ntoa(address)
-                if address != api["ip"]:
-                    continue
-                properties = self.convert_bytes(service.properties)
-                if "pri" not in properties:
-                    return test.FAIL("No 'pri' TXT record found in {} advertisement.".format(api["name"]))
-                try:
-                    priority = int(properties["pri"])
-                    if priority < 0:
-                        return test.FAIL("Priority ('pri') TXT record must be greater than zero.")
-                    elif priority >= 100:
-                        return test.WARNING("Priority ('pri') TXT record must be less than 100 for a production "
-                                            "instance.")
-                except Exception:
-                    return test.FAIL("Priority ('pri') TXT record is not an integer.")
-
-                # Other TXT records only came in for IS-04 v1.1+
-                if self.is04_reg_utils.compare_api_version(api["version"], "v1.1") >= 0:
-                    if "api_ver" not in properties:
-                        return test.FAIL("No 'api_ver' TXT record found in {} advertisement.".format(api["name"]))
-                    elif api["version"] not in properties["api_ver"].split(","):
-                        return test.FAIL("Registry does not claim to support version under test.")
-
-                    if "api_proto" not in properties:
-                        return test.FAIL("No 'api_proto' TXT record found in {} advertisement.".format(api["name"]))
-                    elif properties["api_proto"] != self.protocol:
-                        return test.FAIL("API protocol ('api_proto') TXT record is not '{}'.".format(self.protocol))
-
-                if self.is04_reg_utils.compare_api_version(api["version"], "v1.3") >= 0:
-                    if "api_auth" not in properties:
-                        return test.FAIL("No 'api_auth' TXT record found in {} advertisement.".format(api["name"]))
-                    elif properties["api_auth"] != str(self.authorization).lower():
-                        return test.FAIL("API authorization ('api_auth') TXT record is not '{}'."
-                                         .format(str(self.authorization).lower()))
+        for service in self.zc_listener.browse(service_type, api["port"], api["ip"]):
+            properties = self.convert_bytes(service.properties)
+            if "pri" not in properties:
+                return test.FAIL("No 'pri' TXT record found in {} advertisement.".format(api["name"]))
+            try:
+                priority = int(properties["pri"])
+                if priority < 0:
+                    return test.FAIL("Priority ('pri') TXT record must be greater than zero.")
+                elif priority >= 100:
+                    return test.WARNING("Priority ('pri') TXT record must be less than 100 for a production "
+                                        "instance.")
+            except Exception:
+                return test.FAIL("Priority ('pri') TXT record is not an integer.")
+
+            # Other TXT records only came in for IS-04 v1.1+
+            if self.is04_reg_utils.compare_api_version(api["version"], "v1.1") >= 0:
+                if "api_ver" not in properties:
+                    return test.FAIL("No 'api_ver' TXT record found in {} advertisement.".format(api["name"]))
+                elif api["version"] not in properties["api_ver"].split(","):
+                    return test.FAIL("Registry does not claim to support version under test.")
+
+                if "api_proto" not in properties:
+                    return test.FAIL("No 'api_proto' TXT record found in {} advertisement.".format(api["name"]))
+                elif properties["api_proto"] != self.protocol:
+                    return test.FAIL("API protocol ('api_proto') TXT record is not '{}'.".format(self.protocol))
+
+            if self.is04_reg_utils.compare_api_version(api["version"], "v1.3") >= 0:
+                if "api_auth" not in properties:
+                    return test.FAIL("No 'api_auth' TXT record found in {} advertisement.".format(api["name"]))
+                elif properties["api_auth"] != str(self.authorization).lower():
+                    return test.FAIL("API authorization ('api_auth') TXT record is not '{}'."
+                                     .format(str(self.authorization).lower()))
 
-                return test.PASS()
+            return test.PASS()
         return test.FAIL("No matching mDNS announcement found for {} with IP/Port {}:{}."
                          .format(api["name"], api["ip"], api["port"]))
 
@@ -1231,7 +1221,7 @@ class IS0402Test(GenericTest):
             websockets[api_version] = WebsocketWorker(resp_json["ws_href"])
             websockets[api_version].start()
 
-        sleep(CONFIG.WS_MESSAGE_TIMEOUT)  # Wait for SYNC messages
+        sleep(CONFIG.WS_MESSAGE_TIMEOUT, Instrumentation.WEBSOCKET)  # Wait for SYNC messages
 
         # Verify no error occurred on starting websocket subscription & clear SYNC messages
         for api_version in query_versions:
@@ -1252,7 +1242,7 @@ class IS0402Test(GenericTest):
             reg_url = "{}/{}/".format(self.reg_url.rstrip(reg_api["version"] + "/"), api_version)
             self.post_resource(test, "node", test_data, codes=[201], reg_url=reg_url)
 
-        sleep(CONFIG.WS_MESSAGE_TIMEOUT)
+        sleep(CONFIG.WS_MESSAGE_TIMEOUT, Instrumentation.WEBSOCKET)
 
         # Read data & close websockets
         sub_data = dict()
@@ -1359,7 +1349,7 @@ class IS0402Test(GenericTest):
         websocket = WebsocketWorker(resp_json["ws_href"])
         try:
             websocket.start()
-            sleep(CONFIG.WS_MESSAGE_TIMEOUT)
+            sleep(CONFIG.WS_MESSAGE_TIMEOUT, Instrumentation.WEBSOCKET)
             if websocket.did_error_occur():
                 return test.FAIL("Error opening websocket: {}".format(websocket.get_error_message()))
 
@@ -1383,7 +1373,7 @@ class IS0402Test(GenericTest):
                                               "queryapi-subscriptions-websocket.json")
 
             # Check that the single Node is reflected in the subscription
-            sleep(CONFIG.WS_MESSAGE_TIMEOUT)
+            sleep(CONFIG.WS_MESSAGE_TIMEOUT, Instrumentation.WEBSOCKET)
             received_messages = websocket.get_messages()
 
             if len(received_messages) < 1:
@@ -1421,7 +1411,7 @@ class IS0402Test(GenericTest):
             self.post_resource(test, "node", test_data, codes=[200])
 
             # Ensure it disappears from the subscription
-            sleep(CONFIG.WS_MESSAGE_TIMEOUT)
+            sleep(CONFIG.WS_MESSAGE_TIMEOUT, Instrumentation.WEBSOCKET)
             received_messages = websocket.get_messages()
 
             if len(received_messages) < 1:
@@ -1528,7 +1518,7 @@ class IS0402Test(GenericTest):
         websocket = WebsocketWorker(resp_json["ws_href"])
         try:
             websocket.start()
-            sleep(CONFIG.WS_MESSAGE_TIMEOUT)
+            sleep(CONFIG.WS_MESSAGE_TIMEOUT, Instrumentation.WEBSOCKET)
             if websocket.did_error_occur():
                 return test.FAIL("Error opening websocket: {}".format(websocket.get_error_message()))
 
@@ -1552,7 +1542,7 @@ class IS0402Test(GenericTest):
                                               "queryapi-subscriptions-websocket.json")
 
             # Check that the single Node is reflected in the subscription
-            sleep(CONFIG.WS_MESSAGE_TIMEOUT)
+            sleep(CONFIG.WS_MESSAGE_TIMEOUT, Instrumentation.WEBSOCKET)
             received_messages = websocket.get_messages()
 
             if len(received_messages) < 1:
@@ -1589,7 +1579,7 @@ class IS0402Test(GenericTest):
             self.post_resource(test, "node", test_data, codes=[200])
 
             # Ensure it disappears from the subscription
-            sleep(CONFIG.WS_MESSAGE_TIMEOUT)
+            sleep(CONFIG.WS_MESSAGE_TIMEOUT, Instrumentation.WEBSOCKET)
             received_messages = websocket.get_messages()
 
             if len(received_messages) < 1:
@@ -1903,7 +1893,7 @@ class IS0402Test(GenericTest):
 
             for resource in resources_to_post:
                 websockets[resource].start()
-            sleep(CONFIG.WS_MESSAGE_TIMEOUT)
+            sleep(CONFIG.WS_MESSAGE_TIMEOUT, Instrumentation.WEBSOCKET)
 
             # Heartbeat node after sleep to prevent expiry
             valid, r = self.do_request("POST", "{}health/nodes/{}".format(self.reg_url, self.test_data["node"]["id"]))
@@ -1953,7 +1943,7 @@ class IS0402Test(GenericTest):
                 # Update resource
                 self.post_resource(test, resource, resource_data, codes=[200])
 
-            sleep(CONFIG.WS_MESSAGE_TIMEOUT)
+            sleep(CONFIG.WS_MESSAGE_TIMEOUT, Instrumentation.WEBSOCKET)
 
             # Heartbeat node after sleep to prevent expiry
             valid, r = self.do_request("POST", "{}health/nodes/{}".format(self.reg_url, self.test_data["node"]["id"]))
@@ -2009,7 +1999,7 @@ class IS0402Test(GenericTest):
                     return test.FAIL("Registration API did not respond as expected: Cannot delete {}: {} {}"
                                      .format(resource, r.status_code, r.text))
 
-            sleep(CONFIG.WS_MESSAGE_TIMEOUT)
+            sleep(CONFIG.WS_MESSAGE_TIMEOUT, Instrumentation.WEBSOCKET)
             for resource, resource_data in test_data.items():
                 received_messages = websockets[resource].get_messages()
 
@@ -2049,7 +2039,7 @@ class IS0402Test(GenericTest):
                 self.bump_resource_version(test_data[resource])
                 self.post_resource(test, resource, test_data[resource], codes=[201])
 
-            sleep(CONFIG.WS_MESSAGE_TIMEOUT)
+            sleep(CONFIG.WS_MESSAGE_TIMEOUT, Instrumentation.WEBSOCKET)
             for resource, resource_data in test_data.items():
                 received_messages = websockets[resource].get_messages()
 
@@ -13,9 +13,8 @@
 # limitations under the License.
 
 import time
-import socket
 
-from zeroconf import ServiceBrowser, Zeroconf
+from zeroconf import Zeroconf
 from ..MdnsListener import MdnsListener
 from ..GenericTest import GenericTest, NMOS_WIKI_URL
 from ..IS04Utils import IS04Utils
@@ -51,26 +50,15 @@ class IS0403Test(GenericTest):
         if CONFIG.DNS_SD_MODE != "multicast":
             return test.DISABLED("This test cannot be performed when DNS_SD_MODE is not 'multicast'")
 
-        ServiceBrowser(self.zc, "_nmos-node._tcp.local.", self.zc_listener)
         # Wait for n seconds for the Node to recognize it should adopt peer-to-peer operation
         start_time = time.time()
         while time.time() < start_time + CONFIG.DNS_SD_ADVERT_TIMEOUT:
             properties = None
-            time.sleep(CONFIG.DNS_SD_BROWSE_TIMEOUT)
-            node_list = self.zc_listener.get_service_list()
-            # Iterate in reverse order to check the most recent advert first
-            for node in reversed(node_list):
-                port = node.port
-                if port != api["port"]:
-                    continue
-                for address in node.addresses:
-                    address = socket.inet_ntoa(address)
-                    if address != api["ip"]:
-                        continue
-                    properties = self.convert_bytes(node.properties)
-                    break
-                if properties:
-                    break
+            # Returns as soon as the Node advertises for peer-to-peer operation, or after the browse timeout
+            node_list = self.zc_listener.browse("_nmos-node._tcp.local.", api["port"], api["ip"], ["ver_slf"])
+            # Check the most recent advert
+            if node_list:
+                properties = self.convert_bytes(node_list[-1].properties)
             # If the Node is still advertising as for registered operation, loop around
             if properties and "ver_slf" in properties:
                 for ver_txt in ["ver_slf", "ver_src", "ver_flw", "ver_dvc", "ver_snd", "ver_rcv"]:
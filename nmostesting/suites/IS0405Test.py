@@ -0,0 +1,341 @@
+# Copyright (C) 2026 Advanced Media Workflow Association
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import heapq
+import threading
+import time
+import uuid
+
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, wait
+from copy import deepcopy
+from requests.compat import json
+
+from .. import Config as CONFIG
+from ..GenericTest import GenericTest, NMOSInitException, test_depends
+from ..Instrumentation import sleep
+from ..IS04Utils import IS04Utils
+from ..NMOSUtils import NMOSUtils
+from ..PerformanceUtils import HTTPClientPool, format_latencies
+
+REG_API_KEY = "registration"
+QUERY_API_KEY = "query"
+
+RESOURCE_TYPES = ["node", "device", "source", "flow", "sender", "receiver"]
+
+# Number of seconds between polls of the Query API while waiting for garbage collection
+GC_POLL_INTERVAL = 0.5
+
+
+class VirtualNode(object):
+    """A simulated Node and its Device, Source, Flow, Sender and Receiver resources"""
+
+    def __init__(self, templates, index, description, api_version):
+        ids = {resource_type: str(uuid.uuid4()) for resource_type in RESOURCE_TYPES}
+        self.id = ids["node"]
+        self.index = index
+        self.resources = []
+        for resource_type in RESOURCE_TYPES:
+            data = deepcopy(templates[resource_type])
+            data["id"] = ids[resource_type]
+            data["label"] = "Load Test {} {}".format(resource_type.capitalize(), index)
+            data["description"] = description
+            if resource_type == "device":
+                data["node_id"] = ids["node"]
+                data["senders"] = []
+                data["receivers"] = []
+            elif resource_type == "flow":
+                data["device_id"] = ids["device"]
+                data["source_id"] = ids["source"]
+            elif resource_type in ["source", "sender", "receiver"]:
+                data["device_id"] = ids["device"]
+                if resource_type == "sender":
+                    data["flow_id"] = ids["flow"]
+            self.resources.append((resource_type, IS04Utils.downgrade_resource(resource_type, data, api_version)))
+
+        # Set while the Node is being deleted or re-registered, to suppress its heartbeats
+        self.busy = False
+        # Incremented each time the Node is deleted or re-registered, to identify heartbeats in flight at the time
+        self.churns = 0
+        self.registered = False
+        self.last_heartbeat = None
+
+    @staticmethod
+    def load_templates():
+        """Loads the resource data on which simulated Nodes are based from files"""
+        templates = dict()
+        for resource_type in RESOURCE_TYPES:
+            with open("test_data/IS0402/v1.3_{}.json".format(resource_type)) as resource_data:
+                templates[resource_type] = json.load(resource_data)
+        return templates
+
+    def register(self, pool, reg_url):
+        """Register all of the resources using the given HTTPClientPool, returning the type, outcome and latency
+        of each request"""
+        results = []
+        for resource_type, data in self.resources:
+            data["version"] = NMOSUtils.get_TAI_time()
+            valid, response, latency = pool.request("POST", reg_url + "resource",
+                                                    json={"type": resource_type, "data": data})
+            status = response.status_code if valid else response
+            results.append((resource_type, valid, status, latency))
+            if not valid or status not in [200, 201]:
+                break
+            if resource_type == "node":
+                self.registered = True
+                self.last_heartbeat = time.time()
+        return results
+
+
+class IS0405Test(GenericTest):
+    """
+    Runs IS-04-05-Test
+    Simulates a fleet of Nodes in order to load test a Registry
+    """
+    def __init__(self, apis, auths, **kwargs):
+        GenericTest.__init__(self, apis, disable_auto=True, auths=auths, **kwargs)
+        self.reg_url = self.apis[REG_API_KEY]["url"]
+        self.query_url = self.apis[QUERY_API_KEY]["url"]
+        if self.apis[REG_API_KEY]["version"] != self.apis[QUERY_API_KEY]["version"]:
+            raise NMOSInitException("The Registration and Query API versions under test must be identical")
+        self.pool = None
+        self.nodes = []
+        # Heartbeats are performed on their own executor so that they aren't queued behind registrations
+        self.heartbeat_executor = None
+        self.heartbeat_thread = None
+        self.heartbeat_stop = threading.Event()
+        self.churn_enabled = False
+        self.stats_lock = threading.Lock()
+        self.stats = None
+
+    def set_up_tests(self):
+        self.pool = HTTPClientPool(CONFIG.LOAD_TEST_CONCURRENCY)
+        self.heartbeat_executor = ThreadPoolExecutor(max_workers=CONFIG.LOAD_TEST_CONCURRENCY)
+        templates = VirtualNode.load_templates()
+        description = "NMOS Testing Tool Load Test {}".format(uuid.uuid4())
+        api_version = self.apis[REG_API_KEY]["version"]
+        self.nodes = [VirtualNode(templates, index, description, api_version)
+                      for index in range(CONFIG.LOAD_TEST_NODE_COUNT)]
+        self.reset_stats()
+
+    def tear_down_tests(self):
+        self.stop_heartbeats()
+        if self.heartbeat_executor:
+            self.heartbeat_executor.shutdown(wait=True)
+            self.heartbeat_executor = None
+        if self.pool:
+            # Remove any simulated Nodes which remain registered
+            wait([self.pool.submit("DELETE", self.reg_url + "resource/nodes/" + node.id)
+                  for node in self.nodes if node.registered])
+            self.pool.close()
+            self.pool = None
+
+    def test_01(self, test):
+        """Registry accepts registrations from a fleet of simulated Nodes"""
+
+        self.start_heartbeats()
+
+        start_time = time.time()
+        results = list(self.pool.executor.map(self.register_node, self.nodes))
+        duration = time.time() - start_time
+
+        latencies = defaultdict(list)
+        failures = []
+        for node_results in results:
+            for resource_type, valid, status, latency in node_results:
+                latencies[resource_type].append(latency)
+                if not valid or status not in [200, 201]:
+                    failures.append("{} {}".format(resource_type, status))
+
+        num_requests = sum(len(_) for _ in latencies.values())
+        detail = "Registered {} Nodes ({} resources) in {:.1f}s ({:.0f} registrations/s). Latency {}".format(
+            len(self.nodes), num_requests, duration, num_requests / duration if duration else 0,
+            "; ".join("{}: {}".format(_, format_latencies(latencies[_])) for _ in RESOURCE_TYPES))
+
+        if failures:
+            return test.FAIL("{} of {} registrations failed (e.g. {}). {}"
+                             .format(len(failures), num_requests, failures[0], detail))
+        return test.PASS(detail)
+
+    @test_depends
+    def test_02(self, test):
+        """Registry accepts heartbeats from a fleet of simulated Nodes while Nodes are deleted and re-registered"""
+
+        self.reset_stats()
+        self.churn_enabled = True
+        print(" * Simulating {} Nodes for {} seconds".format(len(self.nodes), CONFIG.LOAD_TEST_DURATION))
+        sleep(CONFIG.LOAD_TEST_DURATION)
+        self.churn_enabled = False
+
+        with self.stats_lock:
+            stats = self.stats
+            self.reset_stats()
+
+        num_heartbeats = len(stats["heartbeat_latencies"])
+        num_rejected = sum(stats["heartbeat_rejections"].values())
+        rejection_rate = num_rejected / num_heartbeats if num_heartbeats else 0
+        detail = "Heartbeats: {} ({:.1f}/s), {:.2%} rejected {}. Latency {}. Re-registrations: {}, " \
+                 "deletions: {}, failed: {}. Re-registration latency {}. Deletion latency {}".format(
+                     num_heartbeats, num_heartbeats / CONFIG.LOAD_TEST_DURATION, rejection_rate,
+                     dict(stats["heartbeat_rejections"]), format_latencies(stats["heartbeat_latencies"]),
+                     len(stats["reregister_latencies"]), len(stats["delete_latencies"]), stats["churn_failures"],
+                     format_latencies(stats["reregister_latencies"]), format_latencies(stats["delete_latencies"]))
+
+        if num_heartbeats == 0:
+            return test.UNCLEAR("No heartbeats were performed. {}".format(detail))
+        if num_rejected or stats["churn_failures"]:
+            return test.FAIL(detail)
+        return test.PASS(detail)
+
+    @test_depends
+    def test_03(self, test):
+        """Registry garbage collects a fleet of simulated Nodes once they stop heartbeating"""
+
+        self.stop_heartbeats()
+
+        pending = {node.id: node for node in self.nodes if node.registered and node.last_heartbeat}
+        if not pending:
+            return test.UNCLEAR("No simulated Nodes are registered")
+
+        # Allow up to twice the garbage collection timeout after the most recent heartbeat
+        deadline = max(node.last_heartbeat for node in pending.values()) + CONFIG.GARBAGE_COLLECTION_TIMEOUT * 2
+        gc_times = []
+        errors = []
+        while pending and time.time() < deadline:
+            poll_time = time.time()
+            futures = {self.pool.submit("GET", self.query_url + "nodes/" + node_id): node_id for node_id in pending}
+            wait(futures)
+            for future, node_id in futures.items():
+                valid, response, latency = future.result()
+                if not valid:
+                    errors.append(response)
+                elif response.status_code == 404:
+                    node = pending.pop(node_id)
+                    node.registered = False
+                    gc_times.append(poll_time - node.last_heartbeat)
+                elif response.status_code != 200:
+                    errors.append("{} {}".format(response.status_code, response.text))
+            sleep(max(0, poll_time + GC_POLL_INTERVAL - time.time()))
+
+        detail = "Time to garbage collection {}".format(format_latencies(gc_times))
+        if pending:
+            return test.FAIL("{} of {} Nodes were not garbage collected within {} seconds of their last heartbeat. {}"
+                             .format(len(pending), len(pending) + len(gc_times),
+                                     CONFIG.GARBAGE_COLLECTION_TIMEOUT * 2, detail))
+        if errors:
+            return test.FAIL("Query API returned an unexpected response: {}. {}".format(errors[0], detail))
+
+        # Allow one whole second, since health is in whole seconds, plus the polling interval
+        late = [_ for _ in gc_times if _ > CONFIG.GARBAGE_COLLECTION_TIMEOUT + 1 + GC_POLL_INTERVAL]
+        if late:
+            return test.WARNING("{} of {} Nodes were garbage collected more than {} seconds after their last "
+                                "heartbeat. {}".format(len(late), len(gc_times),
+                                                       CONFIG.GARBAGE_COLLECTION_TIMEOUT, detail))
+        return test.PASS(detail)
+
+    def reset_stats(self):
+        self.stats = {
+            "heartbeat_latencies": [],
+            "heartbeat_rejections": defaultdict(int),
+            "reregister_latencies": [],
+            "delete_latencies": [],
+            "churn_failures": 0
+        }
+
+    def register_node(self, node):
+        """Register all of a simulated Node's resources, returning the type, outcome and latency of each request"""
+        return node.register(self.pool, self.reg_url)
+
+    def heartbeat_node(self, node):
+        churns = node.churns
+        if not node.registered or node.busy:
+            # The Node has been churned since its heartbeat was scheduled
+            return
+        valid, response, latency = self.pool.request("POST", self.reg_url + "health/nodes/" + node.id)
+        if node.churns != churns:
+            # The Node was deleted or re-registered while the heartbeat was in flight, so it may rightly be rejected
+            return
+        with self.stats_lock:
+            self.stats["heartbeat_latencies"].append(latency)
+            if not valid:
+                self.stats["heartbeat_rejections"]["error"] += 1
+            elif response.status_code != 200:
+                self.stats["heartbeat_rejections"][response.status_code] += 1
+        if valid and response.status_code == 200:
+            node.last_heartbeat = time.time()
+
+    def churn_node(self, node, delete):
+        """Delete and/or re-register a simulated Node and its resources"""
+        failed = False
+        if delete:
+            valid, response, latency = self.pool.request("DELETE", self.reg_url + "resource/nodes/" + node.id)
+            failed = not valid or response.status_code != 204
+            with self.stats_lock:
+                self.stats["delete_latencies"].append(latency)
+            node.registered = False
+        start_time = time.time()
+        results = self.register_node(node)
+        failed = failed or any(not valid or status not in [200, 201] for _, valid, status, _ in results)
+        with self.stats_lock:
+            self.stats["reregister_latencies"].append(time.time() - start_time)
+            if failed:
+                self.stats["churn_failures"] += 1
+        node.busy = False
+
+    def start_heartbeats(self):
+        self.heartbeat_stop.clear()
+        self.heartbeat_thread = threading.Thread(target=self.heartbeat_scheduler, daemon=True)
+        self.heartbeat_thread.start()
+
+    def stop_heartbeats(self):
+        if self.heartbeat_thread:
+            self.heartbeat_stop.set()
+            self.heartbeat_thread.join()
+            self.heartbeat_thread = None
+
+    def heartbeat_scheduler(self):
+        """Heartbeat each registered Node every HEARTBEAT_INTERVAL, spreading the heartbeats evenly over the interval,
+        and delete or re-register a proportion of the Nodes during each interval while churn is enabled"""
+        if not self.nodes:
+            return
+        interval = CONFIG.HEARTBEAT_INTERVAL
+        start_time = time.time()
+        schedule = [(start_time + interval * index / len(self.nodes), index) for index in range(len(self.nodes))]
+        heapq.heapify(schedule)
+        next_churn = start_time + interval
+        pending = []
+
+        while not self.heartbeat_stop.is_set():
+            due, index = heapq.heappop(schedule)
+            if self.heartbeat_stop.wait(max(0, due - time.time())):
+                break
+
+            if time.time() >= next_churn:
+                next_churn += interval
+                if self.churn_enabled:
+                    count = int(round(CONFIG.LOAD_TEST_CHURN * len(self.nodes)))
+                    for node in NMOSUtils.RANDOM.sample(self.nodes, min(count, len(self.nodes))):
+                        if node.registered and not node.busy:
+                            node.busy = True
+                            node.churns += 1
+                            pending.append(self.heartbeat_executor.submit(self.churn_node, node,
+                                                                          NMOSUtils.RANDOM.random() < 0.5))
+                pending = [_ for _ in pending if not _.done()]
+
+            node = self.nodes[index]
+            if node.registered and not node.busy:
+                pending.append(self.heartbeat_executor.submit(self.heartbeat_node, node))
+            heapq.heappush(schedule, (due + interval, index))
+
+        wait(pending)
@@ -0,0 +1,239 @@
+# Copyright (C) 2026 Advanced Media Workflow Association
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import threading
+import time
+import uuid
+
+from concurrent.futures import wait
+
+from .. import Config as CONFIG
+from ..GenericTest import GenericTest, NMOSInitException, NMOS_WIKI_URL
+from ..NMOSUtils import NMOSUtils
+from ..PerformanceUtils import HTTPClientPool, format_latencies, summarise_latencies
+from .IS0405Test import RESOURCE_TYPES, VirtualNode
+
+REG_API_KEY = "registration"
+QUERY_API_KEY = "query"
+
+
+class IS0406Test(GenericTest):
+    """
+    Runs IS-04-06-Test
+    Benchmarks the Query API of a Registry seeded with a population of simulated Nodes
+    """
+    def __init__(self, apis, auths, **kwargs):
+        GenericTest.__init__(self, apis, disable_auto=True, auths=auths, **kwargs)
+        self.reg_url = self.apis[REG_API_KEY]["url"]
+        self.query_url = self.apis[QUERY_API_KEY]["url"]
+        if self.apis[REG_API_KEY]["version"] != self.apis[QUERY_API_KEY]["version"]:
+            raise NMOSInitException("The Registration and Query API versions under test must be identical")
+        self.pool = None
+        self.nodes = []
+        # Used to select only the seeded resources, so must be safe to use in both basic and RQL queries
+        self.description = "nmos-testing-benchmark-{}".format(uuid.uuid4().hex)
+        self.heartbeat_thread = None
+        self.heartbeat_stop = threading.Event()
+        self.seed_failures = []
+
+    def set_up_tests(self):
+        self.pool = HTTPClientPool(CONFIG.LOAD_TEST_CONCURRENCY)
+        templates = VirtualNode.load_templates()
+        api_version = self.apis[REG_API_KEY]["version"]
+        self.nodes = [VirtualNode(templates, index, self.description, api_version)
+                      for index in range(CONFIG.LOAD_TEST_NODE_COUNT)]
+
+        print(" * Seeding Registry with {} Nodes".format(len(self.nodes)))
+        self.seed_failures = [failure for failures in self.pool.executor.map(self.register_node, self.nodes)
+                              for failure in failures]
+
+        # Keep the seeded resources from being garbage collected while the benchmarks run
+        self.heartbeat_stop.clear()
+        self.heartbeat_thread = threading.Thread(target=self.heartbeat_loop, daemon=True)
+        self.heartbeat_thread.start()
+
+    def tear_down_tests(self):
+        if self.heartbeat_thread:
+            self.heartbeat_stop.set()
+            self.heartbeat_thread.join()
+            self.heartbeat_thread = None
+        if self.pool:
+            wait([self.pool.submit("DELETE", self.reg_url + "resource/nodes/" + node.id)
+                  for node in self.nodes if node.registered])
+            self.pool.close()
+            self.pool = None
+
+    def test_01(self, test):
+        """Query API sustains concurrent basic queries for each resource type"""
+
+        if self.seed_failures:
+            return self.seed_failure_result(test)
+
+        return self.benchmark(test, lambda resource_type, index: {"description": self.description})
+
+    def test_02(self, test):
+        """Query API sustains concurrent RQL queries for each resource type"""
+
+        if self.apis[QUERY_API_KEY]["version"] == "v1.0":
+            return test.NA("This test does not apply to v1.0")
+
+        if self.seed_failures:
+            return self.seed_failure_result(test)
+
+        query = "eq(description,{})".format(self.description)
+        valid, response, _ = self.pool.request("GET", self.query_url + "nodes", params={"query.rql": query})
+        if not valid:
+            return test.FAIL("Query API failed to respond to query")
+        elif response.status_code in [400, 501]:
+            return test.OPTIONAL("Query API signalled that it does not support this RQL query. This may be "
+                                 "important for scalability.",
+                                 NMOS_WIKI_URL + "/IS-04#registries-resource-query-language-rql")
+
+        return self.benchmark(test, lambda resource_type, index: {"query.rql": query})
+
+    def test_03(self, test):
+        """Query API sustains concurrent paged walks of each resource type"""
+
+        if self.apis[QUERY_API_KEY]["version"] == "v1.0":
+            return test.NA("This test does not apply to v1.0")
+
+        if self.seed_failures:
+            return self.seed_failure_result(test)
+
+        results = {}
+        for resource_type in RESOURCE_TYPES:
+            # Each walk makes several requests, so make roughly the same number of requests in total as other tests
+            expected_pages = max(CONFIG.LOAD_TEST_NODE_COUNT // CONFIG.QUERY_BENCHMARK_PAGE_LIMIT, 1) + 1
+            walks = max(CONFIG.QUERY_BENCHMARK_REQUESTS // expected_pages, 1)
+            start_time = time.time()
+            walk_results = list(self.pool.executor.map(lambda _: self.paged_walk(resource_type), range(walks)))
+            duration = time.time() - start_time
+
+            counts = [count for _, count, _ in walk_results]
+            if any(_ != len(self.nodes) for _ in counts):
+                return test.FAIL("Paged walk of {}s returned {} resources when {} were expected"
+                                 .format(resource_type, next(_ for _ in counts if _ != len(self.nodes)),
+                                         len(self.nodes)))
+            results[resource_type] = ([result for page_results, _, _ in walk_results for result in page_results],
+                                      duration)
+
+        return self.report(test, results)
+
+    def test_04(self, test):
+        """Query API sustains concurrent paged queries using 'since' and 'until' windows for each resource type"""
+
+        if self.apis[QUERY_API_KEY]["version"] == "v1.0":
+            return test.NA("This test does not apply to v1.0")
+
+        if self.seed_failures:
+            return self.seed_failure_result(test)
+
+        # Use the boundaries of the pages returned by a paged walk as realistic window limits
+        boundaries = {}
+        for resource_type in RESOURCE_TYPES:
+            boundaries[resource_type] = self.paged_walk(resource_type)[2]
+            if len(boundaries[resource_type]) < 2:
+                return test.UNCLEAR("Too few pages of {}s were returned to select a window".format(resource_type))
+
+        def window(resource_type, index):
+            since, until = sorted(NMOSUtils.RANDOM.sample(boundaries[resource_type], 2),
+                                  key=lambda _: tuple(int(part) for part in _.split(":")))
+            return {"description": self.description, "paging.since": since, "paging.until": until,
+                    "paging.limit": CONFIG.QUERY_BENCHMARK_PAGE_LIMIT}
+
+        return self.benchmark(test, window)
+
+    def seed_failure_result(self, test):
+        """The result of a benchmark which cannot be run against a partially seeded Registry"""
+        return test.UNCLEAR("Registry failed to accept {} seed registrations (e.g. {})"
+                            .format(len(self.seed_failures), self.seed_failures[0]))
+
+    def register_node(self, node):
+        """Register all of a simulated Node's resources, returning a description of any failures"""
+        for resource_type, valid, status, _ in node.register(self.pool, self.reg_url):
+            if not valid or status not in [200, 201]:
+                return ["{} {}".format(resource_type, status)]
+        return []
+
+    def heartbeat_loop(self):
+        while not self.heartbeat_stop.wait(CONFIG.HEARTBEAT_INTERVAL):
+            wait([self.pool.submit("POST", self.reg_url + "health/nodes/" + node.id)
+                  for node in self.nodes if node.registered])
+
+    def query(self, resource_type, params):
+        """Perform a Query API request, returning the outcome, latency and number of bytes received"""
+        valid, response, latency = self.pool.request("GET", self.query_url + resource_type + "s", params=params)
+        if not valid:
+            return response, latency, 0, None
+        error = None if response.status_code == 200 else "{} {}".format(response.status_code, response.text)
+        return error, latency, len(response.content), response
+
+    def paged_walk(self, resource_type):
+        """Walk back through every page of the seeded resources of the given type, returning the result of each
+        request, the number of resources returned, and the 'paging.since' boundary of each page"""
+        results = []
+        boundaries = []
+        count = 0
+        params = {"description": self.description, "paging.limit": CONFIG.QUERY_BENCHMARK_PAGE_LIMIT}
+        while True:
+            error, latency, size, response = self.query(resource_type, params)
+            results.append((error, latency, size))
+            if error:
+                break
+            resources = response.json()
+            count += len(resources)
+            since = response.headers.get("X-Paging-Since")
+            limit = response.headers.get("X-Paging-Limit")
+            if not resources or not since or not limit or len(resources) < int(limit):
+                break
+            boundaries.append(since)
+            params = dict(params, **{"paging.until": since})
+        return results, count, boundaries
+
+    def benchmark(self, test, get_params):
+        """Make QUERY_BENCHMARK_REQUESTS concurrent requests for each resource type using the query parameters
+        returned by get_params, and report the results"""
+        results = {}
+        for resource_type in RESOURCE_TYPES:
+            params = [get_params(resource_type, index) for index in range(CONFIG.QUERY_BENCHMARK_REQUESTS)]
+            start_time = time.time()
+            query_results = list(self.pool.executor.map(lambda _: self.query(resource_type, _)[:3], params))
+            results[resource_type] = (query_results, time.time() - start_time)
+        return self.report(test, results)
+
+    def report(self, test, results):
+        """Record the request rate, latency and bytes received for each resource type as test metrics"""
+        details = []
+        errors = []
+        for resource_type in RESOURCE_TYPES:
+            query_results, duration = results[resource_type]
+            latencies = [latency for _, latency, _ in query_results]
+            num_bytes = sum(size for _, _, size in query_results)
+            errors += [error for error, _, _ in query_results if error]
+            rate = len(query_results) / duration if duration else 0
+            test.metrics[resource_type] = {
+                "requests": len(query_results),
+                "duration": duration,
+                "requests_per_second": rate,
+                "latency": summarise_latencies(latencies),
+                "bytes": num_bytes,
+                "errors": len([_ for _ in query_results if _[0]])
+            }
+            details.append("{}: {:.0f} req/s, {}, {} bytes".format(resource_type, rate, format_latencies(latencies),
+                                                                   num_bytes))
+
+        detail = "; ".join(details)
+        if errors:
+            return test.FAIL("{} requests failed (e.g. {}). {}".format(len(errors), errors[0], detail))
+        return test.PASS(detail)
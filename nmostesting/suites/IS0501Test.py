@@ -17,13 +17,11 @@
 
 import functools
 import uuid
-import subprocess
-import tempfile
-import os
 from jsonschema import ValidationError, SchemaError
 
 from ..GenericTest import GenericTest, NMOSTestException
 from ..IS05Utils import IS05Utils
+from ..SDPUtils import SDPLinter, SDPOKER_MIN_VERSION, get_sdpoker_version
 from ..TestHelper import load_resolved_schema, check_content_type
 
 CONN_API_KEY = "connection"
@@ -913,86 +911,51 @@ class IS0501Test(GenericTest):
             return test.UNCLEAR("Not tested. No RTP senders found.")
 
         # Check SDPoker version
-        sdpoker_min_version = "0.3.0"
-        try:
-            cmd_string = "sdpoker --version"
-            output = subprocess.check_output(cmd_string, stderr=subprocess.STDOUT, shell=True)
-            running_ver = output.decode("utf-8").split(".")
-            expected_ver = sdpoker_min_version.split(".")
-            if (running_ver[0] < expected_ver[0] or
-                    (running_ver[0] == expected_ver[0] and running_ver[1] < expected_ver[1]) or
-                    (running_ver[0] == expected_ver[0] and running_ver[1] == expected_ver[1] and
-                        running_ver[2] < expected_ver[2])):
-                return test.FAIL("SDPoker version is too old. Please update to version {}".format(sdpoker_min_version))
-        except (subprocess.CalledProcessError, IndexError):
-            return test.DISABLED("SDPoker may be unavailable on this system. Please see the README for "
-                                 "installation instructions.")
+        sdpoker_version = get_sdpoker_version()
+        if sdpoker_version and sdpoker_version < SDPOKER_MIN_VERSION:
+            return test.FAIL("SDPoker version is too old. Please update to version {}"
+                             .format(".".join(str(_) for _ in SDPOKER_MIN_VERSION)))
 
-        # First pass to check for errors
         access_error = False
 
+        # Download SDP files
         sdp_files = {}
-        try:
-            # Download SDP files
-            for sender in rtp_senders:
-                path = "single/senders/{}/transportfile".format(sender)
-                url = self.url + path
-                valid, response = self.do_request("GET", url)
-                if valid and response.status_code == 200:
-                    file, temp_path = tempfile.mkstemp()
-                    for chunk in response.iter_content(chunk_size=128):
-                        os.write(file, chunk)
-                    os.close(file)
-                    sdp_files[sender] = temp_path
-                elif valid and response.status_code == 404:
-                    access_error = True
-                else:
-                    return test.FAIL("Unexpected response from Connection API "
-                                     "downloading SDP file for Sender {}: {}".format(sender, response))
+        for sender in rtp_senders:
+            path = "single/senders/{}/transportfile".format(sender)
+            url = self.url + path
+            valid, response = self.do_request("GET", url)
+            if valid and response.status_code == 200:
+                sdp_files[sender] = (response.content.decode("utf-8", "replace"), sender in dup_senders)
+            elif valid and response.status_code == 404:
+                access_error = True
+            else:
+                return test.FAIL("Unexpected response from Connection API "
+                                 "downloading SDP file for Sender {}: {}".format(sender, response))
 
-            for sender in sdp_files:
-                dup_params = ""
-                if sender in dup_senders:
-                    dup_params = " --duplicate true"
-                try:
-                    cmd_string = "sdpoker --shaping true{} {}".format(dup_params, sdp_files[sender])
-                    output = subprocess.check_output(cmd_string, stderr=subprocess.STDOUT, shell=True)
-                    decoded_output = output.decode("utf-8")
-                    if "Error" in decoded_output:
-                        # This case exits with a zero error code so can't be handled in the exception
-                        # These usually start with "{ StatusCodeError:" or "Error:"
-                        return test.FAIL("SDPoker error for Sender {} transport file: {}"
-                                         .format(sender, decoded_output))
-                except subprocess.CalledProcessError as e:
-                    output = str(e.output, "utf-8")
-                    return test.FAIL("SDPoker error for Sender {} transport file: {}".format(sender, output))
-
-            # Second pass to check for warnings
-            for sender in sdp_files:
-                dup_params = ""
-                if sender in dup_senders:
-                    dup_params = " --duplicate true"
-                try:
-                    cmd_string = "sdpoker --shaping true --whitespace true --should true " \
-                                "--checkEndings true{} {}".format(dup_params, sdp_files[sender])
-                    output = subprocess.check_output(cmd_string, stderr=subprocess.STDOUT, shell=True)
-                    decoded_output = output.decode("utf-8")
-                    if "Error" in decoded_output:
-                        # This case exits with a zero error code so can't be handled in the exception
-                        # These usually start with "{ StatusCodeError:" or "Error:"
-                        return test.FAIL("SDPoker error for Sender {} transport file: {}"
-                                         .format(sender, decoded_output))
-                except subprocess.CalledProcessError as e:
-                    output = str(e.output, "utf-8")
-                    return test.WARNING("SDPoker warning for Sender {} transport file: {}".format(sender, output))
-
-            if access_error:
-                return test.UNCLEAR("One or more of the tested transport files returned a 404 HTTP code. Please "
-                                    "ensure 'master_enable' is set to true for all Senders and re-test.")
-
-        finally:
-            for sender in sdp_files:
-                os.remove(sdp_files[sender])
+        # Identical SDP files are only checked once, and the SDPoker checks are run concurrently
+        linter = SDPLinter(use_sdpoker=sdpoker_version is not None)
+
+        # First pass to check for errors
+        findings = linter.lint(sdp_files)
+        if findings:
+            sender, (_, message) = next(iter(findings.items()))
+            return test.FAIL("SDP error for Sender {} transport file: {}".format(sender, message))
+
+        # Second pass to check for warnings
+        findings = linter.lint(sdp_files, strict=True)
+        if findings:
+            sender, (fatal, message) = next(iter(findings.items()))
+            if fatal:
+                return test.FAIL("SDP error for Sender {} transport file: {}".format(sender, message))
+            return test.WARNING("SDP warning for Sender {} transport file: {}".format(sender, message))
+
+        if access_error:
+            return test.UNCLEAR("One or more of the tested transport files returned a 404 HTTP code. Please "
+                                "ensure 'master_enable' is set to true for all Senders and re-test.")
+
+        if sdpoker_version is None:
+            return test.DISABLED("SDPoker may be unavailable on this system, so only basic SDP checks were "
+                                 "performed. Please see the README for installation instructions.")
 
         return test.PASS()
 
@@ -12,17 +12,19 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import time
 import uuid
 import re
 from requests.compat import json
 from copy import deepcopy
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from random import randint
 from jinja2 import Template
 
 from ..GenericTest import GenericTest, NMOSTestException
+from ..Instrumentation import sleep
 from ..IS05Utils import IS05Utils
+from ..NMOSUtils import NodeResourceSnapshot
 from .. import Config as CONFIG
 from ..TestHelper import compare_json, get_default_ip
 
@@ -55,16 +57,12 @@ class IS0502Test(GenericTest):
         if resource_type in self.is04_resources["_requested"]:
             return True, ""
 
-        valid, resources = self.do_request("GET", self.node_url + resource_type)
+        valid, resources = NodeResourceSnapshot.for_node(self.node_url).get(resource_type)
         if not valid:
-            return False, "Node API did not respond as expected: {}".format(resources)
+            return False, resources
 
-        try:
-            for resource in resources.json():
-                self.is04_resources[resource_type].append(resource)
-            self.is04_resources["_requested"].append(resource_type)
-        except json.JSONDecodeError:
-            return False, "Non-JSON response returned from Node API"
+        self.is04_resources[resource_type] = list(resources)
+        self.is04_resources["_requested"].append(resource_type)
 
         return True, ""
 
@@ -74,6 +72,7 @@ class IS0502Test(GenericTest):
             self.is04_resources["_requested"].remove(resource_type)
             self.is04_resources[resource_type] = []
 
+        NodeResourceSnapshot.for_node(self.node_url).invalidate(resource_type)
         return self.get_is04_resources(resource_type)
 
     def get_is05_resources(self, resource_type):
@@ -136,54 +135,80 @@ class IS0502Test(GenericTest):
 
         return result
 
+    def index_is04_resources(self, resource_type):
+        """Index the cached IS-04 Senders or Receivers by ID"""
+        return {is04_resource["id"]: is04_resource for is04_resource in self.is04_resources[resource_type]}
+
+    def activation_sweep(self, resource_list, activate):
+        """Call activate for each resource, with up to IS05_MAX_CONCURRENT_ACTIVATIONS in progress at a time, then wait
+        once for all the activations to be processed, returning a dict of resource ID -> result of its activation"""
+        with ThreadPoolExecutor(max_workers=CONFIG.IS05_MAX_CONCURRENT_ACTIVATIONS) as executor:
+            results = list(executor.map(activate, resource_list))
+
+        if resource_list:
+            sleep(CONFIG.API_PROCESSING_TIMEOUT)
+
+        return dict(zip(resource_list, results))
+
+    def get_is04_resources_by_id(self, resource_type, resource_list):
+        """Refresh each of the specified Senders or Receivers from a Node API concurrently, returning a dict of
+        resource ID -> result of its request"""
+        def get_is04_resource(resource_id):
+            return NodeResourceSnapshot.for_node(self.node_url).refresh(resource_type, resource_id)
+
+        with ThreadPoolExecutor(max_workers=CONFIG.IS05_MAX_CONCURRENT_ACTIVATIONS) as executor:
+            return dict(zip(resource_list, executor.map(get_is04_resource, resource_list)))
+
     def activate_check_version(self, resource_type, resource_list):
+        is04_index = self.index_is04_resources(resource_type)
+        found_04_resources = [is05_resource for is05_resource in resource_list if is05_resource in is04_index]
+
+        def activate(is05_resource):
+            method = self.is05_utils.check_perform_immediate_activation
+            transport_type = self.is05_resources["transport_types"][is05_resource]
+            return self.is05_utils.check_activation(resource_type.rstrip("s"), is05_resource, method, transport_type)
+
+        activations = self.activation_sweep(found_04_resources, activate)
+        responses = self.get_is04_resources_by_id(resource_type, found_04_resources)
+
         try:
             for is05_resource in resource_list:
-                found_04_resource = False
-                for is04_resource in self.is04_resources[resource_type]:
-                    if is04_resource["id"] == is05_resource:
-                        found_04_resource = True
-                        current_ver = is04_resource["version"]
-                        transport_type = self.is05_resources["transport_types"][is05_resource]
-
-                        if resource_type == "receivers":
-                            # also check 'caps' version defined by BCP-004-01
-                            current_caps = is04_resource["caps"]
-                            current_caps_ver = current_caps["version"] if "version" in current_caps else None
-
-                        method = self.is05_utils.check_perform_immediate_activation
-                        valid, response = self.is05_utils.check_activation(resource_type.rstrip("s"), is05_resource,
-                                                                           method, transport_type)
-                        if not valid:
-                            return False, response
-
-                        time.sleep(CONFIG.API_PROCESSING_TIMEOUT)
-
-                        valid, response = self.do_request("GET", self.node_url + resource_type + "/" + is05_resource)
-                        if not valid:
-                            return False, "Node API did not respond as expected: {}".format(response)
-                        new_is04_resource = response.json()
-
-                        new_ver = new_is04_resource["version"]
-
-                        if self.is05_utils.compare_resource_version(new_ver, current_ver) != 1:
-                            return False, "IS-04 resource version did not change when {} {} was activated" \
-                                          .format(resource_type.rstrip("s").capitalize(), is05_resource)
-
-                        if resource_type == "receivers" and current_caps_ver:
-                            # the 'caps' version shouldn't change unless something else in 'caps' has changed
-                            # and that shouldn't happen as a result of the activation
-                            new_caps = new_is04_resource["caps"]
-                            new_caps_ver = new_caps["version"]
-                            if self.is05_utils.compare_resource_version(new_caps_ver, current_caps_ver) != 0:
-                                new_caps["version"] = current_caps_ver
-                                if compare_json(new_caps, current_caps):
-                                    return False, "IS-04 caps version changed when {} {} was activated" \
-                                                  .format(resource_type.rstrip("s").capitalize(), is05_resource)
-
-                if not found_04_resource:
+                if is05_resource not in is04_index:
                     return False, "Unable to find an IS-04 resource with ID {}".format(is05_resource)
 
+                is04_resource = is04_index[is05_resource]
+                current_ver = is04_resource["version"]
+
+                if resource_type == "receivers":
+                    # also check 'caps' version defined by BCP-004-01
+                    current_caps = is04_resource["caps"]
+                    current_caps_ver = current_caps["version"] if "version" in current_caps else None
+
+                valid, response = activations[is05_resource]
+                if not valid:
+                    return False, response
+
+                valid, new_is04_resource = responses[is05_resource]
+                if not valid:
+                    return False, new_is04_resource
+
+                new_ver = new_is04_resource["version"]
+
+                if self.is05_utils.compare_resource_version(new_ver, current_ver) != 1:
+                    return False, "IS-04 resource version did not change when {} {} was activated" \
+                                  .format(resource_type.rstrip("s").capitalize(), is05_resource)
+
+                if resource_type == "receivers" and current_caps_ver:
+                    # the 'caps' version shouldn't change unless something else in 'caps' has changed
+                    # and that shouldn't happen as a result of the activation
+                    new_caps = new_is04_resource["caps"]
+                    new_caps_ver = new_caps["version"]
+                    if self.is05_utils.compare_resource_version(new_caps_ver, current_caps_ver) != 0:
+                        new_caps["version"] = current_caps_ver
+                        if compare_json(new_caps, current_caps):
+                            return False, "IS-04 caps version changed when {} {} was activated" \
+                                          .format(resource_type.rstrip("s").capitalize(), is05_resource)
+
         except json.JSONDecodeError:
             return False, "Non-JSON response returned from Node API"
         except KeyError:
@@ -192,98 +217,89 @@ class IS0502Test(GenericTest):
         return True, ""
 
     def activate_check_parked(self, resource_type, resource_list):
-        for is05_resource in resource_list:
-            valid, response = self.is05_utils.park_resource(resource_type, is05_resource)
+        activations = self.activation_sweep(
+            resource_list, lambda is05_resource: self.is05_utils.park_resource(resource_type, is05_resource))
+        for valid, response in activations.values():
             if not valid:
                 return False, response
 
-        time.sleep(CONFIG.API_PROCESSING_TIMEOUT)
-
         valid, result = self.refresh_is04_resources(resource_type)
         if not valid:
             return False, result
 
         try:
             api = self.apis[NODE_API_KEY]
+            is04_index = self.index_is04_resources(resource_type)
             for is05_resource in resource_list:
-                found_04_resource = False
-                for is04_resource in self.is04_resources[resource_type]:
-                    if is04_resource["id"] == is05_resource:
-                        found_04_resource = True
-                        subscription = is04_resource["subscription"]
-
-                        # Only IS-04 v1.2+ has an 'active' subscription key
-                        if self.is05_utils.compare_api_version(api["version"], "v1.2") >= 0:
-                            if subscription["active"] is not False:
-                                return False, "IS-04 {} {} was not marked as inactive when IS-05 master_enable set to" \
-                                              " false".format(resource_type.rstrip("s").capitalize(), is05_resource)
-
-                        id_key = "sender_id"
-                        if resource_type == "senders":
-                            id_key = "receiver_id"
-                        if subscription[id_key] is not None:
-                            return False, "IS-04 {} {} still indicates a subscribed '{}' when parked".format(
-                                          resource_type.rstrip("s").capitalize(), is05_resource, id_key)
-
-                if not found_04_resource:
+                if is05_resource not in is04_index:
                     return False, "Unable to find an IS-04 resource with ID {}".format(is05_resource)
 
+                subscription = is04_index[is05_resource]["subscription"]
+
+                # Only IS-04 v1.2+ has an 'active' subscription key
+                if self.is05_utils.compare_api_version(api["version"], "v1.2") >= 0:
+                    if subscription["active"] is not False:
+                        return False, "IS-04 {} {} was not marked as inactive when IS-05 master_enable set to" \
+                                      " false".format(resource_type.rstrip("s").capitalize(), is05_resource)
+
+                id_key = "sender_id"
+                if resource_type == "senders":
+                    id_key = "receiver_id"
+                if subscription[id_key] is not None:
+                    return False, "IS-04 {} {} still indicates a subscribed '{}' when parked".format(
+                                  resource_type.rstrip("s").capitalize(), is05_resource, id_key)
+
         except KeyError:
             return False, "Subscription attribute was not found in IS-04 resource"
 
         return True, ""
 
     def activate_check_subscribed(self, resource_type, resource_list, nmos=True, multicast=True):
-        sub_ids = {}
-        for is05_resource in resource_list:
-            if self.is05_resources["transport_types"][is05_resource] != "urn:x-nmos:transport:rtp":
-                continue
+        rtp_resources = [is05_resource for is05_resource in resource_list
+                         if self.is05_resources["transport_types"][is05_resource] == "urn:x-nmos:transport:rtp"]
 
+        sub_ids = {}
+        for is05_resource in rtp_resources:
             if (resource_type == "receivers" and nmos) or \
                (resource_type == "senders" and nmos and not multicast):
-                sub_id = str(uuid.uuid4())
+                sub_ids[is05_resource] = str(uuid.uuid4())
             else:
-                sub_id = None
-            sub_ids[is05_resource] = sub_id
-            valid, response = self.is05_utils.subscribe_resource(resource_type, is05_resource, sub_id, multicast)
+                sub_ids[is05_resource] = None
+
+        activations = self.activation_sweep(
+            rtp_resources, lambda is05_resource: self.is05_utils.subscribe_resource(
+                resource_type, is05_resource, sub_ids[is05_resource], multicast))
+        for valid, response in activations.values():
             if not valid:
                 return False, response
 
-        time.sleep(CONFIG.API_PROCESSING_TIMEOUT)
-
         valid, result = self.refresh_is04_resources(resource_type)
         if not valid:
             return False, result
 
         try:
             api = self.apis[NODE_API_KEY]
-            for is05_resource in resource_list:
-                if self.is05_resources["transport_types"][is05_resource] != "urn:x-nmos:transport:rtp":
-                    continue
-
-                found_04_resource = False
-                for is04_resource in self.is04_resources[resource_type]:
-                    if is04_resource["id"] == is05_resource:
-                        found_04_resource = True
-                        subscription = is04_resource["subscription"]
-
-                        # Only IS-04 v1.2+ has an 'active' subscription key
-                        if self.is05_utils.compare_api_version(api["version"], "v1.2") >= 0:
-                            if subscription["active"] is not True:
-                                return False, "IS-04 {} {} was not marked as active when IS-05 master_enable set to" \
-                                              " true".format(resource_type.rstrip("s").capitalize(), is05_resource)
-
-                        id_key = "sender_id"
-                        if resource_type == "senders":
-                            id_key = "receiver_id"
-                        if subscription[id_key] != sub_ids[is05_resource]:
-                            return False, "IS-04 {} {} indicates subscription to '{}' rather than '{}'".format(
-                                          resource_type.rstrip("s").capitalize(), is05_resource, subscription[id_key],
-                                          sub_ids[is05_resource])
-
-                if not found_04_resource:
+            is04_index = self.index_is04_resources(resource_type)
+            for is05_resource in rtp_resources:
+                if is05_resource not in is04_index:
                     return False, "Unable to find an IS-04 resource with ID {}".format(is05_resource)
 
+                subscription = is04_index[is05_resource]["subscription"]
+
+                # Only IS-04 v1.2+ has an 'active' subscription key
+                if self.is05_utils.compare_api_version(api["version"], "v1.2") >= 0:
+                    if subscription["active"] is not True:
+                        return False, "IS-04 {} {} was not marked as active when IS-05 master_enable set to" \
+                                      " true".format(resource_type.rstrip("s").capitalize(), is05_resource)
+
+                id_key = "sender_id"
+                if resource_type == "senders":
+                    id_key = "receiver_id"
+                if subscription[id_key] != sub_ids[is05_resource]:
+                    return False, "IS-04 {} {} indicates subscription to '{}' rather than '{}'".format(
+                                  resource_type.rstrip("s").capitalize(), is05_resource, subscription[id_key],
+                                  sub_ids[is05_resource])
+
         except KeyError:
             return False, "Subscription attribute was not found in IS-04 resource"
 
@@ -981,14 +997,9 @@ class IS0502Test(GenericTest):
         flow_map = {flow["id"]: flow for flow in self.is04_resources["flows"]}
         source_map = {source["id"]: source for source in self.is04_resources["sources"]}
 
-        valid, resource = self.do_request("GET", self.node_url + "self")
+        valid, node_self = NodeResourceSnapshot.for_node(self.node_url).get("self")
         if not valid:
-            return test.FAIL("Node API did not respond as expected: {}".format(resource))
-
-        try:
-            node_self = resource.json()
-        except json.JSONDecodeError:
-            return test.FAIL("Non-JSON response returned from Node API")
+            return test.FAIL(node_self)
 
         clock_map = {clock["name"]: clock for clock in node_self["clocks"]}
         interface_map = {interface["name"]: interface for interface in node_self["interfaces"]}
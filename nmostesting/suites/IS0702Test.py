@@ -20,6 +20,8 @@ from enum import Enum, auto
 
 from .. import Config as CONFIG
 from ..GenericTest import GenericTest, NMOSTestException
+from .. import Instrumentation
+from ..Instrumentation import sleep
 from ..IS04Utils import IS04Utils
 from ..IS05Utils import IS05Utils
 from ..IS07Utils import IS07Utils
@@ -301,7 +303,7 @@ class IS0702Test(GenericTest):
                 with_health_opened = all([websockets_with_health[_].is_open() for _ in websockets_with_health])
                 if no_health_opened and with_health_opened:
                     break
-                time.sleep(0.2)
+                sleep(0.2, Instrumentation.WEBSOCKET)
 
             # After that short while, they must all be connected successfully
             for websockets in [websockets_no_health, websockets_with_health]:
@@ -320,7 +322,7 @@ class IS0702Test(GenericTest):
                         websocket = websockets[connection_uri]
                         if not websocket.is_open():
                             return test.FAIL("WebSocket connection to {} was closed too early".format(connection_uri))
-                time.sleep(1)
+                sleep(1, Instrumentation.WEBSOCKET)
 
             # send health commands to one set of WebSockets
             health_command = {}
@@ -334,7 +336,7 @@ class IS0702Test(GenericTest):
             while time.time() < start_time + WS_HEARTBEAT_INTERVAL * 2:
                 if all([len(websockets_with_health[_].messages) >= 1 for _ in websockets_with_health]):
                     break
-                time.sleep(0.2)
+                sleep(0.2, Instrumentation.WEBSOCKET)
 
             for connection_uri in websockets_with_health:
                 websocket = websockets_with_health[connection_uri]
@@ -391,7 +393,7 @@ class IS0702Test(GenericTest):
                     if not websocket.is_open():
                         return test.FAIL("WebSocket connection (no health cmd sent) to {} was closed too early"
                                          .format(connection_uri))
-                time.sleep(1)
+                sleep(1, Instrumentation.WEBSOCKET)
 
             # A short while after that timeout period, and certainly before another IS-07 heartbeat
             # interval has passed, all WebSocket connections which haven't been sent a health command
@@ -403,7 +405,7 @@ class IS0702Test(GenericTest):
                     if not websocket.is_open():
                         return test.FAIL("WebSocket connection (health cmd sent) to {} was closed too early"
                                          .format(connection_uri))
-                time.sleep(1)
+                sleep(1, Instrumentation.WEBSOCKET)
 
             # Now, all WebSocket connections which haven't been sent a health command must all be disconnected
             for connection_uri in websockets_no_health:
@@ -416,7 +418,7 @@ class IS0702Test(GenericTest):
             while time.time() < start_time + WS_TIMEOUT + WS_HEARTBEAT_INTERVAL * 2:
                 if all([not websockets_with_health[_].is_open() for _ in websockets_with_health]):
                     break
-                time.sleep(0.2)
+                sleep(0.2, Instrumentation.WEBSOCKET)
 
             # Now, they must all be disconnected
             for connection_uri in websockets_with_health:
@@ -448,7 +450,7 @@ class IS0702Test(GenericTest):
             while time.time() < start_time + CONFIG.WS_MESSAGE_TIMEOUT:
                 if all([target_websockets[_].is_open() for _ in target_websockets]):
                     break
-                time.sleep(0.2)
+                sleep(0.2, Instrumentation.WEBSOCKET)
 
             # After that short while, they must all be connected successfully
             for connection_uri in target_websockets:
@@ -481,7 +483,7 @@ class IS0702Test(GenericTest):
                             return test.FAIL("WebSocket {} message cannot be parsed, "
                                              "exception {}, original message: {}"
                                              .format(connection_uri, e, message))
-                time.sleep(1)
+                sleep(1, Instrumentation.WEBSOCKET)
 
             # Test run 1
             self.websocket_state_messages_test_run(
@@ -526,7 +528,7 @@ class IS0702Test(GenericTest):
                     break
                 if any([target_brokers[_].did_error_occur() for _ in target_brokers]):
                     break
-                time.sleep(0.2)
+                sleep(0.2, Instrumentation.MQTT)
 
             # After that short while, they must all be connected successfully
             for broker_params in target_brokers:
@@ -572,7 +574,7 @@ class IS0702Test(GenericTest):
                                              .format(sender.connection_status_topic, connection_status["active"]))
                 if all_connection_status_published and all_connection_status_active:
                     break
-                time.sleep(0.2)
+                sleep(0.2, Instrumentation.MQTT)
 
             # if connection_status_broker_topic is non-null connection status should be published
             if not all_connection_status_published:
@@ -626,7 +628,7 @@ class IS0702Test(GenericTest):
                                              .format(sender.topic, state["message_type"]))
                 if all_state_published:
                     break
-                time.sleep(0.2)
+                sleep(0.2, Instrumentation.MQTT)
 
             if not all_state_published:
                 return test.FAIL("Not all MQTT senders published a state message")
@@ -776,7 +778,7 @@ class IS0702Test(GenericTest):
         while time.time() < end_time:
             if all([len(target_websockets[_].messages) >= 2 for _ in target_websockets]):
                 break
-            time.sleep(0.2)
+            sleep(0.2, Instrumentation.WEBSOCKET)
 
         # Check all state messages
         for connection_uri in target_websockets:
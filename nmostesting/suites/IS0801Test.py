@@ -12,10 +12,10 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import time
 import copy
 
 from ..GenericTest import GenericTest, NMOSTestException
+from ..Instrumentation import sleep
 from ..TestHelper import compare_json
 from ..IS05Utils import IS05Utils, SCHEDULED_ABSOLUTE_ACTIVATION, SCHEDULED_RELATIVE_ACTIVATION
 from .is08.action import Action
@@ -116,10 +116,10 @@ class IS0801Test(GenericTest):
         try:
             activation.fireActivation()
         except NMOSTestException as e:
-            time.sleep(2)
+            sleep(2)
             raise e
 
-        time.sleep(1)
+        sleep(1)
 
         activation.delete()
 
@@ -423,7 +423,7 @@ class IS0801Test(GenericTest):
         try:
             activation.fireActivation()
         except NMOSTestException as e:
-            time.sleep(3)
+            sleep(3)
             raise e
 
         pendingState = active.buildJSONObject()
@@ -431,6 +431,6 @@ class IS0801Test(GenericTest):
             res = globalConfig.test.FAIL("Scheduled Activation completed immediately")
             raise NMOSTestException(res)
 
-        time.sleep(3)
+        sleep(3)
 
         active.assertActionsCompleted(activation.getActions())
@@ -13,15 +13,13 @@
 # limitations under the License.
 
 
-from requests.compat import json
-
 from ..GenericTest import GenericTest, NMOSTestException
 from .is08.testConfig import globalConfig
 from .is08.activation import Activation
 from .is08.active import Active
 from .is08.outputs import getOutputList
 from .is08.inputs import getInputList
-from ..NMOSUtils import NMOSUtils
+from ..NMOSUtils import NMOSUtils, NodeResourceSnapshot
 
 MAPPING_API_KEY = "channelmapping"
 NODE_API_KEY = "node"
@@ -139,16 +137,12 @@ class IS0802Test(GenericTest):
         if resource_type in self.is04_resources["_requested"]:
             return True, ""
 
-        valid, resources = self.do_request("GET", self.node_url + resource_type)
+        valid, resources = NodeResourceSnapshot.for_node(self.node_url).get(resource_type)
         if not valid:
-            return False, "Node API did not respond as expected: {}".format(resources)
+            return False, resources
 
-        try:
-            for resource in resources.json():
-                self.is04_resources[resource_type].append(resource)
-            self.is04_resources["_requested"].append(resource_type)
-        except json.JSONDecodeError:
-            return False, "Non-JSON response returned from Node API"
+        self.is04_resources[resource_type] = list(resources)
+        self.is04_resources["_requested"].append(resource_type)
 
         return True, ""
 
@@ -158,6 +152,7 @@ class IS0802Test(GenericTest):
             self.is04_resources["_requested"].remove(resource_type)
             self.is04_resources[resource_type] = []
 
+        NodeResourceSnapshot.for_node(self.node_url).invalidate(resource_type)
         return self.get_is04_resources(resource_type)
 
     # hm, see NMOSUtils.do_test_device_control
@@ -17,6 +17,7 @@ import socket
 from zeroconf import ServiceInfo, Zeroconf
 
 from .. import Config as CONFIG
+from ..Instrumentation import sleep
 from ..MdnsListener import MdnsListener
 from ..GenericTest import GenericTest
 from ..TestHelper import get_default_ip
@@ -135,7 +136,7 @@ class IS0902Test(GenericTest):
                 break
             if len(self.invalid_system.requests) > 0:
                 break
-            time.sleep(0.2)
+            sleep(0.2)
 
         # Clean up mDNS advertisements and disable System APIs
         if CONFIG.DNS_SD_MODE == "multicast":
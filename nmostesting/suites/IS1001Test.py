@@ -13,15 +13,13 @@
 # limitations under the License.
 
 import json
-import socket
 import requests
-from time import sleep
 from urllib.parse import parse_qs
 from cryptography import x509
 
 from ..GenericTest import GenericTest, NMOSTestException, NMOSInitException
 from .. import Config as CONFIG
-from zeroconf import ServiceBrowser, Zeroconf
+from zeroconf import Zeroconf
 from ..MdnsListener import MdnsListener
 from ..TestHelper import check_content_type
 
@@ -190,42 +188,32 @@ class IS1001Test(GenericTest):
         if CONFIG.DNS_SD_MODE != "multicast":
             return test.DISABLED("This test cannot be performed when DNS_SD_MODE is not 'multicast'")
 
-        ServiceBrowser(self.zc, service_type, self.zc_listener)
-        sleep(CONFIG.DNS_SD_BROWSE_TIMEOUT)
-        serv_list = self.zc_listener.get_service_list()
-        for service in serv_list:
-            port = service.port
-            if port != api["port"]:
-                continue
-            for address in service.addresses:
-                address = socket.inet_ntoa(address)
-                if address != api["ip"]:
-                    continue
-                properties = self.convert_bytes(service.properties)
-                if "pri" not in properties:
-                    return test.FAIL("No 'pri' TXT record found in {} advertisement.".format(api["name"]))
-                try:
-                    priority = int(properties["pri"])
-                    if priority < 0:
-                        return test.FAIL("Priority ('pri') TXT record must be greater than zero.")
-                    elif priority >= 100:
-                        return test.WARNING(
-                            "Priority ('pri') TXT record must be less than 100 for a production instance.")
-                except Exception:
-                    return test.FAIL("Priority ('pri') TXT record is not an integer.")
-
-                if "api_ver" not in properties:
-                    return test.FAIL("No 'api_ver' TXT record found in {} advertisement.".format(api["name"]))
-                elif api["version"] not in properties["api_ver"].split(","):
-                    return test.FAIL("Auth Server does not claim to support version under test.")
-                if "api_proto" not in properties:
-                    return test.FAIL("No 'api_proto' TXT record found in {} advertisement.".format(api["name"]))
-                elif properties["api_proto"] != "https":
-                    return test.FAIL("""
-                        API protocol ('api_proto') TXT record is {} and not 'https'
-                    """.format(properties["api_proto"]))
-
-                return test.WARNING("Authorization Server SHOULD NOT be advertised by mDNS based DNS-SD")
+        for service in self.zc_listener.browse(service_type, api["port"], api["ip"]):
+            properties = self.convert_bytes(service.properties)
+            if "pri" not in properties:
+                return test.FAIL("No 'pri' TXT record found in {} advertisement.".format(api["name"]))
+            try:
+                priority = int(properties["pri"])
+                if priority < 0:
+                    return test.FAIL("Priority ('pri') TXT record must be greater than zero.")
+                elif priority >= 100:
+                    return test.WARNING(
+                        "Priority ('pri') TXT record must be less than 100 for a production instance.")
+            except Exception:
+                return test.FAIL("Priority ('pri') TXT record is not an integer.")
+
+            if "api_ver" not in properties:
+                return test.FAIL("No 'api_ver' TXT record found in {} advertisement.".format(api["name"]))
+            elif api["version"] not in properties["api_ver"].split(","):
+                return test.FAIL("Auth Server does not claim to support version under test.")
+            if "api_proto" not in properties:
+                return test.FAIL("No 'api_proto' TXT record found in {} advertisement.".format(api["name"]))
+            elif properties["api_proto"] != "https":
+                return test.FAIL("""
+                    API protocol ('api_proto') TXT record is {} and not 'https'
+                """.format(properties["api_proto"]))
+
+            return test.WARNING("Authorization Server SHOULD NOT be advertised by mDNS based DNS-SD")
         return test.PASS()
 
     def test_01(self, test):
@@ -13,10 +13,10 @@
 # limitations under the License.
 
 from functools import partial
-import time
 import re
 
 from requests.compat import json
+from ..Instrumentation import sleep
 from ..NMOSUtils import NMOSUtils
 from ..GenericTest import GenericTest, NMOSInitException, NMOSTestException
 from .. import Config as CONFIG
@@ -207,7 +207,7 @@ class IS1101Test(GenericTest):
                             except KeyError as e:
                                 return test.FAIL("Unable to find expected key: {}".format(e))
                             if state == "awaiting_signal":
-                                time.sleep(CONFIG.STABLE_STATE_DELAY)
+                                sleep(CONFIG.STABLE_STATE_DELAY)
                             else:
                                 break
                         if state == "awaiting_signal":
@@ -632,7 +632,7 @@ class IS1101Test(GenericTest):
                             return test.FAIL("Unable to find expected key: {}".format(e))
 
                         if state in ["awaiting_essence", "no_essence"]:
-                            time.sleep(CONFIG.STABLE_STATE_DELAY)
+                            sleep(CONFIG.STABLE_STATE_DELAY)
                         else:
                             break
                 if state != "unconstrained":
@@ -997,7 +997,7 @@ class IS1101Test(GenericTest):
                         )
                     state = response.json()["state"]
                     if state in ["awaiting_essence", "no_essence"]:
-                        time.sleep(CONFIG.STABLE_STATE_DELAY)
+                        sleep(CONFIG.STABLE_STATE_DELAY)
                     else:
                         break
             if state != "unconstrained":
@@ -1063,7 +1063,7 @@ class IS1101Test(GenericTest):
                         )
                     state = response.json()["state"]
                     if state in ["awaiting_essence", "no_essence"]:
-                        time.sleep(CONFIG.STABLE_STATE_DELAY)
+                        sleep(CONFIG.STABLE_STATE_DELAY)
                     else:
                         break
             if state != "constrained":
@@ -1142,7 +1142,7 @@ class IS1101Test(GenericTest):
                         )
                     state = response.json()["state"]
                     if state in ["awaiting_essence", "no_essence"]:
-                        time.sleep(CONFIG.STABLE_STATE_DELAY)
+                        sleep(CONFIG.STABLE_STATE_DELAY)
                     else:
                         break
             if state != "unconstrained":
@@ -1197,7 +1197,7 @@ class IS1101Test(GenericTest):
                         )
                     state = response.json()["state"]
                     if state in ["awaiting_essence", "no_essence"]:
-                        time.sleep(CONFIG.STABLE_STATE_DELAY)
+                        sleep(CONFIG.STABLE_STATE_DELAY)
                     else:
                         break
             if state != "constrained":
@@ -1267,7 +1267,7 @@ class IS1101Test(GenericTest):
                         )
                     state = response.json()["state"]
                     if state in ["awaiting_essence", "no_essence"]:
-                        time.sleep(CONFIG.STABLE_STATE_DELAY)
+                        sleep(CONFIG.STABLE_STATE_DELAY)
                     else:
                         break
             if state != "unconstrained":
@@ -1420,7 +1420,7 @@ class IS1101Test(GenericTest):
                         )
                     state = response.json()["state"]
                     if state in ["awaiting_essence", "no_essence"]:
-                        time.sleep(CONFIG.STABLE_STATE_DELAY)
+                        sleep(CONFIG.STABLE_STATE_DELAY)
                     else:
                         break
             if state != "unconstrained":
@@ -1566,7 +1566,7 @@ class IS1101Test(GenericTest):
                     state = response.json()["state"]
 
                     if state in ["awaiting_essence", "no_essence"]:
-                        time.sleep(CONFIG.STABLE_STATE_DELAY)
+                        sleep(CONFIG.STABLE_STATE_DELAY)
                     else:
                         break
             if state != "unconstrained":
@@ -1766,7 +1766,7 @@ class IS1101Test(GenericTest):
                         )
                     state = response.json()["state"]
                     if state in ["awaiting_essence", "no_essence"]:
-                        time.sleep(CONFIG.STABLE_STATE_DELAY)
+                        sleep(CONFIG.STABLE_STATE_DELAY)
                     else:
                         break
             if state != "unconstrained":
@@ -2056,7 +2056,7 @@ class IS1101Test(GenericTest):
                             return test.FAIL("Unable to find expected key: {}".format(e))
 
                         if state in ["awaiting_essence", "no_essence"]:
-                            time.sleep(CONFIG.STABLE_STATE_DELAY)
+                            sleep(CONFIG.STABLE_STATE_DELAY)
                         else:
                             break
                 if state != "unconstrained":
@@ -2141,7 +2141,7 @@ class IS1101Test(GenericTest):
                     if not valid or response.status_code != 204:
                         return test.FAIL("Unexpected response from the Stream Compatibility Management API: {}"
                                          .format(response))
-                    time.sleep(CONFIG.STABLE_STATE_DELAY)
+                    sleep(CONFIG.STABLE_STATE_DELAY)
 
                     valid, response = self.do_request(
                         "GET", self.compat_url + "inputs/" + input_id + "/properties/"
@@ -2300,7 +2300,7 @@ class IS1101Test(GenericTest):
                     self.compat_url + "senders/" + sender_id + "/constraints/active/",
                     json=self.another_grain_rate_constraints[sender_id],
                 )
-                time.sleep(CONFIG.STABLE_STATE_DELAY)
+                sleep(CONFIG.STABLE_STATE_DELAY)
                 if not valid:
                     return test.FAIL(
                         "Unexpected response from the Node API: {}".format(response)
@@ -2386,7 +2386,7 @@ class IS1101Test(GenericTest):
                     if datetime.datetime.now() > time_start + datetime.timedelta(
                         seconds=15
                     ):
-                        time.sleep(CONFIG.HTTP_TIMEOUT)
+                        sleep(CONFIG.HTTP_TIMEOUT)
                     valid, response = self.do_request(
                         "GET", self.node_url + "senders/" + sender_id
                     )
@@ -2459,7 +2459,7 @@ class IS1101Test(GenericTest):
                             return test.FAIL("Unable to find expected key: {}".format(e))
 
                         if state in ["awaiting_essence", "no_essence"]:
-                            time.sleep(CONFIG.STABLE_STATE_DELAY)
+                            sleep(CONFIG.STABLE_STATE_DELAY)
                         else:
                             break
                 if state != "constrained":
@@ -2649,7 +2649,7 @@ class IS1101Test(GenericTest):
                     self.compat_url + "senders/" + sender_id + "/constraints/active/",
                     json=self.another_sample_rate_constraints[sender_id],
                 )
-                time.sleep(CONFIG.STABLE_STATE_DELAY)
+                sleep(CONFIG.STABLE_STATE_DELAY)
                 if not valid:
                     return test.FAIL(
                         "Unexpected response from the Node API: {}".format(response)
@@ -2734,7 +2734,7 @@ class IS1101Test(GenericTest):
                     if datetime.datetime.now() > time_start + datetime.timedelta(
                         seconds=15
                     ):
-                        time.sleep(CONFIG.HTTP_TIMEOUT)
+                        sleep(CONFIG.HTTP_TIMEOUT)
                     valid, response = self.do_request(
                         "GET", self.node_url + "senders/" + sender_id
                     )
@@ -2775,7 +2775,7 @@ class IS1101Test(GenericTest):
                         )
                     )
 
-                time.sleep(CONFIG.STABLE_STATE_DELAY)
+                sleep(CONFIG.STABLE_STATE_DELAY)
                 try:
                     state = response.json()["state"]
                 except json.JSONDecodeError:
@@ -2807,7 +2807,7 @@ class IS1101Test(GenericTest):
                             return test.FAIL("Unable to find expected key: {}".format(e))
 
                         if state in ["awaiting_essence", "no_essence"]:
-                            time.sleep(CONFIG.STABLE_STATE_DELAY)
+                            sleep(CONFIG.STABLE_STATE_DELAY)
                         else:
                             break
                 if state != "constrained":
@@ -2937,7 +2937,7 @@ class IS1101Test(GenericTest):
                     )
                 )
 
-            time.sleep(CONFIG.STABLE_STATE_DELAY)
+            sleep(CONFIG.STABLE_STATE_DELAY)
             try:
                 state = response.json()["state"]
             except json.JSONDecodeError:
@@ -2968,7 +2968,7 @@ class IS1101Test(GenericTest):
                         return test.FAIL("Unable to find expected key: {}".format(e))
 
                     if state in ["awaiting_essence", "no_essence"]:
-                        time.sleep(CONFIG.STABLE_STATE_DELAY)
+                        sleep(CONFIG.STABLE_STATE_DELAY)
                     else:
                         break
             if state != "unconstrained":
@@ -3230,7 +3230,7 @@ class IS1101Test(GenericTest):
                         return test.FAIL("Unable to find expected key: {}".format(e))
 
                     if state != "signal_present":
-                        time.sleep(CONFIG.STABLE_STATE_DELAY)
+                        sleep(CONFIG.STABLE_STATE_DELAY)
                     else:
                         break
             if state != "signal_present":
@@ -3364,7 +3364,7 @@ class IS1101Test(GenericTest):
                         return test.FAIL("Unable to find expected key: {}".format(e))
 
                     if state != "signal_present":
-                        time.sleep(CONFIG.STABLE_STATE_DELAY)
+                        sleep(CONFIG.STABLE_STATE_DELAY)
                     else:
                         break
             if state != "signal_present":
@@ -3815,5 +3815,5 @@ class IS1101Test(GenericTest):
         for i in range(0, CONFIG.STABLE_STATE_ATTEMPTS):
             if predicate():
                 return True
-            time.sleep(CONFIG.STABLE_STATE_DELAY)
+            sleep(CONFIG.STABLE_STATE_DELAY)
         return False
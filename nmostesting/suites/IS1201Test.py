@@ -16,6 +16,8 @@ import time
 
 from ..Config import WS_MESSAGE_TIMEOUT
 from ..GenericTest import NMOSTestException
+from .. import Instrumentation
+from ..Instrumentation import sleep
 from ..IS12Utils import IS12Utils, IS12Error
 from ..MS05Utils import NcMethodResult, NcMethodResultError, NcMethodStatus, NcObjectMethods, NcObjectEvents, \
     NcObjectProperties, StandardClassIds, NcPropertyChangeType
@@ -75,7 +77,7 @@ class IS1201Test(MS0501Test):
                 return test.FAIL("Node failed to keep WebSocket open",
                                  f"https://specs.amwa.tv/is-12/branches/{self.apis[CONTROL_API_KEY]['spec_branch']}"
                                  "/docs/Protocol_messaging.html#control-session")
-            time.sleep(0.2)
+            sleep(0.2, Instrumentation.WEBSOCKET)
 
         return test.PASS()
 
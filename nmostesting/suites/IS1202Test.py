@@ -0,0 +1,194 @@
+# Copyright (C) 2026 Advanced Media Workflow Association
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import time
+import uuid
+
+from .. import Config as CONFIG
+from ..GenericTest import GenericTest, NMOSTestException, test_depends
+from .. import Instrumentation
+from ..Instrumentation import sleep
+from ..IS12Utils import IS12Utils
+from ..MS05Utils import NcMethodStatus, NcObjectMethods, NcObjectProperties
+from ..PerformanceUtils import format_latencies, summarise_latencies
+from ..TestResult import Test
+
+CONTROL_API_KEY = "ncp"
+
+
+class IS1202Test(GenericTest):
+    """
+    Runs IS-12-02-Test
+    Measures how quickly, and how reliably, a Node emits PropertyChanged notifications
+    """
+    def __init__(self, apis, **kwargs):
+        GenericTest.__init__(self, apis, disable_auto=True, **kwargs)
+        self.is12_utils = IS12Utils(apis)
+        self.objects = []
+        self.user_labels = {}
+        # Unique to this test run so that the notifications for each change can be identified
+        self.label_prefix = "nmos-testing-{}-".format(uuid.uuid4().hex[:8])
+
+    def set_up_tests(self):
+        self.is12_utils.reset()
+        self.is12_utils.open_ncp_websocket()
+        self.objects = []
+        self.user_labels = {}
+
+    def tear_down_tests(self):
+        if self.objects:
+            # Restore the original user labels
+            try:
+                self.is12_utils.execute_commands(Test("Restore user labels"),
+                                                 [self.set_user_label_command(o.oid, self.user_labels[o.oid])
+                                                  for o in self.objects])
+            except NMOSTestException:
+                print(" * WARNING: Unable to restore user labels")
+        self.is12_utils.close_ncp_websocket()
+
+    def test_01(self, test):
+        """Node emits PropertyChanged notifications for user label changes made at a controlled rate"""
+
+        self.find_objects(test)
+        if not self.objects:
+            return test.UNCLEAR("Unable to find any objects whose user label can be changed")
+
+        return self.measure(test, CONFIG.IS12_NOTIFICATION_TEST_RATE)
+
+    @test_depends
+    def test_02(self, test):
+        """Node sustains PropertyChanged notifications for user label changes made as fast as possible"""
+
+        if not self.objects:
+            return test.UNCLEAR("Unable to find any objects whose user label can be changed")
+
+        return self.measure(test, None)
+
+    def set_user_label_command(self, oid, user_label):
+        return (oid, NcObjectMethods.GENERIC_SET.value,
+                {"id": NcObjectProperties.USER_LABEL.value.__dict__, "value": user_label})
+
+    def find_objects(self, test):
+        """Find up to IS12_NOTIFICATION_TEST_OBJECTS objects whose user labels can be changed, and subscribe to them"""
+        device_model = self.is12_utils.query_device_model(test)
+        candidates = [device_model] + device_model.find_members_by_class_id([1], include_derived=True, recurse=True,
+                                                                            get_objects=True)
+        candidates = candidates[:CONFIG.IS12_NOTIFICATION_TEST_OBJECTS]
+
+        method_results = self.is12_utils.get_property_values(
+            test, [(NcObjectProperties.USER_LABEL.value, {"oid": o.oid, "role_path": o.role_path})
+                   for o in candidates])
+        user_labels = {o.oid: r.value for o, r in zip(candidates, method_results) if r.status == NcMethodStatus.OK}
+
+        results = self.is12_utils.execute_commands(
+            test, [self.set_user_label_command(oid, self.label_prefix + "initial") for oid in user_labels])
+        settable = [oid for oid, result in zip(user_labels, results) if result.get("status") == NcMethodStatus.OK]
+
+        self.objects = [o for o in candidates if o.oid in settable]
+        self.user_labels = {oid: user_labels[oid] for oid in settable}
+        if self.objects:
+            self.is12_utils.update_subscriptions(test, [o.oid for o in self.objects])
+
+    def measure(self, test, rate):
+        """Make IS12_NOTIFICATION_TEST_COUNT user label changes across the objects, at the given number of changes per
+        second or as fast as possible, and correlate the resulting notifications with the changes"""
+        self.is12_utils.reset_notifications()
+
+        # user label -> (oid, index of change, time the change was sent)
+        changes = {}
+        pending_messages = []
+        start_time = time.time()
+        for index in range(CONFIG.IS12_NOTIFICATION_TEST_COUNT):
+            oid = self.objects[index % len(self.objects)].oid
+            user_label = self.label_prefix + str(index)
+            if rate:
+                delay = start_time + index / rate - time.time()
+                if delay > 0:
+                    sleep(delay)
+            elif len(pending_messages) >= CONFIG.IS12_MAX_MESSAGES_IN_FLIGHT:
+                # Limit the commands awaiting responses, since a Node may limit them
+                self.is12_utils.wait_for_command_responses(test, pending_messages[-CONFIG.IS12_MAX_MESSAGES_IN_FLIGHT])
+            changes[user_label] = (oid, index, time.time())
+            pending_messages.append(self.is12_utils.send_commands_nowait(
+                test, [self.set_user_label_command(oid, user_label)]))
+        sent_time = time.time()
+
+        results = [result for pending_message in pending_messages
+                   for result in self.is12_utils.wait_for_command_responses(test, pending_message)]
+        rejected = [label for label, result in zip(changes, results) if result.get("status") != NcMethodStatus.OK]
+        for user_label in rejected:
+            del changes[user_label]
+
+        # Wait for the notifications for every accepted change
+        deadline = time.time() + CONFIG.WS_MESSAGE_TIMEOUT
+        while True:
+            notified = self.correlate_notifications(changes)
+            if len(notified) == len(changes) or time.time() > deadline:
+                break
+            sleep(0.1, Instrumentation.WEBSOCKET)
+
+        latencies = [received_time - changes[label][2] for label, received_time in notified.items()]
+        lost = len(changes) - len(notified)
+        reordered = self.count_reordered(changes, notified)
+        last_received_time = max(notified.values()) if notified else sent_time
+        duration = last_received_time - start_time
+        notification_rate = len(notified) / duration if duration else 0
+
+        test.metrics = {
+            "changes": len(changes) + len(rejected),
+            "rejected": len(rejected),
+            "notifications": len(notified),
+            "lost": lost,
+            "reordered": reordered,
+            "changes_per_second": (len(changes) + len(rejected)) / (sent_time - start_time)
+            if sent_time > start_time else 0,
+            "notifications_per_second": notification_rate,
+            "latency": summarise_latencies(latencies)
+        }
+        detail = "{:.0f} notifications/s, {}, {} lost, {} reordered".format(
+            notification_rate, format_latencies(latencies), lost, reordered)
+
+        if rejected:
+            return test.FAIL("{} user label changes were rejected. {}".format(len(rejected), detail))
+        if lost:
+            return test.FAIL("No notification was received for {} user label changes. {}".format(lost, detail),
+                             "https://specs.amwa.tv/is-12/branches/{}/docs/Protocol_messaging.html"
+                             "#notification-message-type".format(self.apis[CONTROL_API_KEY]["spec_branch"]))
+        if reordered:
+            return test.WARNING("Notifications for {} user label changes were received out of order. {}"
+                                .format(reordered, detail))
+        return test.PASS(detail)
+
+    def correlate_notifications(self, changes):
+        """Returns the time the first notification was received for each change"""
+        notified = {}
+        for notification in self.is12_utils.get_notifications():
+            if notification.eventData.propertyId != NcObjectProperties.USER_LABEL.value:
+                continue
+            change = changes.get(notification.eventData.value)
+            if change and change[0] == notification.oid and notification.eventData.value not in notified:
+                notified[notification.eventData.value] = notification.received_time
+        return notified
+
+    def count_reordered(self, changes, notified):
+        """Count the notifications received after a notification for a later change to the same object"""
+        reordered = 0
+        latest_index = {}
+        # The notifications were correlated in the order they were received
+        for user_label in notified:
+            oid, index, _ = changes[user_label]
+            if index < latest_index.get(oid, -1):
+                reordered += 1
+            latest_index[oid] = max(index, latest_index.get(oid, -1))
+        return reordered
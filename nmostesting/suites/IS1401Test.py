@@ -129,6 +129,7 @@ class IS1401Test(MS0501Test):
 
     def tear_down_tests(self):
         super().tear_down_tests()
+        self.is14_utils.close()
 
     def reset_device_model(self):
         self.is14_utils.device_model = None
@@ -368,9 +368,10 @@ class MS0501Test(GenericTest):
     def _check_object_properties(self, test, reference_class_descriptor, oid, role_path):
         error_msg_base = f"role path={self.ms05_utils.create_role_path_string(role_path)}: "
         """Check properties of an object against reference NcClassDescriptor"""
-        for property_descriptor in reference_class_descriptor.properties:
-            method_result = self.ms05_utils.get_property(test, property_descriptor.id,
-                                                         oid=oid, role_path=role_path)
+        method_results = self.ms05_utils.get_property_values(
+            test, [(property_descriptor.id, {"oid": oid, "role_path": role_path})
+                   for property_descriptor in reference_class_descriptor.properties])
+        for property_descriptor, method_result in zip(reference_class_descriptor.properties, method_results):
             if isinstance(method_result, NcMethodResultError):
                 self.device_model_metadata.error = True
                 self.device_model_metadata.error_msg += f"{error_msg_base}" \
@@ -0,0 +1,58 @@
+#!/usr/bin/python
+
+# Copyright (C) 2026 Advanced Media Workflow Association
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+DEFAULT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+
+parser = argparse.ArgumentParser(description="Measure the start-up time of the NMOS Testing Tool")
+parser.add_argument("--root", default=DEFAULT_ROOT, help="directory containing nmos-test.py")
+parser.add_argument("--repeat", type=int, default=10, help="number of times to run the testing tool")
+parser.add_argument("--top", type=int, default=15, help="number of slowest modules to list")
+args = parser.parse_args()
+
+# Start-up to the point of listing the test suites, which requires no Device under Test
+command = [sys.executable, "nmos-test.py", "--list-suites"]
+durations = []
+for _ in range(args.repeat):
+    start_time = time.perf_counter()
+    subprocess.run(command, cwd=args.root, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=True)
+    durations.append(time.perf_counter() - start_time)
+
+print("'{}' over {} runs:".format(" ".join(command[1:]), args.repeat))
+print("  median {:.3f}s, min {:.3f}s, max {:.3f}s".format(statistics.median(durations), min(durations),
+                                                          max(durations)))
+
+# Lines of -X importtime output are "import time: <self us> | <cumulative us> | <indented module name>"
+process = subprocess.run([sys.executable, "-X", "importtime", "-c", "import nmostesting.NMOSTesting"],
+                         cwd=args.root, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, check=True)
+modules = []
+for line in process.stderr.decode("utf-8").splitlines():
+    fields = line.split("|")
+    if len(fields) != 3 or not fields[1].strip().isdigit():
+        continue
+    modules.append((int(fields[1]), int(fields[0].split(":")[1]), fields[2].strip()))
+
+total = max(modules)[0] if modules else 0
+print("'import nmostesting.NMOSTesting' took {:.3f}s, of which the slowest modules were:".format(total / 1e6))
+print("  {:>10} {:>10}  {}".format("cumulative", "self", "module"))
+for cumulative, self_time, module in sorted(modules, reverse=True)[:args.top]:
+    print("  {:>9.3f}s {:>9.3f}s  {}".format(cumulative / 1e6, self_time / 1e6, module))